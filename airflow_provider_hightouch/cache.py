@@ -0,0 +1,305 @@
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Mapping, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Thread-safe mapping whose entries expire after ``ttl`` seconds, evicting
+    the least recently used entry once it holds ``maxsize`` of them.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is not _MISSING and entry[1] > time.monotonic():
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if entry is not _MISSING:
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SlugStore:
+    """Persistent backing store for resolved sync slugs."""
+
+    def get(self, key: str) -> Optional[str]:
+        raise NotImplementedError
+
+    def set_many(self, mapping: Dict[str, str], ttl: float) -> None:
+        raise NotImplementedError
+
+
+class FileSlugStore(SlugStore):
+    """
+    Stores resolved slugs in a JSON file that every process on a host can share.
+
+    Args:
+        path (str): The file to keep slug mappings in
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def _locked(self, f, exclusive: bool):
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+
+    def _read(self, f) -> Dict[str, Any]:
+        f.seek(0)
+        try:
+            return json.loads(f.read() or "{}")
+        except ValueError:
+            return {}
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            with open(self.path) as f:
+                self._locked(f, exclusive=False)
+                entry = self._read(f).get(key)
+        except FileNotFoundError:
+            return None
+        if entry and entry["expires_at"] > time.time():
+            return entry["id"]
+        return None
+
+    def set_many(self, mapping: Dict[str, str], ttl: float) -> None:
+        expires_at = time.time() + ttl
+        with open(self.path, "a+") as f:
+            self._locked(f, exclusive=True)
+            now = time.time()
+            data = {k: v for k, v in self._read(f).items() if v["expires_at"] > now}
+            data.update({k: {"id": v, "expires_at": expires_at} for k, v in mapping.items()})
+            f.seek(0)
+            f.truncate()
+            f.write(json.dumps(data))
+
+
+class VariableSlugStore(SlugStore):
+    """
+    Stores resolved slugs as Airflow Variables so every worker can share them.
+
+    Args:
+        prefix (str): Prefix of the Variable keys
+    """
+
+    def __init__(self, prefix: str = "hightouch_slug"):
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[str]:
+        from airflow.models import Variable
+
+        entry = Variable.get(
+            f"{self.prefix}__{key}", default_var=None, deserialize_json=True
+        )
+        if entry and entry["expires_at"] > time.time():
+            return entry["id"]
+        return None
+
+    def set_many(self, mapping: Dict[str, str], ttl: float) -> None:
+        from airflow.models import Variable
+
+        expires_at = time.time() + ttl
+        for key, sync_id in mapping.items():
+            Variable.set(
+                f"{self.prefix}__{key}",
+                {"id": sync_id, "expires_at": expires_at},
+                serialize_json=True,
+            )
+
+
+class SlugCache:
+    """
+    Cache of sync slug to sync ID mappings, keyed by Airflow connection.
+
+    Lookups are served from memory and fall back to ``store`` when one is
+    configured, so other tasks and processes can reuse resolved slugs.
+
+    Args:
+        ttl (float): Seconds a resolved slug is trusted
+        maxsize (int): Maximum number of slugs kept in memory
+        store (SlugStore): Optional persistent store shared with other processes
+    """
+
+    def __init__(
+        self, ttl: float = 3600, maxsize: int = 1024, store: Optional[SlugStore] = None
+    ):
+        self.ttl = ttl
+        self.store = store
+        self._memory = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    @staticmethod
+    def _key(conn_id: str, slug: str) -> str:
+        return f"{conn_id}:{slug}"
+
+    def get(self, conn_id: str, slug: str) -> Optional[str]:
+        key = self._key(conn_id, slug)
+        sync_id = self._memory.get(key)
+        if sync_id is None and self.store is not None:
+            sync_id = self.store.get(key)
+            if sync_id is not None:
+                self._memory.set(key, sync_id)
+        return sync_id
+
+    def set_many(self, conn_id: str, mapping: Dict[str, str]) -> None:
+        keyed = {self._key(conn_id, slug): sync_id for slug, sync_id in mapping.items()}
+        for key, sync_id in keyed.items():
+            self._memory.set(key, sync_id)
+        if self.store is not None and keyed:
+            self.store.set_many(keyed, self.ttl)
+
+    def set(self, conn_id: str, slug: str, sync_id: str) -> None:
+        self.set_many(conn_id, {slug: sync_id})
+
+    def clear(self) -> None:
+        self._memory.clear()
+
+
+# Read-only configuration endpoints: syncs, models, destinations and sources, listed
+# or by ID. Run endpoints such as ``syncs/{id}/runs`` never match.
+_CACHEABLE_ENDPOINT = re.compile(r"^(syncs|models|destinations|sources)(/(?!trigger$)[^/]+)?$")
+
+
+def is_cacheable_endpoint(method: str, endpoint: str) -> bool:
+    """Whether responses of this request may be served from a ``ResponseCache``."""
+    return method == "GET" and bool(_CACHEABLE_ENDPOINT.match(endpoint))
+
+
+class ResponseCache:
+    """
+    Cache of API responses to read-only requests, shared by the hooks that use it.
+
+    A response is served from memory for ``ttl`` seconds. After that it is kept
+    until evicted and revalidated with ``If-None-Match`` or ``If-Modified-Since``
+    when the API sent an ``ETag`` or ``Last-Modified`` header, so an unchanged
+    resource costs a bodiless 304 response instead of a full one. The least
+    recently used entry is evicted once ``maxsize`` are held.
+
+    ``hits`` counts responses served without a request, ``revalidations`` those
+    served after a 304 and ``misses`` those fetched in full. ``bytes_saved``
+    adds up the size of the bodies that did not have to be downloaded.
+
+    Args:
+        maxsize (int): Maximum number of responses kept
+        ttl (float): Seconds a response is served without asking the API
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.bytes_saved = 0
+        self._data: "OrderedDict[Hashable, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, key: Hashable) -> Tuple[bool, Any, Dict[str, str]]:
+        """
+        Returns whether the cached body is still fresh, the body (None when nothing
+        is cached) and the headers that make a request for it conditional.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return False, None, {}
+            self._data.move_to_end(key)
+            if entry["fresh_until"] > time.monotonic():
+                self.hits += 1
+                self.bytes_saved += entry["size"]
+                return True, entry["body"], {}
+            headers = {}
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+            return False, entry["body"], headers
+
+    def set(self, key: Hashable, body: Any, headers: Mapping[str, str], size: int = 0) -> None:
+        """Stores a response fetched in full, unless the API asked not to."""
+        with self._lock:
+            self.misses += 1
+            if "no-store" in headers.get("Cache-Control", ""):
+                self._data.pop(key, None)
+                return
+            self._data[key] = {
+                "body": body,
+                "etag": headers.get("ETag"),
+                "last_modified": headers.get("Last-Modified"),
+                "size": size,
+                "fresh_until": time.monotonic() + self.ttl,
+            }
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def revalidated(self, key: Hashable) -> None:
+        """Marks the cached response as fresh again after a 304 response."""
+        with self._lock:
+            self.revalidations += 1
+            entry = self._data.get(key)
+            if entry is not None:
+                entry["fresh_until"] = time.monotonic() + self.ttl
+                self.bytes_saved += entry["size"]
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "bytes_saved": self.bytes_saved,
+            "size": len(self._data),
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+# Shared by every hook in the process unless a hook is given its own cache.
+default_slug_cache = SlugCache()
+
+# Recent run history of syncs, keyed by connection and sync ID.
+default_run_history_cache = TTLCache(maxsize=256, ttl=600)
+
+# Responses to read-only requests, shared by every hook that caches responses.
+default_response_cache = ResponseCache()
@@ -0,0 +1,230 @@
+import json
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+from airflow.utils.log.logging_mixin import LoggingMixin
+
+from airflow_provider_hightouch.consts import PENDING_STATUSES
+
+if TYPE_CHECKING:
+    from airflow_provider_hightouch.hooks.hightouch import HightouchHook
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+
+class SyncRunCoalescer(LoggingMixin):
+    """
+    Lets concurrent triggers of the same sync share one run.
+
+    The last run started through the coalescer is remembered per sync. A caller
+    asking for a new run of the sync gets that run instead if it was started less
+    than ``window`` seconds ago or is still pending. Only one caller per sync
+    decides at a time, so near-simultaneous triggers cannot both start a run.
+
+    The callers attached to a run are tracked until they :py:meth:`detach`, so
+    the caller that started it can leave it running while others still wait on it.
+
+    Within a process, use :py:func:`get_sync_run_coalescer` to share one
+    instance. Every worker and triggerer shares runs through ``variable_prefix``:
+    the runs of each sync are kept in the ``<variable_prefix>__<sync_id>`` Airflow
+    Variable, whose row is locked in the metadata database while a caller decides.
+    SQLite has no row locks, so use it with a single scheduler process there.
+    Workers on the same host can instead share runs through ``path``, a file that
+    is locked while a caller decides. Without either, runs are only shared within
+    the process.
+
+    Args:
+        path (str): Optional file shared with other processes on the host
+        variable_prefix (str): Optional prefix of the Airflow Variables shared
+            through the metadata database
+    """
+
+    def __init__(self, path: Optional[str] = None, variable_prefix: Optional[str] = None):
+        super().__init__()
+        if path and variable_prefix:
+            raise ValueError("Runs are shared through either a file or Variables, not both")
+        if path and fcntl is None:
+            raise RuntimeError("Sharing runs through a file requires fcntl")
+        self.path = path
+        self.variable_prefix = variable_prefix
+        self._runs: Dict[str, List] = {}
+        self._sync_locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _locked_runs(self, sync_id: str) -> Iterator[Dict[str, List]]:
+        """Holds the lock of the sync and yields the runs, saving changes on exit."""
+        with self._lock:
+            sync_lock = self._sync_locks[sync_id]
+        with sync_lock:
+            if self.variable_prefix:
+                with self._locked_variable(sync_id) as runs:
+                    yield runs
+                return
+            if not self.path:
+                yield self._runs
+                return
+            with open(self.path, "a+") as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    f.seek(0)
+                    try:
+                        runs = json.loads(f.read())
+                    except ValueError:
+                        runs = {}
+                    yield runs
+                    f.seek(0)
+                    f.truncate()
+                    f.write(json.dumps(runs))
+                    f.flush()
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    @contextmanager
+    def _locked_variable(self, sync_id: str) -> Iterator[Dict[str, List]]:
+        from airflow.models import Variable
+        from airflow.utils.session import create_session
+        from airflow.utils.sqlalchemy import with_row_locks
+        from sqlalchemy.exc import IntegrityError
+
+        key = f"{self.variable_prefix}__{sync_id}"
+        try:
+            # Created in its own transaction, so a run is never started in one that
+            # then fails because another caller created the Variable first.
+            with create_session() as session:
+                query = session.query(Variable.id).filter(Variable.key == key)
+                if query.one_or_none() is None:
+                    session.add(Variable(key=key, val="{}"))
+        except IntegrityError:
+            pass
+        with create_session() as session:
+            query = session.query(Variable).filter(Variable.key == key)
+            variable = with_row_locks(query, session=session).one()
+            try:
+                runs = json.loads(variable.val)
+            except (TypeError, ValueError):
+                runs = {}
+            yield runs
+            variable.val = json.dumps(runs)
+
+    def _shared_run(
+        self,
+        hook: "HightouchHook",
+        runs: Dict[str, List],
+        sync_id: str,
+        window: float,
+        holder: Optional[str],
+    ) -> Optional[str]:
+        previous = runs.get(sync_id)
+        if previous is None:
+            return None
+        run_id, started_at, attached = previous
+        if time.time() - started_at < window:
+            self.log.info(
+                "Sync %s was triggered %.0f seconds ago, attaching to run %s.",
+                sync_id,
+                time.time() - started_at,
+                run_id,
+            )
+            return self._attach(attached, run_id, holder)
+        status = hook.get_sync_run_details(sync_id, run_id)[0].get("status")
+        if status in PENDING_STATUSES:
+            self.log.info("Run %s of sync %s is %s, attaching to it.", run_id, sync_id, status)
+            return self._attach(attached, run_id, holder)
+        return None
+
+    def attach(
+        self,
+        hook: "HightouchHook",
+        sync_id: str,
+        window: float = 60,
+        holder: Optional[str] = None,
+    ) -> Optional[str]:
+        """Attach to a recent or pending run of the sync, if there is one.
+
+        Lets callers that need to prepare before starting a run, e.g. by waiting for
+        a concurrency slot, skip that when the run can be shared. Takes the same
+        arguments as :py:meth:`start_or_attach`.
+
+        Returns:
+            Optional[str]: The sync run ID, or None when a new run should be started
+        """
+        sync_id = str(sync_id)
+        with self._locked_runs(sync_id) as runs:
+            return self._shared_run(hook, runs, sync_id, window, holder)
+
+    def start_or_attach(
+        self,
+        hook: "HightouchHook",
+        sync_id: str,
+        window: float = 60,
+        holder: Optional[str] = None,
+    ) -> Tuple[str, bool]:
+        """Start a run of the sync, unless a recent or pending one can be shared.
+
+        Args:
+            hook (HightouchHook): Hook to start the run and check its status with
+            sync_id (str): The Hightouch Sync ID
+            window (float): Seconds after its start during which a run is shared
+                without checking its status
+            holder (str): Identifies the caller, e.g. its task instance, which is
+                recorded as attached when it shares the run of another caller
+        Returns:
+            Tuple[str, bool]: The sync run ID, and whether it was started by
+            another caller
+        """
+        sync_id = str(sync_id)
+        with self._locked_runs(sync_id) as runs:
+            run_id = self._shared_run(hook, runs, sync_id, window, holder)
+            if run_id is not None:
+                return run_id, True
+            run_id = hook.start_sync(sync_id)
+            runs[sync_id] = [run_id, time.time(), []]
+            return run_id, False
+
+    @staticmethod
+    def _attach(attached: List[str], run_id: str, holder: Optional[str]) -> str:
+        if holder is not None and holder not in attached:
+            attached.append(holder)
+        return run_id
+
+    def attached(self, sync_id: str, run_id: str) -> Optional[List[str]]:
+        """The callers attached to the run, or None when the run is not known here,
+        e.g. because it was started from another process that shares no state with
+        this one."""
+        sync_id = str(sync_id)
+        with self._locked_runs(sync_id) as runs:
+            entry = runs.get(sync_id)
+            if entry is None or str(entry[0]) != str(run_id):
+                return None
+            return list(entry[2])
+
+    def detach(self, sync_id: str, run_id: str, holder: str) -> None:
+        """Records that ``holder`` no longer waits on the run."""
+        sync_id = str(sync_id)
+        with self._locked_runs(sync_id) as runs:
+            entry = runs.get(sync_id)
+            if entry is not None and str(entry[0]) == str(run_id) and holder in entry[2]:
+                entry[2].remove(holder)
+
+
+_coalescers: Dict[Tuple[Optional[str], Optional[str]], SyncRunCoalescer] = {}
+_coalescers_lock = threading.Lock()
+
+
+def get_sync_run_coalescer(
+    path: Optional[str] = None, variable_prefix: Optional[str] = None
+) -> SyncRunCoalescer:
+    """Returns the process-wide coalescer for ``path`` or ``variable_prefix``,
+    creating it on first use."""
+    key = (path, variable_prefix)
+    with _coalescers_lock:
+        if key not in _coalescers:
+            _coalescers[key] = SyncRunCoalescer(path=path, variable_prefix=variable_prefix)
+        return _coalescers[key]
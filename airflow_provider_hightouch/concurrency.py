@@ -0,0 +1,341 @@
+import datetime
+import json
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from airflow.exceptions import AirflowException
+from airflow.utils.log.logging_mixin import LoggingMixin
+
+from airflow_provider_hightouch import metrics
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+
+def _prune(slot: Dict[str, Any], now: float, stale_after: float) -> None:
+    slot["holders"] = {h: exp for h, exp in slot["holders"].items() if exp > now}
+    slot["waiters"] = {
+        h: waiter for h, waiter in slot["waiters"].items() if now - waiter[2] < stale_after
+    }
+
+
+def _update_slots(
+    state: Dict[str, Any],
+    holder: str,
+    limits: Dict[str, int],
+    priority: int,
+    now: float,
+    lease: float,
+    stale_after: float,
+) -> bool:
+    """
+    Queues ``holder`` for a slot of every key in ``limits`` and grants them all
+    at once if it is among the first waiters of each key that still have room.
+    Waiters are ordered by descending priority, then by the time they queued.
+    """
+    granted = True
+    for key, limit in limits.items():
+        slot = state.setdefault(key, {"holders": {}, "waiters": {}})
+        _prune(slot, now, stale_after)
+        if holder in slot["holders"]:
+            continue
+        enqueued_at = slot["waiters"].get(holder, [priority, now, now])[1]
+        slot["waiters"][holder] = [priority, enqueued_at, now]
+        waiters = slot["waiters"]
+        queue = sorted(waiters, key=lambda h: (-waiters[h][0], waiters[h][1], h))
+        free = max(limit - len(slot["holders"]), 0)
+        if holder not in queue[:free]:
+            granted = False
+    if granted:
+        for key in limits:
+            state[key]["waiters"].pop(holder, None)
+            state[key]["holders"][holder] = now + lease
+    return granted
+
+
+def _release_slots(state: Dict[str, Any], holder: str) -> None:
+    for key in list(state):
+        state[key]["holders"].pop(holder, None)
+        state[key]["waiters"].pop(holder, None)
+        if not state[key]["holders"] and not state[key]["waiters"]:
+            del state[key]
+
+
+class SlotStore:
+    """
+    Tracks who holds and who waits for the run slots of each destination and model.
+
+    Holders keep their slots for ``lease`` seconds at most, so a task that dies
+    without releasing them does not block others forever. Waiters that stop
+    asking for ``stale_after`` seconds leave the queue.
+    """
+
+    def try_acquire(
+        self,
+        holder: str,
+        limits: Dict[str, int],
+        priority: int = 0,
+        lease: float = 6 * 3600,
+        stale_after: float = 60,
+    ) -> bool:
+        """Takes a slot of every key in ``limits`` for ``holder`` if all are free."""
+        raise NotImplementedError
+
+    def release(self, holder: str) -> None:
+        """Gives back every slot held by ``holder`` and leaves the queues."""
+        raise NotImplementedError
+
+    def holders(self, key: str) -> int:
+        """Number of slots of ``key`` currently held."""
+        raise NotImplementedError
+
+
+class LocalSlotStore(SlotStore):
+    """
+    Slots shared by the threads of one process.
+
+    Every task instance runs in its own process, so this only limits runs started
+    from the same process, e.g. in tests. Use :py:class:`VariableSlotStore` to limit
+    runs across tasks.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._state: Dict[str, Any] = {}
+
+    def try_acquire(self, holder, limits, priority=0, lease=6 * 3600, stale_after=60):
+        with self._lock:
+            return _update_slots(
+                self._state, holder, limits, priority, time.time(), lease, stale_after
+            )
+
+    def release(self, holder: str) -> None:
+        with self._lock:
+            _release_slots(self._state, holder)
+
+    def holders(self, key: str) -> int:
+        with self._lock:
+            slot = self._state.get(key)
+            if slot is None:
+                return 0
+            return sum(1 for exp in slot["holders"].values() if exp > time.time())
+
+
+class FileSlotStore(SlotStore):
+    """
+    Slots shared by every process on a host through a locked state file.
+
+    Tasks on other hosts do not see these slots, and a deferred task may resume
+    on another host than the one that took its slot, which then stays held until
+    its lease expires. Only use it when every worker and triggerer share one host.
+
+    Args:
+        path (str): File holding the slots. Processes using the same path share them.
+    """
+
+    def __init__(self, path: str):
+        if fcntl is None:
+            raise RuntimeError("FileSlotStore requires fcntl")
+        self.path = path
+
+    def _transaction(self, update):
+        with open(self.path, "a+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    state = json.loads(f.read())
+                except ValueError:
+                    state = {}
+                result = update(state)
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state))
+                f.flush()
+                return result
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def try_acquire(self, holder, limits, priority=0, lease=6 * 3600, stale_after=60):
+        return self._transaction(
+            lambda state: _update_slots(
+                state, holder, limits, priority, time.time(), lease, stale_after
+            )
+        )
+
+    def release(self, holder: str) -> None:
+        self._transaction(lambda state: _release_slots(state, holder))
+
+    def holders(self, key: str) -> int:
+        def count(state):
+            slot = state.get(key)
+            if slot is None:
+                return 0
+            return sum(1 for exp in slot["holders"].values() if exp > time.time())
+
+        return self._transaction(count)
+
+
+class VariableSlotStore(SlotStore):
+    """
+    Slots shared by every worker and triggerer through one Airflow Variable.
+
+    Each update locks the row of the Variable in the metadata database, so tasks on
+    different hosts take turns. SQLite has no row locks, so use it with a single
+    scheduler process there.
+
+    Args:
+        key (str): Key of the Variable holding the slots
+    """
+
+    def __init__(self, key: str = "hightouch_slots"):
+        self.key = key
+
+    def _locked_update(self, update):
+        from airflow.models import Variable
+        from airflow.utils.session import create_session
+        from airflow.utils.sqlalchemy import with_row_locks
+
+        with create_session() as session:
+            query = session.query(Variable).filter(Variable.key == self.key)
+            variable = with_row_locks(query, session=session).one_or_none()
+            if variable is None:
+                variable = Variable(key=self.key, val="{}")
+                session.add(variable)
+            try:
+                state = json.loads(variable.val)
+            except (TypeError, ValueError):
+                state = {}
+            result = update(state)
+            variable.val = json.dumps(state)
+            return result
+
+    def _transaction(self, update):
+        from sqlalchemy.exc import IntegrityError
+
+        try:
+            return self._locked_update(update)
+        except IntegrityError:
+            # Another task created the Variable first, lock the row it created.
+            return self._locked_update(update)
+
+    def try_acquire(self, holder, limits, priority=0, lease=6 * 3600, stale_after=60):
+        return self._transaction(
+            lambda state: _update_slots(
+                state, holder, limits, priority, time.time(), lease, stale_after
+            )
+        )
+
+    def release(self, holder: str) -> None:
+        self._transaction(lambda state: _release_slots(state, holder))
+
+    def holders(self, key: str) -> int:
+        def count(state):
+            slot = state.get(key)
+            if slot is None:
+                return 0
+            return sum(1 for exp in slot["holders"].values() if exp > time.time())
+
+        return self._transaction(count)
+
+
+class SyncConcurrencyLimiter(LoggingMixin):
+    """
+    Caps the runs in flight per destination and per model across every task that
+    uses the same store.
+
+    The destination and model of a sync are read from its details. A run waits
+    until a slot of both is free; when several runs wait for the same slot, the
+    one with the highest priority goes first, then the one that queued first.
+
+    Args:
+        max_runs_per_destination (int): Runs in flight at once per destination,
+            unlimited when None
+        max_runs_per_model (int): Runs in flight at once per model, unlimited when None
+        store (SlotStore): Where slots are tracked. Defaults to a
+            :py:class:`VariableSlotStore`, shared by every task of the deployment.
+        poll_interval (float): Seconds between attempts to take a slot
+        lease (float): Seconds after which a slot that was never released is freed,
+            e.g. when its worker died. Keep it above the longest expected run.
+    """
+
+    def __init__(
+        self,
+        max_runs_per_destination: Optional[int] = None,
+        max_runs_per_model: Optional[int] = None,
+        store: Optional[SlotStore] = None,
+        poll_interval: float = 5,
+        lease: float = 6 * 3600,
+    ):
+        super().__init__()
+        self.max_runs_per_destination = max_runs_per_destination
+        self.max_runs_per_model = max_runs_per_model
+        self.store = store if store is not None else VariableSlotStore()
+        self.poll_interval = poll_interval
+        self.lease = lease
+
+    def limits_for(self, sync_details: Dict[str, Any]) -> Dict[str, int]:
+        """The slot keys a run of the sync needs, with their limits."""
+        limits = {}
+        destination_id = sync_details.get("destinationId")
+        if self.max_runs_per_destination and destination_id is not None:
+            limits[f"destination:{destination_id}"] = self.max_runs_per_destination
+        model_id = sync_details.get("modelId")
+        if self.max_runs_per_model and model_id is not None:
+            limits[f"model:{model_id}"] = self.max_runs_per_model
+        return limits
+
+    def _try_acquire(self, holder: str, limits: Dict[str, int], priority: int) -> bool:
+        return self.store.try_acquire(
+            holder,
+            limits,
+            priority=priority,
+            lease=self.lease,
+            stale_after=max(self.poll_interval * 4, 60),
+        )
+
+    def _check_timeout(
+        self, holder: str, limits: Dict[str, int], started_at: float, timeout
+    ) -> None:
+        if timeout is not None and time.monotonic() - started_at > timeout:
+            # Leaves the queues, so the slots go to the next waiters.
+            self.store.release(holder)
+            raise AirflowException(
+                f"Timed out after {timeout} seconds waiting for a free slot of {sorted(limits)}"
+            )
+
+    def acquire(
+        self,
+        holder: str,
+        sync_details: Dict[str, Any],
+        priority: int = 0,
+        timeout: Optional[float] = None,
+    ) -> float:
+        """Blocks until ``holder`` has a slot for the sync. Returns the time spent waiting.
+
+        Args:
+            holder (str): Identifies the run, e.g. the task instance starting it
+            sync_details (Dict[str, Any]): Details of the sync, as returned by
+                ``get_sync_details``
+            priority (int): Waiters with a higher priority get slots first
+            timeout (float): Maximum seconds to wait, forever when None
+        """
+        limits = self.limits_for(sync_details)
+        started_at = time.monotonic()
+        waiting = False
+        while limits and not self._try_acquire(holder, limits, priority):
+            if not waiting:
+                self.log.info("Waiting for a free slot of %s.", ", ".join(sorted(limits)))
+                waiting = True
+            self._check_timeout(holder, limits, started_at, timeout)
+            time.sleep(self.poll_interval)
+        waited = time.monotonic() - started_at
+        metrics.timing("concurrency.wait", datetime.timedelta(seconds=waited))
+        return waited
+
+    def release(self, holder: str) -> None:
+        """Frees the slots held by ``holder``."""
+        self.store.release(holder)
@@ -27,3 +27,24 @@ HIGHTOUCH_API_BASE_V2 = "api/v2/rest/"
 HIGHTOUCH_API_BASE_V1 = "api/v2/rest/"
 
 DEFAULT_POLL_INTERVAL = 3
+DEFAULT_PAGE_SIZE = 100
+
+# Failure policies for operators that run several syncs at once.
+FAIL_FAST = "fail_fast"
+COLLECT_ALL = "collect_all"
+FAILURE_POLICIES = [FAIL_FAST, COLLECT_ALL]
+# Result status of a sync skipped because a sync it depends on did not succeed.
+UPSTREAM_FAILED = "upstream_failed"
+
+# Operator timeout derived from the run history of the sync.
+AUTO_TIMEOUT = "auto"
+DEFAULT_TIMEOUT = 3600
+DEFAULT_RUN_HISTORY_SIZE = 20
+
+# What HightouchTriggerSyncOperator returns, and so pushes to XCom.
+OUTPUT_ID = "id"
+OUTPUT_METRICS = "metrics"
+OUTPUT_FULL = "full"
+OUTPUT_MODES = [OUTPUT_ID, OUTPUT_METRICS, OUTPUT_FULL]
+
+CANCEL_SYNC_RUN_ENDPOINT = "syncs/{sync_id}/cancel"
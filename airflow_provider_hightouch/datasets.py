@@ -0,0 +1,57 @@
+from typing import Any, Dict, Optional
+
+from airflow.exceptions import AirflowException
+
+from airflow_provider_hightouch.types import SyncRunParsedOutput
+from airflow_provider_hightouch.utils import generate_metadata_from_parsed_run
+
+SYNC_DATASET_PREFIX = "hightouch://sync/"
+
+
+def sync_dataset_uri(sync_id: Optional[str] = None, sync_slug: Optional[str] = None) -> str:
+    """The URI of the dataset updated by the runs of a sync, ``hightouch://sync/<id>``.
+
+    Syncs referenced by slug get ``hightouch://sync/slug/<slug>``.
+    """
+    if sync_id:
+        return f"{SYNC_DATASET_PREFIX}{sync_id}"
+    return f"{SYNC_DATASET_PREFIX}slug/{sync_slug}"
+
+
+def sync_dataset(sync_id: Optional[str] = None, sync_slug: Optional[str] = None):
+    """
+    The Airflow Dataset updated by the runs of a sync, or None when the sync is
+    templated and therefore unknown until the task runs.
+    """
+    reference = sync_id or sync_slug
+    if reference is None or "{{" in str(reference):
+        return None
+    try:
+        from airflow.datasets import Dataset
+    except ImportError:
+        raise AirflowException("Emitting datasets requires Airflow >= 2.4")
+    return Dataset(sync_dataset_uri(sync_id, sync_slug))
+
+
+def sync_dataset_extra(
+    sync_id: str, sync_run_id: str, run: SyncRunParsedOutput
+) -> Dict[str, Any]:
+    """The extra of the dataset event of a sync run: its IDs, status and row counts."""
+    return {
+        "sync_id": str(sync_id),
+        "sync_run_id": str(sync_run_id),
+        "status": run.status,
+        **generate_metadata_from_parsed_run(run),
+    }
+
+
+def set_dataset_extra(context, dataset, extra: Dict[str, Any]) -> bool:
+    """
+    Attaches ``extra`` to the event the task emits for ``dataset`` when it succeeds.
+    Returns False on Airflow versions before 2.10, where events carry no extra.
+    """
+    outlet_events = context.get("outlet_events") if context else None
+    if outlet_events is None:
+        return False
+    outlet_events[dataset].extra = extra
+    return True
@@ -0,0 +1,25 @@
+from datetime import datetime, timedelta
+
+from airflow import DAG
+
+from airflow_provider_hightouch.operators.hightouch import HightouchTriggerSyncOperator
+
+args = {"owner": "airflow"}
+
+with DAG(
+    dag_id="example_hightouch_mapped_syncs",
+    default_args=args,
+    schedule_interval="@daily",
+    start_date=datetime(2024, 1, 1),
+    catchup=False,
+    dagrun_timeout=timedelta(hours=1),
+) as dag:
+
+    # One mapped task instance per sync. Instances that run in the same worker
+    # process share the resolved connection and its keep-alive session, and the
+    # deferred runs send at most 10 requests at once from the triggerer.
+    run_syncs = HightouchTriggerSyncOperator.partial(
+        task_id="run_syncs",
+        deferrable=True,
+        max_concurrent_requests=10,
+    ).expand(sync_slug=["orders", "customers", "products"])
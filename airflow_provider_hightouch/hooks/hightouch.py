@@ -1,50 +1,226 @@
+import asyncio
+import copy
 import datetime
+import itertools
 import json
+import threading
 import time
-from typing import Any, Dict, List, Optional
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 from urllib.parse import urljoin
 
+import aiohttp
+import requests
 from airflow.exceptions import AirflowException
+from airflow.hooks.base import BaseHook
+from asgiref.sync import sync_to_async
+from requests.adapters import HTTPAdapter
 
+from airflow_provider_hightouch.cache import (
+    ResponseCache,
+    SlugCache,
+    default_response_cache,
+    default_run_history_cache,
+    default_slug_cache,
+    is_cacheable_endpoint,
+)
 from airflow_provider_hightouch.consts import (
+    CANCEL_SYNC_RUN_ENDPOINT,
+    DEFAULT_PAGE_SIZE,
     DEFAULT_POLL_INTERVAL,
+    DEFAULT_RUN_HISTORY_SIZE,
     HIGHTOUCH_API_BASE_V3,
     PENDING_STATUSES,
-    SUCCESS,
     TERMINAL_STATUSES,
-    WARNING,
 )
-from airflow_provider_hightouch.types import HightouchOutput
+from airflow_provider_hightouch.polling import FixedPollStrategy, PollStrategy
+from airflow_provider_hightouch.ratelimit import (
+    RateLimiter,
+    backoff_delay,
+    get_shared_rate_limiter,
+    is_retryable_status,
+    retry_after_seconds,
+)
+from airflow_provider_hightouch.types import (
+    HightouchOutput,
+    SyncRunHistory,
+    SyncRunParsedOutput,
+)
 
 try:
     from airflow.providers.http.hooks.http import HttpHook
 except ImportError:
     from airflow.hooks.http_hook import HttpHook
 
-from airflow_provider_hightouch import __version__, utils
+from airflow_provider_hightouch import __version__, metrics, utils
+
+
+class HightouchSyncRunFailed(AirflowException):
+    """A polled sync run ended unsuccessfully, or was cancelled when polling timed out."""
+
+
+class HightouchSyncRunTimeout(AirflowException):
+    """Polling a sync run timed out and the run was left pending."""
+
+
+def _base_url_from_connection(conn) -> str:
+    if conn.host and "://" in conn.host:
+        base_url = conn.host
+    else:
+        schema = conn.schema if conn.schema else "http"
+        host = conn.host if conn.host else ""
+        base_url = schema + "://" + host
+    if conn.port:
+        base_url += f":{conn.port}"
+    return base_url if base_url.endswith("/") else base_url + "/"
+
+
+def _get_rate_limiter(
+    hightouch_conn_id: str,
+    rate_limit: Optional[float],
+    rate_limit_burst: Optional[float],
+    rate_limit_path: Optional[str],
+    rate_limiter: Optional[RateLimiter],
+) -> Optional[RateLimiter]:
+    if rate_limiter is not None:
+        return rate_limiter
+    if rate_limit:
+        return get_shared_rate_limiter(
+            hightouch_conn_id, rate_limit, rate_limit_burst, path=rate_limit_path
+        )
+    return None
+
+
+def _request_tags(
+    metric_tags: Dict[str, str], method: str, endpoint: str
+) -> Dict[str, str]:
+    return {**metric_tags, "method": method, "endpoint": metrics.endpoint_tag(endpoint)}
+
+
+def _record_response(
+    tags: Dict[str, str], status: Any, started_at: float
+) -> None:
+    metrics.timing(
+        "request.duration",
+        datetime.timedelta(seconds=time.monotonic() - started_at),
+        tags={**tags, "status": str(status)},
+    )
+    if status == 429:
+        metrics.incr("request.rate_limited", tags=tags)
+
+
+class _ConnectionState:
+    """A resolved connection and the keep-alive session used to reach it."""
+
+    def __init__(self):
+        self.connection = None
+        self.expires_at = 0.0
+        self.headers: Dict[str, str] = {}
+        self.base_url: Optional[str] = None
+        self.session: Optional[requests.Session] = None
+        self.lock = threading.RLock()
+
+
+def _request_headers(token: str) -> Dict[str, str]:
+    return {
+        "accept": "application/json",
+        "Authorization": f"Bearer {token}",
+        "User-Agent": "AirflowHightouchOperator/" + __version__,
+    }
 
 
 class HightouchHook(HttpHook):
     """
     Hook for Hightouch API
 
+    The hook resolves its Airflow connection at most once per
+    ``connection_cache_ttl`` seconds (and again after a 401 response), and sends
+    every request through one keep-alive ``requests.Session``.
+
+    Rate limited (429) and server error responses are retried with jittered
+    exponential backoff, or after the delay given by ``Retry-After``. Other 4xx
+    responses fail immediately.
+
     Args:
         hightouch_conn_id (str):  The name of the Airflow connection
         with connection information for the Hightouch API
         api_version: (optional(str)). Hightouch API version.
+        connection_cache_ttl (float): Seconds to reuse a resolved connection and token
+        pool_size (int): Maximum number of keep-alive connections kept per host
+        request_max_retry_delay (float): Upper bound of the backoff between retries
+        rate_limit (float): Requests per second allowed for this connection across
+            every hook in the process. Unlimited by default.
+        rate_limit_burst (float): Requests that may be sent at once, defaults to
+            ``rate_limit``
+        rate_limit_path (str): File to share the rate limit between processes
+        rate_limiter (RateLimiter): Limiter to use instead of the shared one
+        slug_cache (SlugCache): Cache of resolved sync slugs. Defaults to the cache
+            shared by every hook in the process.
+        metric_tags (dict): Extra tags added to the metrics emitted by this hook,
+            e.g. the ``dag_id`` and ``task_id`` of the calling task
+        share_connection (bool): Share the resolved connection and keep-alive session
+            with every other hook of the process that also shares them, e.g. the
+            mapped instances of a task running in one worker process
+        cache_responses (bool): Serve read-only requests for sync, model, destination
+            and source configuration from a cache, revalidating them with ETag or
+            Last-Modified once stale. Run statuses are never cached.
+        response_cache (ResponseCache): Cache to use when ``cache_responses`` is set.
+            Defaults to the cache shared by every hook in the process.
     """
 
+    _shared_states: Dict[Tuple[str, int], _ConnectionState] = {}
+    _shared_states_lock = threading.Lock()
+
     def __init__(
         self,
         hightouch_conn_id: str = "hightouch_default",
         api_version: str = "v3",
         request_max_retries: int = 3,
         request_retry_delay: float = 0.5,
+        connection_cache_ttl: float = 300,
+        pool_size: int = 10,
+        request_max_retry_delay: float = 30,
+        rate_limit: Optional[float] = None,
+        rate_limit_burst: Optional[float] = None,
+        rate_limit_path: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        slug_cache: Optional[SlugCache] = None,
+        metric_tags: Optional[Dict[str, str]] = None,
+        share_connection: bool = False,
+        cache_responses: bool = False,
+        response_cache: Optional[ResponseCache] = None,
     ):
         self.hightouch_conn_id = hightouch_conn_id
+        self.slug_cache = slug_cache if slug_cache is not None else default_slug_cache
+        self.metric_tags = dict(metric_tags or {})
+        self.response_cache = None
+        if cache_responses:
+            self.response_cache = response_cache or default_response_cache
         self.api_version = api_version
         self._request_max_retries = request_max_retries
         self._request_retry_delay = request_retry_delay
+        self._request_max_retry_delay = request_max_retry_delay
+        self._rate_limiter = _get_rate_limiter(
+            hightouch_conn_id, rate_limit, rate_limit_burst, rate_limit_path, rate_limiter
+        )
+        self._connection_cache_ttl = connection_cache_ttl
+        self._pool_size = pool_size
+        if share_connection:
+            self._state = self._get_shared_state(hightouch_conn_id, pool_size)
+        else:
+            self._state = _ConnectionState()
+        self._request_count = 0
         if self.api_version not in ("v1", "v3"):
             raise AirflowException(
                 "This version of the Hightouch Operator only supports the v1/v3 API."
@@ -56,6 +232,115 @@ class HightouchHook(HttpHook):
         """Returns the correct API BASE URL depending on the API version."""
         return HIGHTOUCH_API_BASE_V3
 
+    @classmethod
+    def _get_shared_state(cls, hightouch_conn_id: str, pool_size: int) -> _ConnectionState:
+        with cls._shared_states_lock:
+            key = (hightouch_conn_id, pool_size)
+            if key not in cls._shared_states:
+                cls._shared_states[key] = _ConnectionState()
+            return cls._shared_states[key]
+
+    @classmethod
+    def close_shared_connections(cls) -> None:
+        """Close and forget every connection shared between hooks of the process."""
+        with cls._shared_states_lock:
+            states = list(cls._shared_states.values())
+            cls._shared_states.clear()
+        for state in states:
+            if state.session is not None:
+                state.session.close()
+
+    def _get_cached_connection(self):
+        state = self._state
+        with state.lock:
+            if state.connection is None or time.monotonic() >= state.expires_at:
+                state.connection = self.get_connection(self.hightouch_conn_id)
+                state.expires_at = time.monotonic() + self._connection_cache_ttl
+                state.headers = _request_headers(state.connection.password)
+                state.base_url = _base_url_from_connection(state.connection)
+            self.base_url = state.base_url
+            return state.connection
+
+    def invalidate_connection(self) -> None:
+        """Forget the cached connection so the next request resolves it again."""
+        with self._state.lock:
+            self._state.connection = None
+            self._state.expires_at = 0.0
+
+    def get_conn(self, headers=None, extra_options=None) -> requests.Session:
+        """Returns the hook's persistent session, creating it on first use."""
+        conn = self._get_cached_connection()
+        state = self._state
+        with state.lock:
+            if state.session is None:
+                state.session = self._new_session(conn)
+            session = state.session
+        if headers:
+            session.headers.update(headers)
+        return session
+
+    def _new_session(self, conn) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self._pool_size, pool_maxsize=self._pool_size
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if conn.extra:
+            extra_headers = conn.extra_dejson
+            if isinstance(extra_headers, dict):
+                session.headers.update(
+                    {k: v for k, v in extra_headers.items() if isinstance(v, str)}
+                )
+        return session
+
+    def close(self) -> None:
+        """Close the persistent session and its pooled connections."""
+        with self._state.lock:
+            if self._state.session is not None:
+                self._state.session.close()
+                self._state.session = None
+
+    @property
+    def connection_stats(self) -> Dict[str, int]:
+        """Counts of requests sent and of pooled connections opened and reused."""
+        new_connections = 0
+        pooled_requests = 0
+        session = self._state.session
+        if session is not None:
+            # The same adapter is mounted for both schemes.
+            adapters = {id(a): a for a in session.adapters.values()}
+            for adapter in adapters.values():
+                pools = adapter.poolmanager.pools
+                for key in pools.keys():
+                    pool = pools[key]
+                    new_connections += pool.num_connections
+                    pooled_requests += pool.num_requests
+        return {
+            "requests": self._request_count,
+            "new_connections": new_connections,
+            "reused_connections": max(pooled_requests - new_connections, 0),
+        }
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        session = self.get_conn()
+        url = self.url_from_endpoint(urljoin(self.api_base_url, endpoint))
+        headers = {**self._state.headers, **(headers or {})}
+        if method == "GET":
+            request = requests.Request(method, url, params=data, headers=headers)
+        else:
+            request = requests.Request(method, url, data=data, headers=headers)
+        self._request_count += 1
+        return self.run_and_check(
+            session, session.prepare_request(request), {"check_response": False}
+        )
+
     def make_request(
         self,
         method: str,
@@ -66,39 +351,88 @@ class HightouchHook(HttpHook):
         Args:
             method (str): The http method use for this request (e.g. "GET", "POST").
             endpoint (str): The Hightouch API endpoint to send this request to.
-            params (Optional(dict): Query parameters to pass to the API endpoint
-            body (Optional(dict): Body parameters to pass to the API endpoint
+            data (Optional(dict): Query parameters for GET requests, body otherwise
         Returns:
             Dict[str, Any]: Parsed json data from the response to this request
         """
+        return self._make_request(method, endpoint, data, self.response_cache)
 
-        conn = self.get_connection(self.hightouch_conn_id)
-        token = conn.password
-
-        user_agent = "AirflowHightouchOperator/" + __version__
-        headers = {
-            "accept": "application/json",
-            "Authorization": f"Bearer {token}",
-            "User-Agent": user_agent,
-        }
+    def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        response_cache: Optional[ResponseCache],
+    ):
+        tags = _request_tags(self.metric_tags, method, endpoint)
+        cache_key, cached, conditional_headers = None, None, None
+        if response_cache is not None and is_cacheable_endpoint(method, endpoint):
+            cache_key = (
+                self.hightouch_conn_id,
+                endpoint,
+                json.dumps(data or {}, sort_keys=True, default=str),
+            )
+            fresh, cached, conditional_headers = response_cache.lookup(cache_key)
+            if fresh:
+                metrics.incr("response_cache.hits", tags=tags)
+                return copy.deepcopy(cached)
 
         num_retries = 0
+        refreshed_connection = False
         while True:
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire()
+            retry_after = None
+            started_at = time.monotonic()
             try:
-                self.method = method
-                response = self.run(
-                    endpoint=urljoin(self.api_base_url, endpoint),
-                    data=data,
-                    headers=headers,
-                )
-                resp_dict = response.json()
-                return resp_dict["data"] if "data" in resp_dict else resp_dict
-            except AirflowException as e:
+                response = self._send(method, endpoint, data, conditional_headers)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                _record_response(tags, "error", started_at)
                 self.log.error("Request to Hightouch API failed: %s", e)
-                if num_retries == self._request_max_retries:
-                    break
-                num_retries += 1
-                time.sleep(self._request_retry_delay)
+            else:
+                _record_response(tags, response.status_code, started_at)
+                if response.status_code == 401 and not refreshed_connection:
+                    # The token may have been rotated since it was cached.
+                    self.log.info("Unauthorized response, resolving the connection again.")
+                    self.invalidate_connection()
+                    refreshed_connection = True
+                    continue
+                if response.status_code == 304 and cached is not None:
+                    response_cache.revalidated(cache_key)
+                    metrics.incr("response_cache.revalidations", tags=tags)
+                    return copy.deepcopy(cached)
+                if response.ok:
+                    resp_dict = response.json()
+                    result = resp_dict["data"] if "data" in resp_dict else resp_dict
+                    if cache_key is not None:
+                        response_cache.set(
+                            cache_key, result, response.headers, len(response.content)
+                        )
+                        metrics.incr("response_cache.misses", tags=tags)
+                        return copy.deepcopy(result)
+                    return result
+                if not is_retryable_status(response.status_code):
+                    self.log.error("Request to Hightouch API failed: %s", response.text)
+                    raise AirflowException(f"{response.status_code}:{response.reason}")
+                self.log.error(
+                    "Request to Hightouch API failed: %s:%s",
+                    response.status_code,
+                    response.reason,
+                )
+                retry_after = retry_after_seconds(response.headers)
+                if response.status_code == 429 and retry_after is not None:
+                    if self._rate_limiter is not None:
+                        self._rate_limiter.penalize(retry_after)
+
+            if num_retries == self._request_max_retries:
+                break
+            if retry_after is None:
+                retry_after = backoff_delay(
+                    num_retries, self._request_retry_delay, self._request_max_retry_delay
+                )
+            num_retries += 1
+            metrics.incr("request.retries", tags=tags)
+            time.sleep(retry_after)
 
         raise AirflowException("Exceeded max number of retries.")
 
@@ -117,25 +451,190 @@ class HightouchHook(HttpHook):
             method="GET", endpoint=f"syncs/{sync_id}/runs", data=params
         )
 
-    def get_sync_details(self, sync_id: str) -> Dict[str, Any]:
+    def get_sync_details(self, sync_id: str, use_cache: bool = False) -> Dict[str, Any]:
         """Get details about a given sync from the Hightouch API.
         Args:
             sync_id (str): The Hightouch Sync ID.
+            use_cache (bool): Serve the details from the response cache, the one shared
+                by every hook of the process unless this hook has its own, even when
+                the hook does not cache responses
         Returns:
             Dict[str, Any]: Parsed json data from the response
         """
-        return self.make_request(method="GET", endpoint=f"syncs/{sync_id}")
+        response_cache = self.response_cache
+        if use_cache and response_cache is None:
+            response_cache = default_response_cache
+        return self._make_request("GET", f"syncs/{sync_id}", None, response_cache)
 
-    def get_sync_from_slug(self, sync_slug: str) -> str:
-        """Get details about a given sync from the Hightouch API.
+    def _paginate(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yields every record of a paginated listing endpoint, one page at a time.
+
+        With ``prefetch``, the next page is requested from a background thread while
+        the records of the current one are consumed.
+        """
+
+        def fetch(offset: int) -> List[Dict[str, Any]]:
+            return self.make_request(
+                method="GET",
+                endpoint=endpoint,
+                data={**(params or {}), "limit": page_size, "offset": offset},
+            )
+
+        if not prefetch:
+            offset = 0
+            while True:
+                page = fetch(offset)
+                yield from page
+                if len(page) < page_size:
+                    return
+                offset += page_size
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            offset = 0
+            next_page = executor.submit(fetch, offset)
+            try:
+                while next_page is not None:
+                    page = next_page.result()
+                    next_page = None
+                    if len(page) == page_size:
+                        offset += page_size
+                        next_page = executor.submit(fetch, offset)
+                    yield from page
+            finally:
+                # The caller stopped early; skip the next page if it is not in flight yet.
+                if next_page is not None:
+                    next_page.cancel()
+
+    def iter_syncs(
+        self,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over the syncs of the workspace, following the API's pagination.
+
+        Pages are requested lazily, so only one or two of them are held in memory.
+        Args:
+            params (dict): Filters of the sync listing, e.g. ``{"modelId": "12"}``
+            page_size (int): Number of syncs requested per page
+            prefetch (bool): Whether to request the next page in the background while
+                the current one is consumed
+        Returns:
+            Iterator[Dict[str, Any]]: The syncs, as returned by the API
+        """
+        return self._paginate("syncs", params, page_size=page_size, prefetch=prefetch)
+
+    def iter_sync_runs(
+        self,
+        sync_id: str,
+        since: Optional[datetime.datetime] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = True,
+    ) -> Iterator[SyncRunParsedOutput]:
+        """Iterate over the runs of a sync, following the API's pagination.
+
+        Pages are requested lazily, so only one or two of them are held in memory.
         Args:
             sync_id (str): The Hightouch Sync ID.
+            since (datetime): Only yield runs created after this time
+            page_size (int): Number of runs requested per page
+            prefetch (bool): Whether to request the next page in the background while
+                the current one is consumed
         Returns:
-            Dict[str, Any]: Parsed json data from the response
+            Iterator[SyncRunParsedOutput]: Parsed details of every run
         """
-        return self.make_request(
-            method="GET", endpoint="syncs", data={"slug": sync_slug}
-        )[0]["id"]
+        params = {"after": since.isoformat()} if since else None
+        for run in self._paginate(
+            f"syncs/{sync_id}/runs", params, page_size=page_size, prefetch=prefetch
+        ):
+            yield utils.parse_sync_run_details(run)
+
+    def get_sync_run_history(
+        self, sync_id: str, max_runs: int = DEFAULT_RUN_HISTORY_SIZE
+    ) -> SyncRunHistory:
+        """Summarize the durations and throughput of the recent successful runs of a sync.
+
+        Summaries are cached for a few minutes, so operators can consult them on every
+        task run without listing the runs each time.
+        Args:
+            sync_id (str): The Hightouch Sync ID.
+            max_runs (int): Number of the most recent runs to consider
+        Returns:
+            :py:class:`~SyncRunHistory`: Durations and rows per second of the runs
+        """
+        key = (self.hightouch_conn_id, str(sync_id), max_runs)
+        history = default_run_history_cache.get(key)
+        if history is None:
+            runs = itertools.islice(
+                self._paginate(
+                    f"syncs/{sync_id}/runs", page_size=min(max_runs, DEFAULT_PAGE_SIZE)
+                ),
+                max_runs,
+            )
+            history = utils.summarize_sync_runs(
+                utils.parse_sync_run_details(run) for run in runs
+            )
+            default_run_history_cache.set(key, history)
+        return history
+
+    def get_sync_from_slug(self, sync_slug: str) -> str:
+        """Get the ID of the sync with the given slug, using the slug cache if possible.
+        Args:
+            sync_slug (str): The Hightouch Sync Slug.
+        Returns:
+            str: The Hightouch Sync ID
+        """
+        sync_id = self.slug_cache.get(self.hightouch_conn_id, sync_slug)
+        if sync_id is None:
+            syncs = self.make_request(
+                method="GET", endpoint="syncs", data={"slug": sync_slug}
+            )
+            if not syncs:
+                raise AirflowException(f"No sync found with slug {sync_slug}.")
+            sync_id = syncs[0]["id"]
+            self.slug_cache.set(self.hightouch_conn_id, sync_slug, sync_id)
+        return sync_id
+
+    def prefetch_sync_slugs(
+        self,
+        sync_slugs: Optional[Iterable[str]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Dict[str, str]:
+        """Resolve many slugs from the sync listing and store them in the slug cache.
+        Args:
+            sync_slugs (Iterable[str]): The slugs to resolve. Every sync in the
+                workspace is cached when omitted.
+            page_size (int): Number of syncs requested per page
+        Returns:
+            Dict[str, str]: Mapping from each resolved slug to its sync ID
+        """
+        wanted = set(sync_slugs) if sync_slugs is not None else None
+        resolved = {}
+        if wanted is not None:
+            for slug in wanted:
+                sync_id = self.slug_cache.get(self.hightouch_conn_id, slug)
+                if sync_id is not None:
+                    resolved[slug] = sync_id
+            if len(resolved) == len(wanted):
+                return resolved
+
+        listed = {}
+        for sync in self._paginate("syncs", page_size=page_size):
+            listed[sync["slug"]] = sync["id"]
+            if wanted is not None and wanted.issubset(listed.keys() | resolved.keys()):
+                break
+        self.slug_cache.set_many(self.hightouch_conn_id, listed)
+
+        if wanted is None:
+            return listed
+        resolved.update({slug: listed[slug] for slug in wanted if slug in listed})
+        return resolved
 
     def start_sync(
         self, sync_id: Optional[str] = None, sync_slug: Optional[str] = None
@@ -158,49 +657,38 @@ class HightouchHook(HttpHook):
             "One of sync_id or sync_slug must be provided to trigger a sync."
         )
 
-    def poll_sync(
+    def cancel_sync_run(self, sync_id: str, sync_request_id: str) -> None:
+        """Cancel a sync run that is still in progress
+        Args:
+            sync_id (str): The Hightouch Sync ID.
+            sync_request_id (str): The Hightouch Sync Request ID to cancel.
+        """
+        self.log.info("Cancelling run %s of sync %s.", sync_request_id, sync_id)
+        self.make_request(
+            method="POST",
+            endpoint=CANCEL_SYNC_RUN_ENDPOINT.format(sync_id=sync_id),
+            data={"runId": sync_request_id},
+        )
+
+    def _iter_sync_run_details(
         self,
         sync_id: str,
         sync_request_id: str,
-        fail_on_warning: bool = False,
-        poll_interval: float = DEFAULT_POLL_INTERVAL,
-        poll_timeout: Optional[float] = None,
-    ) -> HightouchOutput:
-        """Poll for the completion of a sync
-        Args:
-            sync_id (str): The Hightouch Sync ID
-            sync_request_id (str): The Hightouch Sync Request ID to poll against.
-            fail_on_warning (bool): Whether a warning is considered a failure for this sync.
-            poll_interval (float): The time in seconds that will be waited between succcessive polls
-            poll_timeout (float): The maximum time that will be waited before this operation
-                times out.
-        Returns:
-            Dict[str, Any]: Parsed json output from the API
-        """
+        poll_timeout: Optional[float],
+        poll_strategy: PollStrategy,
+        cancel_on_timeout: bool = False,
+    ) -> Iterator[Tuple[Dict[str, Any], SyncRunParsedOutput]]:
+        """Yields the raw and parsed details of every poll until the run is terminal."""
+        poll_strategy.reset()
         poll_start = datetime.datetime.now()
         while True:
             sync_run_details = self.get_sync_run_details(sync_id, sync_request_id)[0]
-
             self.log.debug(sync_run_details)
             run = utils.parse_sync_run_details(sync_run_details)
-            self.log.info(
-                f"Polling Hightouch Sync {sync_id}. Current status: {run.status}. "
-                f"{100 * run.completion_ratio}% completed."
-            )
+            yield sync_run_details, run
 
             if run.status in TERMINAL_STATUSES:
-                self.log.info(f"Sync request status: {run.status}. Polling complete")
-                if run.error:
-                    self.log.info("Sync Request Error: %s", run.error)
-
-                if run.status == SUCCESS:
-                    break
-                if run.status == WARNING and not fail_on_warning:
-                    break
-                raise AirflowException(
-                    f"Sync {sync_id} for request: {sync_request_id} failed with status: "
-                    f"{run.status} and error:  {run.error}"
-                )
+                return
             if run.status not in PENDING_STATUSES:
                 self.log.warning(
                     "Unexpected status: %s returned for sync %s and request %s. Will try "
@@ -214,13 +702,127 @@ class HightouchHook(HttpHook):
                 and datetime.datetime.now()
                 > poll_start + datetime.timedelta(seconds=poll_timeout)
             ):
-                raise AirflowException(
+                message = (
                     f"Sync {sync_id} for request: {sync_request_id}' time out after "
                     f"{datetime.datetime.now() - poll_start}. Last status was {run.status}."
                 )
+                if cancel_on_timeout:
+                    self.cancel_sync_run(sync_id, sync_request_id)
+                    raise HightouchSyncRunFailed(message)
+                raise HightouchSyncRunTimeout(message)
+
+            interval = poll_strategy.next_interval(run)
+            if poll_timeout:
+                # Never sleep through the timeout; poll once more right at it instead.
+                remaining = (
+                    poll_start
+                    + datetime.timedelta(seconds=poll_timeout)
+                    - datetime.datetime.now()
+                ).total_seconds()
+                interval = min(interval, max(remaining, 0))
+            time.sleep(interval)
+
+    def iter_sync_progress(
+        self,
+        sync_id: str,
+        sync_request_id: str,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        poll_timeout: Optional[float] = None,
+        poll_strategy: Optional[PollStrategy] = None,
+    ) -> Iterator[SyncRunParsedOutput]:
+        """Poll a sync run and yield a snapshot each time its progress changes.
+
+        A snapshot is yielded for the first poll and then only when the status,
+        completion ratio, row counts or error differ from the last one yielded. The
+        generator stops after yielding the run's terminal status, whatever it is.
+        Args:
+            sync_id (str): The Hightouch Sync ID
+            sync_request_id (str): The Hightouch Sync Request ID to poll against.
+            poll_interval (float): The time in seconds that will be waited between succcessive polls
+            poll_timeout (float): The maximum time that will be waited before this operation
+                times out.
+            poll_strategy (PollStrategy): Decides the wait between polls. Defaults to
+                waiting ``poll_interval`` seconds every time.
+        Returns:
+            Iterator[SyncRunParsedOutput]: Parsed snapshots of the sync run
+        """
+        last_progress = None
+        for _, run in self._iter_sync_run_details(
+            sync_id,
+            sync_request_id,
+            poll_timeout,
+            poll_strategy or FixedPollStrategy(poll_interval),
+        ):
+            progress = utils.sync_run_progress(run)
+            if progress != last_progress:
+                last_progress = progress
+                yield run
+
+    def poll_sync(
+        self,
+        sync_id: str,
+        sync_request_id: str,
+        fail_on_warning: bool = False,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        poll_timeout: Optional[float] = None,
+        poll_strategy: Optional[PollStrategy] = None,
+        cancel_on_timeout: bool = False,
+        fetch_sync_details: bool = True,
+    ) -> HightouchOutput:
+        """Poll for the completion of a sync
+        Args:
+            sync_id (str): The Hightouch Sync ID
+            sync_request_id (str): The Hightouch Sync Request ID to poll against.
+            fail_on_warning (bool): Whether a warning is considered a failure for this sync.
+            poll_interval (float): The time in seconds that will be waited between succcessive polls
+            poll_timeout (float): The maximum time that will be waited before this operation
+                times out.
+            poll_strategy (PollStrategy): Decides the wait between polls. Defaults to
+                waiting ``poll_interval`` seconds every time.
+            cancel_on_timeout (bool): Whether to cancel the sync run when polling times out
+            fetch_sync_details (bool): Whether to fetch the sync's configuration once the
+                run completes. ``sync_details`` is None otherwise.
+        Returns:
+            Dict[str, Any]: Parsed json output from the API
+        """
+        polls = 0
+        run = None
+        last_progress = None
+        with metrics.span(
+            "poll_sync", sync_id=sync_id, sync_run_id=sync_request_id
+        ), metrics.in_flight_runs.track(self.metric_tags):
+            try:
+                for sync_run_details, run in self._iter_sync_run_details(
+                    sync_id,
+                    sync_request_id,
+                    poll_timeout,
+                    poll_strategy or FixedPollStrategy(poll_interval),
+                    cancel_on_timeout=cancel_on_timeout,
+                ):
+                    polls += 1
+                    progress = utils.sync_run_progress(run)
+                    if progress != last_progress:
+                        last_progress = progress
+                        self.log.info(
+                            f"Polling Hightouch Sync {sync_id}. Current status: {run.status}. "
+                            f"{100 * run.completion_ratio}% completed."
+                        )
+            finally:
+                metrics.timing(
+                    "sync_run.polls",
+                    polls,
+                    tags={**self.metric_tags, "status": str(run.status if run else None)},
+                )
 
-            time.sleep(poll_interval)
-        sync_details = self.get_sync_details(sync_id)
+        self.log.info(f"Sync request status: {run.status}. Polling complete")
+        if run.error:
+            self.log.info("Sync Request Error: %s", run.error)
+        if not utils.is_successful_status(run.status, fail_on_warning):
+            raise HightouchSyncRunFailed(
+                f"Sync {sync_id} for request: {sync_request_id} failed with status: "
+                f"{run.status} and error:  {run.error}"
+            )
+        sync_details = self.get_sync_details(sync_id) if fetch_sync_details else None
 
         return HightouchOutput(sync_details, sync_run_details)
 
@@ -231,6 +833,9 @@ class HightouchHook(HttpHook):
         fail_on_warning: bool = False,
         poll_interval: float = DEFAULT_POLL_INTERVAL,
         poll_timeout: Optional[float] = None,
+        poll_strategy: Optional[PollStrategy] = None,
+        cancel_on_timeout: bool = False,
+        fetch_sync_details: bool = True,
     ) -> HightouchOutput:
         """
         Initialize a sync run for the given sync id, and polls until it completes
@@ -241,23 +846,375 @@ class HightouchHook(HttpHook):
             poll_interval (float): The time in seconds that will be waited between succcessive polls
             poll_timeout (float): The maximum time that will be waited before this operation
                 times out.
+            poll_strategy (PollStrategy): Decides the wait between polls. Defaults to
+                waiting ``poll_interval`` seconds every time.
+            cancel_on_timeout (bool): Whether to cancel the sync run when polling times out
+            fetch_sync_details (bool): Whether to fetch the sync's configuration once the
+                run completes. ``sync_details`` is None otherwise.
         Returns:
             :py:class:`~HightouchOutput`:
                 Object containing details about the Hightouch sync run
         """
-        sync_request_id = self.start_sync(sync_id, sync_slug)
+        with metrics.span("sync", sync_id=sync_id, sync_slug=sync_slug):
+            if not sync_id:
+                assert sync_slug
+                sync_id = self.get_sync_from_slug(sync_slug=sync_slug)
 
-        if not sync_id:
-            assert sync_slug
-            sync_id = sync_id or self.get_sync_from_slug(sync_slug=sync_slug)
+            with metrics.span("start_sync", sync_id=sync_id):
+                sync_request_id = self.start_sync(sync_id)
+            ht_output = self.poll_sync(
+                sync_id,
+                sync_request_id,
+                fail_on_warning=fail_on_warning,
+                poll_interval=poll_interval,
+                poll_timeout=poll_timeout,
+                poll_strategy=poll_strategy,
+                cancel_on_timeout=cancel_on_timeout,
+                fetch_sync_details=fetch_sync_details,
+            )
 
-        assert sync_id or sync_slug
-        ht_output = self.poll_sync(
-            sync_id,
-            sync_request_id,
-            fail_on_warning=fail_on_warning,
-            poll_interval=poll_interval,
-            poll_timeout=poll_timeout,
+        return ht_output
+
+
+class _AsyncSessionPool:
+    """A shared session, closed once it is retired and no request still uses it."""
+
+    def __init__(self, session: aiohttp.ClientSession, base_url: str):
+        self.session = session
+        self.base_url = base_url
+        self.in_flight = 0
+        self.retired = False
+
+    @asynccontextmanager
+    async def use(self) -> AsyncIterator[aiohttp.ClientSession]:
+        self.in_flight += 1
+        try:
+            yield self.session
+        finally:
+            self.in_flight -= 1
+            if self.retired and not self.in_flight:
+                await self.session.close()
+
+    async def retire(self) -> None:
+        self.retired = True
+        if not self.in_flight:
+            await self.session.close()
+
+
+# Shared sessions of a loop, keyed by connection ID and pool size.
+_AsyncSessionPools = Dict[Tuple[str, int], _AsyncSessionPool]
+
+
+class AsyncHightouchHook(BaseHook):
+    """
+    Asynchronous hook for Hightouch API
+
+    All hooks for the same connection running on the same event loop share one
+    keep-alive ``aiohttp`` session. The connection is resolved once, when that
+    session is created, so a triggerer can track many sync runs at once without a
+    metadata lookup per request. Retries and rate limiting behave as in
+    :py:class:`~HightouchHook`.
+
+    Args:
+        hightouch_conn_id (str):  The name of the Airflow connection
+        with connection information for the Hightouch API
+        api_version: (optional(str)). Hightouch API version.
+        pool_size (int): Maximum number of simultaneous connections in the pool shared
+            by the hooks of the connection with the same ``pool_size``
+        request_max_retry_delay (float): Upper bound of the backoff between retries
+        rate_limit (float): Requests per second allowed for this connection across
+            every hook in the process. Unlimited by default.
+        rate_limit_burst (float): Requests that may be sent at once, defaults to
+            ``rate_limit``
+        rate_limit_path (str): File to share the rate limit between processes
+        rate_limiter (RateLimiter): Limiter to use instead of the shared one
+        slug_cache (SlugCache): Cache of resolved sync slugs. Defaults to the cache
+            shared by every hook in the process.
+        metric_tags (dict): Extra tags added to the metrics emitted by this hook
+    """
+
+    _pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _AsyncSessionPools]" = (
+        weakref.WeakKeyDictionary()
+    )
+    _pool_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+        weakref.WeakKeyDictionary()
+    )
+
+    def __init__(
+        self,
+        hightouch_conn_id: str = "hightouch_default",
+        api_version: str = "v3",
+        request_max_retries: int = 3,
+        request_retry_delay: float = 0.5,
+        pool_size: int = 100,
+        request_max_retry_delay: float = 30,
+        rate_limit: Optional[float] = None,
+        rate_limit_burst: Optional[float] = None,
+        rate_limit_path: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        slug_cache: Optional[SlugCache] = None,
+        metric_tags: Optional[Dict[str, str]] = None,
+    ):
+        super().__init__()
+        self.hightouch_conn_id = hightouch_conn_id
+        self.slug_cache = slug_cache if slug_cache is not None else default_slug_cache
+        self.metric_tags = dict(metric_tags or {})
+        self.api_version = api_version
+        self._request_max_retries = request_max_retries
+        self._request_retry_delay = request_retry_delay
+        self._request_max_retry_delay = request_max_retry_delay
+        self._rate_limiter = _get_rate_limiter(
+            hightouch_conn_id, rate_limit, rate_limit_burst, rate_limit_path, rate_limiter
         )
+        self._pool_size = pool_size
+        if self.api_version not in ("v1", "v3"):
+            raise AirflowException(
+                "This version of the Hightouch Operator only supports the v1/v3 API."
+            )
 
-        return ht_output
+    @property
+    def api_base_url(self) -> str:
+        """Returns the correct API BASE URL depending on the API version."""
+        return HIGHTOUCH_API_BASE_V3
+
+    async def _get_pool(self) -> _AsyncSessionPool:
+        loop = asyncio.get_running_loop()
+        pools = self._pools.setdefault(loop, {})
+        # Hooks with different pool sizes get their own session, so each keeps its limit.
+        key = (self.hightouch_conn_id, self._pool_size)
+        pool = pools.get(key)
+        if pool is not None and not pool.session.closed:
+            return pool
+
+        lock = self._pool_locks.setdefault(loop, asyncio.Lock())
+        async with lock:
+            pool = pools.get(key)
+            if pool is not None and not pool.session.closed:
+                return pool
+
+            conn = await sync_to_async(self.get_connection)(self.hightouch_conn_id)
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._pool_size),
+                headers=_request_headers(conn.password),
+            )
+            pool = _AsyncSessionPool(session, _base_url_from_connection(conn))
+            pools[key] = pool
+            return pool
+
+    async def _invalidate_pool(self, pool: _AsyncSessionPool) -> None:
+        pools = self._pools.get(asyncio.get_running_loop(), {})
+        key = (self.hightouch_conn_id, self._pool_size)
+        if pools.get(key) is pool:
+            del pools[key]
+        # Requests of other hooks may still be using the session.
+        await pool.retire()
+
+    @classmethod
+    async def close_sessions(cls) -> None:
+        """Close every shared session opened on the running event loop."""
+        pools = cls._pools.pop(asyncio.get_running_loop(), {})
+        for pool in pools.values():
+            await pool.session.close()
+
+    async def make_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+    ):
+        """Creates and sends a request to the desired Hightouch API endpoint
+        Args:
+            method (str): The http method use for this request (e.g. "GET", "POST").
+            endpoint (str): The Hightouch API endpoint to send this request to.
+            data (Optional(dict): Query parameters for GET requests, body otherwise
+        Returns:
+            Dict[str, Any]: Parsed json data from the response to this request
+        """
+        payload = {k: str(v) for k, v in data.items()} if data else None
+        tags = _request_tags(self.metric_tags, method, endpoint)
+
+        num_retries = 0
+        refreshed_connection = False
+        while True:
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire_async()
+            # Used right away, so the pool cannot be retired and closed in between.
+            pool = await self._get_pool()
+            url = urljoin(pool.base_url, urljoin(self.api_base_url, endpoint))
+            retry_after = None
+            started_at = time.monotonic()
+            try:
+                async with pool.use() as session, session.request(
+                    method,
+                    url,
+                    params=payload if method == "GET" else None,
+                    data=payload if method != "GET" else None,
+                ) as response:
+                    _record_response(tags, response.status, started_at)
+                    if response.status < 400:
+                        resp_dict = await response.json()
+                        return resp_dict["data"] if "data" in resp_dict else resp_dict
+                    status, reason = response.status, response.reason
+                    retry_after = retry_after_seconds(response.headers)
+            except aiohttp.ClientError as e:
+                _record_response(tags, "error", started_at)
+                self.log.error("Request to Hightouch API failed: %s", e)
+            else:
+                if status == 401 and not refreshed_connection:
+                    # The token may have been rotated since the pool was created.
+                    self.log.info("Unauthorized response, resolving the connection again.")
+                    await self._invalidate_pool(pool)
+                    refreshed_connection = True
+                    continue
+                if not is_retryable_status(status):
+                    raise AirflowException(f"{status}:{reason}")
+                self.log.error("Request to Hightouch API failed: %s:%s", status, reason)
+                if status == 429 and retry_after is not None:
+                    if self._rate_limiter is not None:
+                        self._rate_limiter.penalize(retry_after)
+
+            if num_retries == self._request_max_retries:
+                break
+            if retry_after is None:
+                retry_after = backoff_delay(
+                    num_retries, self._request_retry_delay, self._request_max_retry_delay
+                )
+            num_retries += 1
+            metrics.incr("request.retries", tags=tags)
+            await asyncio.sleep(retry_after)
+
+        raise AirflowException("Exceeded max number of retries.")
+
+    async def get_sync_run_details(
+        self, sync_id: str, sync_request_id: str
+    ) -> List[Dict[str, Any]]:
+        """Get details about a given sync run from the Hightouch API.
+        Args:
+            sync_id (str): The Hightouch Sync ID.
+            sync_request_id (str): The Hightouch Sync Request ID.
+        Returns:
+            Dict[str, Any]: Parsed json data from the response
+        """
+        params = {"runId": sync_request_id}
+        return await self.make_request(
+            method="GET", endpoint=f"syncs/{sync_id}/runs", data=params
+        )
+
+    async def get_sync_details(self, sync_id: str) -> Dict[str, Any]:
+        """Get details about a given sync from the Hightouch API.
+        Args:
+            sync_id (str): The Hightouch Sync ID.
+        Returns:
+            Dict[str, Any]: Parsed json data from the response
+        """
+        return await self.make_request(method="GET", endpoint=f"syncs/{sync_id}")
+
+    async def get_sync_from_slug(self, sync_slug: str) -> str:
+        """Get the ID of the sync with the given slug, using the slug cache if possible.
+        Args:
+            sync_slug (str): The Hightouch Sync Slug.
+        Returns:
+            str: The Hightouch Sync ID
+        """
+        # The cache may be backed by a file or Airflow Variables, so keep it off the loop.
+        sync_id = await sync_to_async(self.slug_cache.get)(
+            self.hightouch_conn_id, sync_slug
+        )
+        if sync_id is None:
+            syncs = await self.make_request(
+                method="GET", endpoint="syncs", data={"slug": sync_slug}
+            )
+            if not syncs:
+                raise AirflowException(f"No sync found with slug {sync_slug}.")
+            sync_id = syncs[0]["id"]
+            await sync_to_async(self.slug_cache.set)(
+                self.hightouch_conn_id, sync_slug, sync_id
+            )
+        return sync_id
+
+    async def start_sync(
+        self, sync_id: Optional[str] = None, sync_slug: Optional[str] = None
+    ) -> str:
+        """Trigger a sync and initiate a sync run
+        Args:
+            sync_id (str): The Hightouch Sync ID.
+            sync_slug (str): The Hightouch Sync Slug.
+        Returns:
+            str: The sync request ID created by the Hightouch API.
+        """
+        if sync_id:
+            data = {"syncId": sync_id}
+        elif sync_slug:
+            data = {"syncSlug": sync_slug}
+        else:
+            raise AirflowException(
+                "One of sync_id or sync_slug must be provided to trigger a sync."
+            )
+        response = await self.make_request(
+            method="POST", endpoint="syncs/trigger", data=data
+        )
+        return response["id"]
+
+    async def cancel_sync_run(self, sync_id: str, sync_request_id: str) -> None:
+        """Cancel a sync run that is still in progress
+        Args:
+            sync_id (str): The Hightouch Sync ID.
+            sync_request_id (str): The Hightouch Sync Request ID to cancel.
+        """
+        self.log.info("Cancelling run %s of sync %s.", sync_request_id, sync_id)
+        await self.make_request(
+            method="POST",
+            endpoint=CANCEL_SYNC_RUN_ENDPOINT.format(sync_id=sync_id),
+            data={"runId": sync_request_id},
+        )
+
+    async def iter_sync_progress(
+        self,
+        sync_id: str,
+        sync_request_id: str,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        poll_timeout: Optional[float] = None,
+        poll_strategy: Optional[PollStrategy] = None,
+    ) -> AsyncIterator[SyncRunParsedOutput]:
+        """Poll a sync run and yield a snapshot each time its progress changes.
+
+        Behaves like :py:meth:`HightouchHook.iter_sync_progress`, without blocking
+        the event loop between polls.
+        Args:
+            sync_id (str): The Hightouch Sync ID
+            sync_request_id (str): The Hightouch Sync Request ID to poll against.
+            poll_interval (float): The time in seconds that will be waited between succcessive polls
+            poll_timeout (float): The maximum time that will be waited before this operation
+                times out.
+            poll_strategy (PollStrategy): Decides the wait between polls. Defaults to
+                waiting ``poll_interval`` seconds every time.
+        Returns:
+            AsyncIterator[SyncRunParsedOutput]: Parsed snapshots of the sync run
+        """
+        poll_strategy = poll_strategy or FixedPollStrategy(poll_interval)
+        poll_strategy.reset()
+        poll_start = time.monotonic()
+        last_progress = None
+        while True:
+            sync_run_details = (
+                await self.get_sync_run_details(sync_id, sync_request_id)
+            )[0]
+            run = utils.parse_sync_run_details(sync_run_details)
+            progress = utils.sync_run_progress(run)
+            if progress != last_progress:
+                last_progress = progress
+                yield run
+
+            if run.status in TERMINAL_STATUSES:
+                return
+            elapsed = time.monotonic() - poll_start
+            if poll_timeout and elapsed > poll_timeout:
+                raise AirflowException(
+                    f"Sync {sync_id} for request: {sync_request_id}' time out after "
+                    f"{datetime.timedelta(seconds=elapsed)}. Last status was {run.status}."
+                )
+
+            interval = poll_strategy.next_interval(run)
+            if poll_timeout:
+                interval = min(interval, max(poll_timeout - elapsed, 0))
+            await asyncio.sleep(interval)
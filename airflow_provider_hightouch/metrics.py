@@ -0,0 +1,102 @@
+import datetime
+import functools
+import re
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Union
+
+from airflow.stats import Stats
+
+from .version import __version__
+
+METRIC_PREFIX = "hightouch"
+
+_SYNC_ID_PATTERN = re.compile(r"syncs/(?!trigger\b)[^/?]+")
+
+
+def endpoint_tag(endpoint: str) -> str:
+    """Replaces IDs in an API endpoint so it can be used as a low-cardinality tag."""
+    return _SYNC_ID_PATTERN.sub("syncs/{id}", endpoint.split("?", 1)[0])
+
+
+def _emit(method: str, stat: str, *args, tags: Optional[Dict[str, str]] = None, **kwargs) -> None:
+    emit = getattr(Stats, method)
+    try:
+        emit(f"{METRIC_PREFIX}.{stat}", *args, tags=tags or {}, **kwargs)
+    except TypeError:
+        # Stats loggers before Airflow 2.6 do not accept tags.
+        emit(f"{METRIC_PREFIX}.{stat}", *args, **kwargs)
+
+
+def incr(stat: str, count: int = 1, tags: Optional[Dict[str, str]] = None) -> None:
+    _emit("incr", stat, count, tags=tags)
+
+
+def timing(
+    stat: str,
+    value: Union[datetime.timedelta, float],
+    tags: Optional[Dict[str, str]] = None,
+) -> None:
+    """Records a timer. Pass a timedelta for durations, or a number for histograms."""
+    _emit("timing", stat, value, tags=tags)
+
+
+def gauge(
+    stat: str,
+    value: float,
+    tags: Optional[Dict[str, str]] = None,
+    delta: bool = False,
+) -> None:
+    """Sets a gauge, or adjusts it by ``value`` with ``delta=True``."""
+    _emit("gauge", stat, value, tags=tags, delta=delta)
+
+
+def task_tags(task) -> Dict[str, str]:
+    """Tags identifying the task that sends requests, to attribute API usage to DAGs."""
+    return {"dag_id": task.dag_id, "task_id": task.task_id}
+
+
+@functools.lru_cache(maxsize=None)
+def _trace_api():
+    # Imported on first use, so that parsing DAGs does not load OpenTelemetry.
+    try:
+        from opentelemetry import trace
+    except ImportError:
+        return None
+    return trace
+
+
+@contextmanager
+def span(name: str, **attributes) -> Iterator[Optional[object]]:
+    """Wraps the block in an OpenTelemetry span when OpenTelemetry is installed."""
+    trace = _trace_api()
+    if trace is None:
+        yield None
+        return
+    tracer = trace.get_tracer("airflow_provider_hightouch", __version__)
+    attributes = {k: v for k, v in attributes.items() if v is not None}
+    with tracer.start_as_current_span(f"{METRIC_PREFIX}.{name}", attributes=attributes) as s:
+        yield s
+
+
+class _InFlightRuns:
+    def add(self, delta: int, tags: Optional[Dict[str, str]] = None) -> None:
+        """Adjusts the number of sync runs in flight by ``delta``.
+
+        The gauge is sent as a delta, so the backend sums the runs of every worker and
+        triggerer instead of keeping whichever process reported last.
+        """
+        if not delta:
+            return
+        gauge("sync_runs.in_flight", delta, tags=tags, delta=True)
+
+    @contextmanager
+    def track(self, tags: Optional[Dict[str, str]] = None) -> Iterator[None]:
+        """Counts the sync run as in flight for the duration of the block."""
+        self.add(1, tags)
+        try:
+            yield
+        finally:
+            self.add(-1, tags)
+
+
+in_flight_runs = _InFlightRuns()
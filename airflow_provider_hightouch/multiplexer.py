@@ -0,0 +1,205 @@
+import json
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, Optional, Set, Tuple
+
+from .consts import DEFAULT_PAGE_SIZE, DEFAULT_POLL_INTERVAL
+from .hooks.hightouch import HightouchHook
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+
+class SyncRunStatusMultiplexer:
+    """
+    Shares sync run status lookups between many sensors.
+
+    Sensors register the runs they watch and read statuses from here. The
+    multiplexer fetches the recent runs listing of each sync at most once per
+    ``refresh_interval`` and answers every registered run of that sync from it,
+    falling back to a single-run query for registered runs the listing does not
+    include. API calls therefore scale with the number of syncs being watched
+    rather than the number of sensors.
+
+    Within a process, use :py:func:`get_status_multiplexer` to share one
+    instance. Processes on the same host can share fetched statuses through
+    ``path``: a process that finds an entry stale refreshes it and writes it back
+    for the others to read. The file is only locked while it is read or written,
+    so a slow request does not hold up the sensors of other syncs.
+
+    Args:
+        hightouch_conn_id (str): The name of the Airflow connection
+        api_version (str): Hightouch API version
+        refresh_interval (float): Seconds a fetched status is reused
+        page_size (int): Number of recent runs fetched per sync
+        path (str): Optional file shared with other processes
+        rate_limit (float): Requests per second allowed for this connection, see
+            :py:class:`HightouchHook`
+        rate_limit_path (str): File to share the rate limit between processes
+    """
+
+    def __init__(
+        self,
+        hightouch_conn_id: str = "hightouch_default",
+        api_version: str = "v3",
+        refresh_interval: float = DEFAULT_POLL_INTERVAL,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        path: Optional[str] = None,
+        rate_limit: Optional[float] = None,
+        rate_limit_path: Optional[str] = None,
+    ):
+        if path and fcntl is None:
+            raise RuntimeError("Sharing statuses through a file requires fcntl")
+        self.hook = HightouchHook(
+            hightouch_conn_id=hightouch_conn_id,
+            api_version=api_version,
+            rate_limit=rate_limit,
+            rate_limit_path=rate_limit_path,
+        )
+        self.refresh_interval = refresh_interval
+        self.page_size = page_size
+        self.path = path
+        self.api_calls = 0
+        self._registered: Dict[str, Set[str]] = defaultdict(set)
+        self._statuses: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._sync_locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
+
+    def register(self, sync_id: str, sync_run_id: str) -> None:
+        """Start tracking a sync run."""
+        with self._lock:
+            self._registered[str(sync_id)].add(str(sync_run_id))
+
+    def unregister(self, sync_id: str, sync_run_id: str) -> None:
+        """Stop tracking a sync run, e.g. once it has reached a terminal status."""
+        sync_id, sync_run_id = str(sync_id), str(sync_run_id)
+        with self._lock:
+            self._registered[sync_id].discard(sync_run_id)
+            if not self._registered[sync_id]:
+                del self._registered[sync_id]
+
+    def _fresh(self, entry: Optional[Tuple[float, Dict[str, Any]]], run_ids) -> bool:
+        return (
+            entry is not None
+            and time.time() - entry[0] < self.refresh_interval
+            and all(run_id in entry[1] for run_id in run_ids)
+        )
+
+    def _fetch(self, sync_id: str, run_ids: Set[str]) -> Tuple[float, Dict[str, Any]]:
+        fetched_at = time.time()
+        listing = self.hook.make_request(
+            method="GET",
+            endpoint=f"syncs/{sync_id}/runs",
+            data={"limit": self.page_size},
+        )
+        self.api_calls += 1
+        runs = {str(run["id"]): run for run in listing}
+        for run_id in run_ids - runs.keys():
+            runs[run_id] = self.hook.get_sync_run_details(sync_id, run_id)[0]
+            self.api_calls += 1
+        return fetched_at, runs
+
+    def _shared_transaction(self, update):
+        """Runs ``update`` on the shared statuses under the file lock, saving them after."""
+        with open(self.path, "a+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    shared = json.loads(f.read() or "{}")
+                except ValueError:
+                    shared = {}
+                result = update(shared)
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(shared))
+                return result
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _fetch_shared(self, sync_id: str, run_ids: Set[str]) -> Tuple[float, Dict[str, Any]]:
+        def read(shared):
+            entry = shared.get(sync_id)
+            return (entry[0], entry[1]) if entry is not None else None
+
+        entry = self._shared_transaction(read)
+        if self._fresh(entry, run_ids):
+            return entry
+        entry = self._fetch(sync_id, run_ids)
+
+        def write(shared):
+            # Drop entries nobody has refreshed for a while.
+            horizon = time.time() - 10 * self.refresh_interval
+            for key in [k for k, v in shared.items() if v[0] <= horizon]:
+                del shared[key]
+            current = shared.get(sync_id)
+            # Another process may have stored a newer listing meanwhile.
+            if current is None or current[0] < entry[0]:
+                shared[sync_id] = list(entry)
+
+        self._shared_transaction(write)
+        return entry
+
+    def _prune(self) -> None:
+        # Statuses of syncs nobody watches anymore are kept briefly, since sensors
+        # for other runs of the sync may still be about to poke.
+        horizon = time.time() - 10 * self.refresh_interval
+        for sync_id in [
+            s for s, e in self._statuses.items() if e[0] < horizon and s not in self._registered
+        ]:
+            del self._statuses[sync_id]
+
+    def get_sync_run_details(self, sync_id: str, sync_run_id: str) -> Dict[str, Any]:
+        """Returns the latest known details of a sync run, registering it if needed.
+        Args:
+            sync_id (str): The Hightouch Sync ID
+            sync_run_id (str): The Hightouch Sync Run ID
+        Returns:
+            Dict[str, Any]: The sync run as returned by the API
+        """
+        sync_id, sync_run_id = str(sync_id), str(sync_run_id)
+        self.register(sync_id, sync_run_id)
+        with self._sync_locks[sync_id]:
+            with self._lock:
+                entry = self._statuses.get(sync_id)
+                run_ids = set(self._registered[sync_id])
+            if not self._fresh(entry, [sync_run_id]):
+                if self.path:
+                    entry = self._fetch_shared(sync_id, run_ids)
+                else:
+                    entry = self._fetch(sync_id, run_ids)
+                with self._lock:
+                    self._statuses[sync_id] = entry
+                    self._prune()
+        return entry[1][sync_run_id]
+
+
+_multiplexers: Dict[Tuple, SyncRunStatusMultiplexer] = {}
+_multiplexers_lock = threading.Lock()
+
+
+def get_status_multiplexer(
+    hightouch_conn_id: str = "hightouch_default",
+    api_version: str = "v3",
+    path: Optional[str] = None,
+    **kwargs,
+) -> SyncRunStatusMultiplexer:
+    """
+    Returns the process-wide multiplexer for a connection and settings, such as the
+    ``refresh_interval``, creating it on first use.
+    """
+    key = (hightouch_conn_id, api_version, path, tuple(sorted(kwargs.items())))
+    with _multiplexers_lock:
+        multiplexer = _multiplexers.get(key)
+        if multiplexer is None:
+            multiplexer = SyncRunStatusMultiplexer(
+                hightouch_conn_id=hightouch_conn_id,
+                api_version=api_version,
+                path=path,
+                **kwargs,
+            )
+            _multiplexers[key] = multiplexer
+        return multiplexer
@@ -1,11 +1,51 @@
-from typing import Optional
+import asyncio
+import datetime
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
-from airflow.exceptions import AirflowException
+from airflow.exceptions import AirflowException, AirflowTaskTimeout
 from airflow.models import BaseOperator, BaseOperatorLink
 from airflow.utils.decorators import apply_defaults
 
-from airflow_provider_hightouch.hooks.hightouch import HightouchHook
-from airflow_provider_hightouch.utils import parse_sync_run_details
+from airflow_provider_hightouch import metrics
+from airflow_provider_hightouch.consts import (
+    AUTO_TIMEOUT,
+    DEFAULT_TIMEOUT,
+    FAIL_FAST,
+    FAILURE_POLICIES,
+    FAILED,
+    OUTPUT_FULL,
+    OUTPUT_ID,
+    OUTPUT_METRICS,
+    OUTPUT_MODES,
+    PENDING_STATUSES,
+    TERMINAL_STATUSES,
+    UPSTREAM_FAILED,
+)
+from airflow_provider_hightouch.datasets import (
+    set_dataset_extra,
+    sync_dataset,
+    sync_dataset_extra,
+)
+from airflow_provider_hightouch.state import (
+    RunStateStore,
+    VariableRunStateStore,
+    task_instance_key,
+)
+from airflow_provider_hightouch.utils import (
+    generate_metadata_from_parsed_run,
+    is_successful_status,
+    parse_sync_run_details,
+)
+
+# The hooks, triggers and poll strategies pull in requests, aiohttp and the HTTP
+# provider. They are imported when a task runs rather than when a DAG file is parsed.
+if TYPE_CHECKING:
+    from airflow_provider_hightouch.cache import SlugCache
+    from airflow_provider_hightouch.coalesce import SyncRunCoalescer
+    from airflow_provider_hightouch.concurrency import SyncConcurrencyLimiter
+    from airflow_provider_hightouch.hooks.hightouch import AsyncHightouchHook, HightouchHook
+    from airflow_provider_hightouch.polling import PollStrategy
 
 
 class HightouchLink(BaseOperatorLink):
@@ -37,11 +77,74 @@ class HightouchTriggerSyncOperator(BaseOperator):
     :type error_on_warning: bool
     :param wait_seconds: Time to wait in between subsequent polls to the API.
     :type wait_seconds: float
-    :param timeout: Maximum time to wait for a sync to complete before aborting
-    :type timeout: int
+    :param timeout: Maximum time to wait for a sync to complete before aborting, or
+        ``"auto"`` to derive it from the durations of the sync's recent runs
+    :type timeout: int or str
+    :param deferrable: Whether to defer polling to the triggerer instead of holding
+        a worker slot while waiting for a synchronous sync to complete
+    :type deferrable: bool
+    :param poll_strategy: Decides the wait between polls, e.g. an
+        ``ExponentialBackoffPollStrategy`` or ``AdaptivePollStrategy``. Defaults to
+        waiting ``wait_seconds`` every time.
+    :type poll_strategy: PollStrategy
+    :param use_run_history: Whether to log the expected completion time of the sync from
+        its recent runs, and to schedule polls around it when no ``poll_strategy`` is set
+    :type use_run_history: bool
+    :param max_concurrent_requests: Maximum number of requests sent at once by the
+        deferred runs of this connection on the triggerer. Only applies with
+        ``deferrable=True``; use ``rate_limit`` to limit workers.
+    :type max_concurrent_requests: int
+    :param rate_limit: Requests per second that the tasks of this connection may send
+        from a worker process, or from every process sharing ``rate_limit_path``
+    :type rate_limit: float
+    :param rate_limit_path: File through which worker processes on the same host
+        share ``rate_limit``
+    :type rate_limit_path: str
+    :param cancel_on_kill: Whether to cancel the Hightouch run when the task is killed
+        or times out waiting for it
+    :type cancel_on_kill: bool
+    :param reattach_on_retry: Opt in to resuming, on retry, the run started by a
+        previous try if that run is still pending, instead of triggering a new one
+    :type reattach_on_retry: bool
+    :param run_state_store: Where the started run is remembered between tries.
+        Defaults to a ``VariableRunStateStore``, which keeps it in the
+        ``hightouch_run__<dag_id>.<task_id>.<run_id>.<map_index>`` Variable.
+    :type run_state_store: RunStateStore
+    :param output_mode: What a synchronous run returns and pushes to XCom: ``id``, the
+        sync run ID; ``metrics``, a small dict of the run's status and row counts; or
+        ``full``, the run details and the sync configuration, which is only fetched
+        in this mode
+    :type output_mode: str
+    :param concurrency_limiter: Caps the runs in flight per destination and model
+        across the tasks sharing its slot store, Airflow Variables by default. The run
+        waits for a free slot before it starts, and waiting tasks with a higher
+        ``priority_weight`` get slots first.
+    :type concurrency_limiter: SyncConcurrencyLimiter
+    :param coalesce_window: Opt in to sharing runs between triggers of the same sync.
+        Instead of starting a new run, the operator attaches to the last run started
+        this way if it was triggered less than this many seconds ago or is still
+        pending. Runs the task attached to are never cancelled by it, and the task
+        that started a run only cancels it on kill or timeout once no other task is
+        attached to it.
+    :type coalesce_window: float
+    :param coalesce_path: File through which workers on the same host share
+        coalesced runs. Without it runs are shared by every worker and triggerer
+        through the ``hightouch_coalesced_run__<sync_id>`` Airflow Variables, whose
+        rows are locked in the metadata database while a task decides.
+    :type coalesce_path: str
+    :param emit_dataset: Declare the sync as an outlet Dataset,
+        ``hightouch://sync/<sync_id>`` (or ``hightouch://sync/slug/<sync_slug>``), so
+        DAGs scheduled on it run when a synchronous run succeeds. On Airflow 2.10+ the
+        dataset event carries the run's status and row counts as its extra.
+    :type emit_dataset: bool
+    :param slug_cache: Cache the sync slug is resolved through. Defaults to one
+        shared by the tasks of a process; give it a ``FileSlugStore`` or
+        ``VariableSlugStore`` to share resolved slugs with other tasks.
+    :type slug_cache: SlugCache
     """
 
     operator_extra_links = (HightouchLink(),)
+    template_fields = ("sync_id", "sync_slug")
 
     @apply_defaults
     def __init__(
@@ -53,10 +156,37 @@ class HightouchTriggerSyncOperator(BaseOperator):
         synchronous: bool = True,
         error_on_warning: bool = False,
         wait_seconds: float = 3,
-        timeout: int = 3600,
+        timeout: Union[int, str] = DEFAULT_TIMEOUT,
+        deferrable: bool = False,
+        poll_strategy: Optional["PollStrategy"] = None,
+        use_run_history: bool = False,
+        max_concurrent_requests: Optional[int] = None,
+        rate_limit: Optional[float] = None,
+        rate_limit_path: Optional[str] = None,
+        cancel_on_kill: bool = True,
+        reattach_on_retry: bool = False,
+        run_state_store: Optional[RunStateStore] = None,
+        output_mode: str = OUTPUT_ID,
+        concurrency_limiter: Optional["SyncConcurrencyLimiter"] = None,
+        coalesce_window: Optional[float] = None,
+        coalesce_path: Optional[str] = None,
+        emit_dataset: bool = False,
+        slug_cache: Optional["SlugCache"] = None,
         **kwargs,
     ):
         super().__init__(**kwargs)
+        if isinstance(timeout, str) and timeout != AUTO_TIMEOUT:
+            raise AirflowException(
+                f"timeout must be a number of seconds or '{AUTO_TIMEOUT}', got {timeout}"
+            )
+        if output_mode not in OUTPUT_MODES:
+            raise AirflowException(
+                f"output_mode must be one of {OUTPUT_MODES}, got {output_mode}"
+            )
+        if max_concurrent_requests and not deferrable:
+            raise AirflowException(
+                "max_concurrent_requests only applies to deferred runs, set deferrable=True"
+            )
         self.hightouch_conn_id = connection_id
         self.api_version = api_version
         self.sync_id = sync_id
@@ -65,13 +195,224 @@ class HightouchTriggerSyncOperator(BaseOperator):
         self.synchronous = synchronous
         self.wait_seconds = wait_seconds
         self.timeout = timeout
+        self.deferrable = deferrable
+        self.poll_strategy = poll_strategy
+        self.use_run_history = use_run_history
+        self.max_concurrent_requests = max_concurrent_requests
+        self.rate_limit = rate_limit
+        self.rate_limit_path = rate_limit_path
+        self.cancel_on_kill = cancel_on_kill
+        self.reattach_on_retry = reattach_on_retry
+        self.run_state_store = run_state_store
+        self.output_mode = output_mode
+        self.concurrency_limiter = concurrency_limiter
+        self.coalesce_window = coalesce_window
+        self.coalesce_path = coalesce_path
+        self.slug_cache = slug_cache
+        # Only a synchronous run knows that the sync has updated its destination.
+        self.dataset = None
+        if emit_dataset and synchronous:
+            self.dataset = sync_dataset(sync_id, sync_slug)
+            if self.dataset is not None:
+                self.outlets = [*self.outlets, self.dataset]
+        self._sync_run: Optional[Tuple[str, str]] = None
+        # Identifies the task instance to the slot store and the coalescer.
+        self._holder: Optional[str] = None
+        # Whether the run was started by another task, which then owns it.
+        self._attached = False
 
-    def execute(self, context) -> str:
-        """Start a Hightouch Sync Run"""
-        hook = HightouchHook(
+    def _plan_polling(
+        self, hook: "HightouchHook", sync_id: str
+    ) -> Tuple[Optional[float], Optional["PollStrategy"]]:
+        """Returns the timeout and poll strategy to wait for a run of the sync with."""
+        timeout, poll_strategy = self.timeout, self.poll_strategy
+        if not self.use_run_history and timeout != AUTO_TIMEOUT:
+            return timeout, poll_strategy
+
+        history = hook.get_sync_run_history(sync_id)
+        expected = history.expected_duration
+        if expected is None:
+            self.log.info("Sync %s has no recent successful runs to learn from.", sync_id)
+        else:
+            eta = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(
+                seconds=expected
+            )
+            self.log.info(
+                "Sync %s usually completes in %.0f seconds (p90: %.0f seconds). "
+                "Expected completion: %s.",
+                sync_id,
+                expected,
+                history.percentile(90),
+                eta.isoformat(timespec="seconds"),
+            )
+            if history.rows_per_second is not None:
+                self.log.info(
+                    "Recent runs synced %.1f rows per second.", history.rows_per_second
+                )
+
+        if timeout == AUTO_TIMEOUT:
+            timeout = history.suggested_timeout() or DEFAULT_TIMEOUT
+            self.log.info("Using a timeout of %.0f seconds.", timeout)
+        if self.use_run_history and poll_strategy is None and history.durations:
+            from airflow_provider_hightouch.polling import AdaptivePollStrategy
+
+            # The first poll waits half the expected duration, so the cap must allow it;
+            # the default 60 second cap would poll a 30 minute sync every minute.
+            poll_strategy = AdaptivePollStrategy(
+                min_interval=self.wait_seconds,
+                max_interval=max(self.wait_seconds, 60, expected / 2),
+                historical_durations=history.durations,
+            )
+        return timeout, poll_strategy
+
+    def _get_hook(self) -> "HightouchHook":
+        from airflow_provider_hightouch.hooks.hightouch import HightouchHook
+
+        return HightouchHook(
             hightouch_conn_id=self.hightouch_conn_id,
             api_version=self.api_version,
+            metric_tags=metrics.task_tags(self),
+            share_connection=True,
+            cache_responses=True,
+            slug_cache=self.slug_cache,
+            rate_limit=self.rate_limit,
+            rate_limit_path=self.rate_limit_path,
+        )
+
+    def _run_state(self, context) -> Tuple[Optional[RunStateStore], Optional[str]]:
+        if not self.reattach_on_retry or not context or "ti" not in context:
+            return None, None
+        store = self.run_state_store or VariableRunStateStore()
+        return store, task_instance_key(context["ti"])
+
+    def _start_or_reattach(self, hook: "HightouchHook", context, sync_id: str) -> str:
+        """Starts a run of the sync, unless a previous try started one that is pending.
+
+        A run slot is taken for the run the task starts or reattaches to, but not for
+        a coalesced run started by another task."""
+        store, key = self._run_state(context)
+        if store is not None:
+            previous = store.get(key)
+            if previous is not None and str(previous[0]) == str(sync_id):
+                request_id = previous[1]
+                status = hook.get_sync_run_details(sync_id, request_id)[0].get("status")
+                if status in PENDING_STATUSES:
+                    self.log.info(
+                        "Reattaching to run %s of sync %s, started by a previous try.",
+                        request_id,
+                        sync_id,
+                    )
+                    self._acquire_slot(hook, context, sync_id)
+                    return request_id
+                self.log.info(
+                    "Run %s from a previous try is %s, starting a new run.",
+                    request_id,
+                    status,
+                )
+
+        if self.coalesce_window is not None:
+            request_id = self._start_or_attach(hook, context, sync_id)
+        else:
+            self._acquire_slot(hook, context, sync_id)
+            request_id = hook.start_sync(sync_id)
+        # A retry finds a shared run through the coalescer again.
+        if store is not None and not self._attached:
+            store.set(key, sync_id, request_id)
+        if context and "ti" in context:
+            context["ti"].xcom_push(key="sync_run_id", value=request_id)
+        return request_id
+
+    def _start_or_attach(self, hook: "HightouchHook", context, sync_id: str) -> str:
+        coalescer = self._coalescer()
+        holder = self._slot_holder(context)
+        request_id = coalescer.attach(hook, sync_id, self.coalesce_window, holder=holder)
+        if request_id is not None:
+            self._attached = True
+            return request_id
+        # Waiting for a slot under the coalescer's lock would hold up every trigger of
+        # the sync, so the slot is taken first and given back if another task started
+        # a run in the meantime.
+        self._acquire_slot(hook, context, sync_id)
+        request_id, self._attached = coalescer.start_or_attach(
+            hook, sync_id, self.coalesce_window, holder=holder
+        )
+        if self._attached:
+            self._release_slot(context)
+        return request_id
+
+    def _coalescer(self) -> "SyncRunCoalescer":
+        from airflow_provider_hightouch.coalesce import get_sync_run_coalescer
+
+        if self.coalesce_path:
+            return get_sync_run_coalescer(path=self.coalesce_path)
+        return get_sync_run_coalescer(variable_prefix="hightouch_coalesced_run")
+
+    def _may_cancel(self, sync_id: str, request_id: str) -> bool:
+        """Whether the task started the run and no other task is attached to it."""
+        if not self.cancel_on_kill or self._attached:
+            return False
+        if self.coalesce_window is None:
+            return True
+        attached = self._coalescer().attached(sync_id, request_id)
+        # Unknown runs may have been shared from another process, so they are kept.
+        return attached == []
+
+    def _cancel_run(self, hook: "HightouchHook", sync_id: str, request_id: str) -> bool:
+        try:
+            hook.cancel_sync_run(sync_id, request_id)
+        except Exception as e:
+            self.log.warning("Failed to cancel sync run %s: %s", request_id, e)
+            return False
+        return True
+
+    def _detach(self, sync_id: str, request_id: str, holder: str) -> None:
+        if self._attached:
+            self._coalescer().detach(sync_id, request_id, holder)
+
+    def _forget_run(self, context) -> None:
+        store, key = self._run_state(context)
+        if store is not None:
+            store.delete(key)
+
+    def _slot_holder(self, context) -> str:
+        if context and "ti" in context:
+            return task_instance_key(context["ti"])
+        return f"{self.dag_id}.{self.task_id}"
+
+    def _priority(self, context) -> int:
+        # The task instance carries the effective weight, which accounts for the
+        # weight_rule, e.g. the sum of downstream weights by default.
+        if context and "ti" in context:
+            return context["ti"].priority_weight
+        return self.priority_weight
+
+    def _acquire_slot(self, hook: "HightouchHook", context, sync_id: str) -> None:
+        """Waits until the destination and model of the sync have a free run slot."""
+        if self.concurrency_limiter is None:
+            return
+        from airflow_provider_hightouch.concurrency import LocalSlotStore
+
+        if self.deferrable and isinstance(self.concurrency_limiter.store, LocalSlotStore):
+            self.log.warning(
+                "The slot store of the concurrency limiter is local to this process, so "
+                "it cannot limit other tasks, and the slot is released by another process "
+                "once the task resumes. Use a VariableSlotStore instead."
+            )
+        waited = self.concurrency_limiter.acquire(
+            self._slot_holder(context),
+            hook.get_sync_details(sync_id, use_cache=True),
+            priority=self._priority(context),
         )
+        if waited:
+            self.log.info("Waited %.0f seconds for a free run slot.", waited)
+
+    def _release_slot(self, context) -> None:
+        if self.concurrency_limiter is not None:
+            self.concurrency_limiter.release(self._slot_holder(context))
+
+    def execute(self, context) -> str:
+        """Start a Hightouch Sync Run"""
+        hook = self._get_hook()
 
         if not self.sync_id and not self.sync_slug:
             raise AirflowException(
@@ -79,24 +420,90 @@ class HightouchTriggerSyncOperator(BaseOperator):
             )
 
         if self.synchronous:
-            self.log.info("Start synchronous request to run a sync.")
-            hightouch_output = hook.sync_and_poll(
-                self.sync_id,
-                self.sync_slug,
-                fail_on_warning=self.error_on_warning,
-                poll_interval=self.wait_seconds,
-                poll_timeout=self.timeout,
-            )
+            sync_id = self.sync_id or hook.get_sync_from_slug(sync_slug=self.sync_slug)
+            timeout, poll_strategy = self._plan_polling(hook, sync_id)
+
+        if self.synchronous and self.deferrable:
+            from airflow_provider_hightouch.triggers.hightouch import HightouchSyncTrigger
+
+            self.log.info("Start deferrable request to run a sync.")
             try:
-                parsed_result = parse_sync_run_details(
-                    hightouch_output.sync_run_details
-                )
-                self.log.info("Sync completed successfully")
-                self.log.info(dict(parsed_result))
-                return parsed_result.id
+                request_id = self._start_or_reattach(hook, context, sync_id)
             except Exception:
-                self.log.warning("Sync ran successfully but failed to parse output.")
-                self.log.warning(hightouch_output)
+                self._release_slot(context)
+                raise
+            # The slot is held while deferred and released by execute_complete.
+            self.defer(
+                trigger=HightouchSyncTrigger(
+                    sync_id=sync_id,
+                    sync_run_id=request_id,
+                    connection_id=self.hightouch_conn_id,
+                    error_on_warning=self.error_on_warning,
+                    poll_interval=self.wait_seconds,
+                    end_time=time.time() + timeout if timeout else None,
+                    poll_strategy=poll_strategy.serialize() if poll_strategy else None,
+                    max_concurrent_requests=self.max_concurrent_requests,
+                    # Coalesced runs are cancelled by execute_complete, if unshared.
+                    cancel_on_timeout=self.cancel_on_kill and self.coalesce_window is None,
+                ),
+                method_name="execute_complete",
+            )
+
+        if self.synchronous:
+            from airflow_provider_hightouch.hooks.hightouch import (
+                HightouchSyncRunFailed,
+                HightouchSyncRunTimeout,
+            )
+
+            self.log.info("Start synchronous request to run a sync.")
+            with metrics.span("sync", sync_id=sync_id):
+                try:
+                    request_id = self._start_or_reattach(hook, context, sync_id)
+                    # Remembered so that on_kill can cancel the run while it is polled.
+                    self._sync_run = (sync_id, request_id)
+                    self._holder = self._slot_holder(context)
+                    try:
+                        hightouch_output = hook.poll_sync(
+                            sync_id,
+                            request_id,
+                            fail_on_warning=self.error_on_warning,
+                            poll_interval=self.wait_seconds,
+                            poll_timeout=timeout,
+                            poll_strategy=poll_strategy,
+                            cancel_on_timeout=self.cancel_on_kill
+                            and self.coalesce_window is None,
+                            fetch_sync_details=self.output_mode == OUTPUT_FULL,
+                        )
+                    except HightouchSyncRunFailed:
+                        self._forget_run(context)
+                        raise
+                    except (HightouchSyncRunTimeout, AirflowTaskTimeout):
+                        # Cancelled here on execution_timeout too: Airflow only calls
+                        # on_kill once the timeout has unwound execute, when the run is
+                        # no longer remembered. Coalesced runs are only cancelled once
+                        # no other task waits on them.
+                        if self._may_cancel(sync_id, request_id) and self._cancel_run(
+                            hook, sync_id, request_id
+                        ):
+                            self._forget_run(context)
+                        raise
+                    else:
+                        self._forget_run(context)
+                    finally:
+                        # The run is remembered when polling fails but the run may still
+                        # be pending, e.g. on API errors or a kill, so a retry can reattach.
+                        self._sync_run = None
+                        self._detach(sync_id, request_id, self._holder)
+                finally:
+                    self._release_slot(context)
+            return self._output(
+                hook,
+                sync_id,
+                request_id,
+                hightouch_output.sync_run_details,
+                hightouch_output.sync_details,
+                context=context,
+            )
 
         else:
             self.log.info("Start async request to run a sync.")
@@ -106,3 +513,535 @@ class HightouchTriggerSyncOperator(BaseOperator):
                 "Successfully created request %s to start sync: %s", request_id, sync
             )
             return request_id
+
+    def on_kill(self) -> None:
+        """Cancel the sync run being polled, if any, unless other tasks share it"""
+        if self._sync_run is None:
+            return
+        sync_id, request_id = self._sync_run
+        if self._may_cancel(sync_id, request_id):
+            self._cancel_run(self._get_hook(), sync_id, request_id)
+        self._detach(sync_id, request_id, self._holder)
+
+    def _run_ended(self, event: Dict[str, Any]) -> bool:
+        """Whether the run reported by a trigger event can no longer be reattached to."""
+        if event["status"] == "success":
+            return True
+        if event.get("sync_run_details") is None:
+            # The trigger failed to poll, the run itself may still be pending.
+            return False
+        if event["status"] == "error":
+            return True
+        # Timed out, the trigger cancelled the run unless it was coalesced.
+        return self.cancel_on_kill and self.coalesce_window is None
+
+    def execute_complete(self, context, event: Dict[str, Any]) -> str:
+        """Resume after the trigger reports that the sync run has finished"""
+        ended = self._run_ended(event)
+        if self.coalesce_window is not None:
+            sync_id, request_id = event["sync_id"], event["sync_run_id"]
+            holder = self._slot_holder(context)
+            # The task may resume in another process, the coalescer knows who attached.
+            attached = self._coalescer().attached(sync_id, request_id)
+            self._attached = attached is None or holder in attached
+            if event["status"] == "timeout" and self._may_cancel(sync_id, request_id):
+                ended = self._cancel_run(self._get_hook(), sync_id, request_id)
+            self._detach(sync_id, request_id, holder)
+        if ended:
+            self._forget_run(context)
+        self._release_slot(context)
+        if event["status"] != "success":
+            raise AirflowException(event["message"])
+
+        self.log.info(event["message"])
+        return self._output(
+            None,
+            event["sync_id"],
+            event["sync_run_id"],
+            event["sync_run_details"],
+            context=context,
+        )
+
+    def _output(
+        self,
+        hook: Optional["HightouchHook"],
+        sync_id: str,
+        request_id: str,
+        sync_run_details: Dict[str, Any],
+        sync_details: Optional[Dict[str, Any]] = None,
+        context=None,
+    ) -> Any:
+        """Builds the return value of a completed run for the configured output mode."""
+        parsed_result = None
+        try:
+            parsed_result = parse_sync_run_details(sync_run_details)
+            self.log.info("Sync completed successfully")
+            self.log.info(parsed_result._asdict())
+        except Exception:
+            self.log.warning("Sync ran successfully but failed to parse output.")
+            self.log.warning(sync_run_details)
+
+        if self.dataset is not None and parsed_result is not None:
+            set_dataset_extra(
+                context,
+                self.dataset,
+                sync_dataset_extra(sync_id, request_id, parsed_result),
+            )
+
+        if self.output_mode == OUTPUT_ID:
+            return request_id
+        output = {"sync_id": sync_id, "sync_run_id": request_id}
+        if self.output_mode == OUTPUT_METRICS:
+            if parsed_result is not None:
+                output["status"] = parsed_result.status
+                output.update(generate_metadata_from_parsed_run(parsed_result))
+            return output
+        if sync_details is None:
+            sync_details = (hook or self._get_hook()).get_sync_details(sync_id)
+        output["sync_run_details"] = sync_run_details
+        output["sync_details"] = sync_details
+        return output
+
+
+class HightouchTriggerSyncsOperator(BaseOperator):
+    """
+    This operator triggers runs for several Syncs in Hightouch at once and waits
+    for all of them to complete, tracking every run from a single poll loop.
+
+    Returns a mapping from each sync ID or slug to the ID of the run it started.
+    Per-sync results (run ID, final status and error) are pushed to the
+    ``sync_results`` XCom.
+
+    :param sync_ids: IDs of the syncs to trigger
+    :type sync_ids: list
+    :param sync_slugs: Slugs of the syncs to trigger
+    :type sync_slugs: list
+    :param connection_id: Name of the connection to use, defaults to hightouch_default
+    :type connection_id: str
+    :param api_version: Hightouch API version. Only v3 is supported.
+    :type api_version: str
+    :param error_on_warning: Should sync warnings be treated as errors or ignored?
+    :type error_on_warning: bool
+    :param wait_seconds: Time to wait in between subsequent polls to the API.
+    :type wait_seconds: float
+    :param timeout: Maximum time to wait for all syncs to complete before aborting
+    :type timeout: int
+    :param failure_policy: ``fail_fast`` fails the task as soon as one sync fails,
+        ``collect_all`` waits for every sync and then fails if any of them failed
+    :type failure_policy: str
+    :param cancel_on_kill: Whether to cancel the runs still in progress when the task
+        is killed, times out or fails fast
+    :type cancel_on_kill: bool
+    :param slug_cache: Cache the sync slugs are resolved through, see
+        :py:class:`HightouchTriggerSyncOperator`. Slugs missing from it are resolved
+        together from the sync listing before any run starts.
+    :type slug_cache: SlugCache
+    :param rate_limit: Requests per second that the tasks of this connection may send,
+        see :py:class:`HightouchTriggerSyncOperator`
+    :type rate_limit: float
+    :param rate_limit_path: File through which worker processes on the same host
+        share ``rate_limit``
+    :type rate_limit_path: str
+    """
+
+    operator_extra_links = (HightouchLink(),)
+    template_fields = ("sync_ids", "sync_slugs")
+
+    @apply_defaults
+    def __init__(
+        self,
+        sync_ids: Optional[List[str]] = None,
+        sync_slugs: Optional[List[str]] = None,
+        connection_id: str = "hightouch_default",
+        api_version: str = "v3",
+        error_on_warning: bool = False,
+        wait_seconds: float = 3,
+        timeout: int = 3600,
+        failure_policy: str = FAIL_FAST,
+        cancel_on_kill: bool = True,
+        slug_cache: Optional["SlugCache"] = None,
+        rate_limit: Optional[float] = None,
+        rate_limit_path: Optional[str] = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        if failure_policy not in FAILURE_POLICIES:
+            raise AirflowException(
+                f"failure_policy must be one of {FAILURE_POLICIES}, got {failure_policy}"
+            )
+        self.hightouch_conn_id = connection_id
+        self.api_version = api_version
+        # Kept as given so they can be templated or resolved from XComs.
+        self.sync_ids = sync_ids or []
+        self.sync_slugs = sync_slugs or []
+        self.error_on_warning = error_on_warning
+        self.wait_seconds = wait_seconds
+        self.timeout = timeout
+        self.failure_policy = failure_policy
+        self.cancel_on_kill = cancel_on_kill
+        self.slug_cache = slug_cache
+        self.rate_limit = rate_limit
+        self.rate_limit_path = rate_limit_path
+        self._in_flight: Dict[str, Tuple[str, str]] = {}
+
+    def _get_hook(self) -> "HightouchHook":
+        from airflow_provider_hightouch.hooks.hightouch import HightouchHook
+
+        return HightouchHook(
+            hightouch_conn_id=self.hightouch_conn_id,
+            api_version=self.api_version,
+            slug_cache=self.slug_cache,
+            rate_limit=self.rate_limit,
+            rate_limit_path=self.rate_limit_path,
+        )
+
+    def _get_async_hook(self, tags: Dict[str, str]) -> "AsyncHightouchHook":
+        from airflow_provider_hightouch.hooks.hightouch import AsyncHightouchHook
+
+        return AsyncHightouchHook(
+            hightouch_conn_id=self.hightouch_conn_id,
+            api_version=self.api_version,
+            slug_cache=self.slug_cache,
+            metric_tags=tags,
+            rate_limit=self.rate_limit,
+            rate_limit_path=self.rate_limit_path,
+        )
+
+    async def _start(self, hook: "AsyncHightouchHook", sync_id=None, sync_slug=None):
+        if not sync_id:
+            # Resolved before triggering, so a failed lookup cannot orphan a started run.
+            sync_id = await hook.get_sync_from_slug(sync_slug=sync_slug)
+        return sync_id, await hook.start_sync(sync_id=sync_id)
+
+    def _record_failure(self, message: str):
+        self.log.error(message)
+        if self.failure_policy == FAIL_FAST:
+            raise AirflowException(message)
+
+    async def _cancel_in_flight(self, hook: "AsyncHightouchHook") -> None:
+        runs = list(self._in_flight.values())
+        cancelled = await asyncio.gather(
+            *(hook.cancel_sync_run(sync_id, run_id) for sync_id, run_id in runs),
+            return_exceptions=True,
+        )
+        for (_, run_id), result in zip(runs, cancelled):
+            if isinstance(result, BaseException):
+                self.log.warning("Failed to cancel sync run %s: %s", run_id, result)
+
+    async def _start_runs(
+        self,
+        hook: "AsyncHightouchHook",
+        refs: List[Tuple[str, Dict[str, str]]],
+        results: Dict[str, Dict[str, Any]],
+        polls: Dict[str, int],
+        tags: Dict[str, str],
+    ) -> None:
+        """Start a run for each ``(key, {"sync_id" | "sync_slug": ...})`` in ``refs``"""
+        started = await asyncio.gather(
+            *(self._start(hook, **ref) for _, ref in refs), return_exceptions=True
+        )
+        failures = []
+        for (key, _), start in zip(refs, started):
+            if isinstance(start, BaseException):
+                results[key] = {
+                    "sync_id": None,
+                    "sync_run_id": None,
+                    "status": FAILED,
+                    "error": str(start),
+                }
+                failures.append(f"Failed to trigger sync {key}: {start}")
+                continue
+            sync_id, sync_run_id = start
+            self.log.info("Started run %s for sync %s", sync_run_id, key)
+            self._in_flight[key] = (sync_id, sync_run_id)
+            polls[key] = 0
+            metrics.in_flight_runs.add(1, tags)
+        # Only once every started run is in flight, so failing fast can cancel them all.
+        for message in failures:
+            self._record_failure(message)
+
+    async def _poll_in_flight(
+        self,
+        hook: "AsyncHightouchHook",
+        results: Dict[str, Dict[str, Any]],
+        polls: Dict[str, int],
+        tags: Dict[str, str],
+    ) -> List[str]:
+        """Poll every run in flight once, and return the keys of those that finished"""
+        in_flight = self._in_flight
+        details = await asyncio.gather(
+            *(
+                hook.get_sync_run_details(sync_id, sync_run_id)
+                for sync_id, sync_run_id in in_flight.values()
+            ),
+            return_exceptions=True,
+        )
+        finished = []
+        for key, sync_run_details in zip(list(in_flight), details):
+            if isinstance(sync_run_details, BaseException):
+                # A failed status request is retried on the next poll.
+                self.log.warning("Failed to poll sync %s: %s", key, sync_run_details)
+                continue
+            run = parse_sync_run_details(sync_run_details[0])
+            polls[key] += 1
+            if run.status not in TERMINAL_STATUSES:
+                continue
+            sync_id, sync_run_id = in_flight.pop(key)
+            finished.append(key)
+            metrics.in_flight_runs.add(-1, tags)
+            metrics.timing(
+                "sync_run.polls", polls[key], tags={**tags, "status": run.status}
+            )
+            results[key] = {
+                "sync_id": sync_id,
+                "sync_run_id": sync_run_id,
+                "status": run.status,
+                "error": run.error,
+            }
+            if is_successful_status(run.status, self.error_on_warning):
+                self.log.info("Sync %s completed with status %s", key, run.status)
+            else:
+                self._record_failure(
+                    f"Sync {sync_id} for request: {sync_run_id} failed with "
+                    f"status: {run.status} and error:  {run.error}",
+                )
+        return finished
+
+    async def _trigger_and_poll(self) -> Dict[str, Dict[str, Any]]:
+        from airflow_provider_hightouch.hooks.hightouch import AsyncHightouchHook
+
+        tags = metrics.task_tags(self)
+        hook = self._get_async_hook(tags)
+        refs = [(sync_id, {"sync_id": sync_id}) for sync_id in self.sync_ids] + [
+            (slug, {"sync_slug": slug}) for slug in self.sync_slugs
+        ]
+        results: Dict[str, Dict[str, Any]] = {}
+        # Shared with on_kill, which cancels whatever is still in flight.
+        in_flight = self._in_flight = {}
+        polls: Dict[str, int] = {}
+        try:
+            await self._start_runs(hook, refs, results, polls, tags)
+
+            poll_start = time.monotonic()
+            while in_flight:
+                await self._poll_in_flight(hook, results, polls, tags)
+                if not in_flight:
+                    break
+                self.log.info(
+                    "Waiting on %d of %d Hightouch syncs.", len(in_flight), len(refs)
+                )
+                if self.timeout and time.monotonic() - poll_start > self.timeout:
+                    raise AirflowException(
+                        f"Syncs {sorted(in_flight)} timed out after {self.timeout} seconds."
+                    )
+                await asyncio.sleep(self.wait_seconds)
+        except Exception:
+            if self.cancel_on_kill and in_flight:
+                await self._cancel_in_flight(hook)
+            raise
+        finally:
+            metrics.in_flight_runs.add(-len(in_flight), tags)
+            await AsyncHightouchHook.close_sessions()
+        return results
+
+    def on_kill(self) -> None:
+        """Cancel the sync runs that are still in progress"""
+        if not self.cancel_on_kill:
+            return
+        hook = self._get_hook()
+        for sync_id, run_id in list(self._in_flight.values()):
+            try:
+                hook.cancel_sync_run(sync_id, run_id)
+            except Exception as e:
+                self.log.warning("Failed to cancel sync run %s: %s", run_id, e)
+
+    def execute(self, context) -> Dict[str, Optional[str]]:
+        """Start every Hightouch Sync Run and wait for all of them to finish"""
+        if not self.sync_ids and not self.sync_slugs:
+            raise AirflowException(
+                "At least one of sync_ids or sync_slugs must be provided to trigger syncs"
+            )
+
+        if self.sync_slugs:
+            try:
+                # One listing resolves every slug, instead of a lookup per sync.
+                self._get_hook().prefetch_sync_slugs(self.sync_slugs)
+            except Exception as e:
+                self.log.warning("Failed to prefetch sync slugs: %s", e)
+        results = asyncio.run(self._trigger_and_poll())
+        if context and "ti" in context:
+            context["ti"].xcom_push(key="sync_results", value=results)
+
+        failed = {
+            key: result
+            for key, result in results.items()
+            if not is_successful_status(result["status"], self.error_on_warning)
+        }
+        if failed:
+            raise AirflowException(f"{len(failed)} of {len(results)} syncs failed: {failed}")
+        return {key: result["sync_run_id"] for key, result in results.items()}
+
+
+class HightouchSyncGraphOperator(HightouchTriggerSyncsOperator):
+    """
+    This operator runs a graph of dependent Hightouch Syncs from a single task.
+    Each sync is triggered as soon as all of its upstream syncs have succeeded,
+    independent branches run in parallel, and every run in flight is polled from
+    one shared loop. Syncs downstream of a failed sync are not triggered.
+
+    :param sync_graph: Maps each sync to the list of syncs it depends on. Syncs
+        only referenced as upstreams are run too.
+    :type sync_graph: Dict[str, List[str]]
+    :param identify_by: Whether the keys of ``sync_graph`` are sync ``id`` or ``slug``
+    :type identify_by: str
+    :param max_active_syncs: Maximum number of sync runs in flight at once,
+        unlimited when None
+    :type max_active_syncs: int
+    :param connection_id: Name of the connection to use, defaults to hightouch_default
+    :type connection_id: str
+    :param api_version: Hightouch API version. Only v3 is supported.
+    :type api_version: str
+    :param error_on_warning: Should sync warnings be treated as errors or ignored?
+    :type error_on_warning: bool
+    :param wait_seconds: Time to wait in between subsequent polls to the API.
+    :type wait_seconds: float
+    :param timeout: Maximum time to wait for the whole graph to complete before aborting
+    :type timeout: int
+    :param failure_policy: ``fail_fast`` fails the task as soon as one sync fails,
+        ``collect_all`` runs every branch that can still run and then fails if any
+        sync failed
+    :type failure_policy: str
+    :param cancel_on_kill: Whether to cancel the runs still in progress when the task
+        is killed, times out or fails fast
+    :type cancel_on_kill: bool
+    :param slug_cache: Cache the sync slugs are resolved through, see
+        :py:class:`HightouchTriggerSyncOperator`. Slugs missing from it are resolved
+        together from the sync listing before any run starts.
+    :type slug_cache: SlugCache
+    :param rate_limit: Requests per second that the tasks of this connection may send,
+        see :py:class:`HightouchTriggerSyncOperator`
+    :type rate_limit: float
+    :param rate_limit_path: File through which worker processes on the same host
+        share ``rate_limit``
+    :type rate_limit_path: str
+    """
+
+    template_fields = ()
+
+    @apply_defaults
+    def __init__(
+        self,
+        sync_graph: Dict[str, List[str]],
+        identify_by: str = "id",
+        max_active_syncs: Optional[int] = None,
+        **kwargs,
+    ):
+        if identify_by not in ("id", "slug"):
+            raise AirflowException(f"identify_by must be id or slug, got {identify_by}")
+        if max_active_syncs is not None and max_active_syncs < 1:
+            raise AirflowException("max_active_syncs must be at least 1")
+        self.sync_graph = {
+            key: list(upstreams) for key, upstreams in sync_graph.items()
+        }
+        for upstreams in list(self.sync_graph.values()):
+            for upstream in upstreams:
+                self.sync_graph.setdefault(upstream, [])
+        self.sync_order = self._topological_order(self.sync_graph)
+        if identify_by == "id":
+            kwargs["sync_ids"] = self.sync_order
+        else:
+            kwargs["sync_slugs"] = self.sync_order
+        super().__init__(**kwargs)
+        self.identify_by = identify_by
+        self.max_active_syncs = max_active_syncs
+
+    @staticmethod
+    def _topological_order(graph: Dict[str, List[str]]) -> List[str]:
+        remaining = {key: set(upstreams) for key, upstreams in graph.items()}
+        order: List[str] = []
+        while remaining:
+            ready = [key for key, upstreams in remaining.items() if not upstreams]
+            if not ready:
+                raise AirflowException(
+                    f"sync_graph has a cycle between syncs {sorted(remaining)}"
+                )
+            for key in ready:
+                order.append(key)
+                del remaining[key]
+            for upstreams in remaining.values():
+                upstreams.difference_update(ready)
+        return order
+
+    async def _trigger_and_poll(self) -> Dict[str, Dict[str, Any]]:
+        from airflow_provider_hightouch.hooks.hightouch import AsyncHightouchHook
+
+        tags = metrics.task_tags(self)
+        hook = self._get_async_hook(tags)
+        ref = "sync_id" if self.identify_by == "id" else "sync_slug"
+        pending = {key: set(self.sync_graph[key]) for key in self.sync_order}
+        succeeded: set = set()
+        results: Dict[str, Dict[str, Any]] = {}
+        # Shared with on_kill, which cancels whatever is still in flight.
+        in_flight = self._in_flight = {}
+        polls: Dict[str, int] = {}
+        try:
+            poll_start = time.monotonic()
+            while True:
+                # A sync whose upstream did not succeed will never run.
+                for key in list(pending):
+                    failed = sorted(
+                        u for u in pending[key] if u in results and u not in succeeded
+                    )
+                    if failed:
+                        del pending[key]
+                        results[key] = {
+                            "sync_id": None,
+                            "sync_run_id": None,
+                            "status": UPSTREAM_FAILED,
+                            "error": f"Upstream syncs {failed} did not succeed",
+                        }
+                        self.log.warning("Skipping sync %s: upstream failed", key)
+
+                ready = [key for key in pending if pending[key] <= succeeded]
+                if self.max_active_syncs is not None:
+                    ready = ready[: max(self.max_active_syncs - len(in_flight), 0)]
+                for key in ready:
+                    del pending[key]
+                await self._start_runs(
+                    hook, [(key, {ref: key}) for key in ready], results, polls, tags
+                )
+                if not in_flight:
+                    if pending:
+                        # Failed starts may have unblocked skips, or freed slots.
+                        continue
+                    break
+
+                finished = await self._poll_in_flight(hook, results, polls, tags)
+                succeeded.update(
+                    key
+                    for key in finished
+                    if is_successful_status(results[key]["status"], self.error_on_warning)
+                )
+                if finished and pending:
+                    # Trigger newly unblocked syncs without waiting for the next poll.
+                    continue
+                if not in_flight:
+                    continue
+                self.log.info(
+                    "Waiting on %d Hightouch syncs, %d more to run.",
+                    len(in_flight),
+                    len(pending),
+                )
+                if self.timeout and time.monotonic() - poll_start > self.timeout:
+                    raise AirflowException(
+                        f"Syncs {sorted(in_flight)} timed out after {self.timeout} seconds."
+                    )
+                await asyncio.sleep(self.wait_seconds)
+        except Exception:
+            if self.cancel_on_kill and in_flight:
+                await self._cancel_in_flight(hook)
+            raise
+        finally:
+            metrics.in_flight_runs.add(-len(in_flight), tags)
+            await AsyncHightouchHook.close_sessions()
+        return results
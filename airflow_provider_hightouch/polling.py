@@ -0,0 +1,175 @@
+import datetime
+import time
+from statistics import median
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from airflow.utils.module_loading import import_string
+
+from .consts import DEFAULT_POLL_INTERVAL
+
+
+class PollStrategy:
+    """
+    Decides how long to wait before the next poll of a sync run.
+
+    Strategies may keep state about the run being polled. ``reset`` is called
+    before polling a new run, and ``next_interval`` after every poll with the
+    parsed run that poll returned.
+    """
+
+    def reset(self) -> None:
+        """Forget anything learned about the previously polled run."""
+
+    def next_interval(self, run) -> float:
+        """Returns the number of seconds to wait before polling ``run`` again."""
+        raise NotImplementedError
+
+    def serialize(self) -> Tuple[str, Dict[str, Any]]:
+        """Returns the classpath and keyword arguments to rebuild this strategy."""
+        cls = type(self)
+        return f"{cls.__module__}.{cls.__qualname__}", self._serialize_kwargs()
+
+    def _serialize_kwargs(self) -> Dict[str, Any]:
+        raise NotImplementedError
+
+
+def deserialize_poll_strategy(serialized: Tuple[str, Dict[str, Any]]) -> PollStrategy:
+    """Rebuilds a strategy from the output of :py:meth:`PollStrategy.serialize`."""
+    classpath, kwargs = serialized
+    return import_string(classpath)(**kwargs)
+
+
+class FixedPollStrategy(PollStrategy):
+    """
+    Polls at a constant interval.
+
+    Args:
+        interval (float): The time in seconds between successive polls
+    """
+
+    def __init__(self, interval: float = DEFAULT_POLL_INTERVAL):
+        self.interval = interval
+
+    def next_interval(self, run) -> float:
+        return self.interval
+
+    def _serialize_kwargs(self) -> Dict[str, Any]:
+        return {"interval": self.interval}
+
+
+class ExponentialBackoffPollStrategy(PollStrategy):
+    """
+    Polls quickly at first and then backs off geometrically up to a cap.
+
+    Args:
+        initial_interval (float): The time in seconds before the second poll
+        multiplier (float): Factor applied to the interval after every poll
+        max_interval (float): The longest time in seconds between two polls
+    """
+
+    def __init__(
+        self,
+        initial_interval: float = DEFAULT_POLL_INTERVAL,
+        multiplier: float = 2.0,
+        max_interval: float = 60,
+    ):
+        self.initial_interval = initial_interval
+        self.multiplier = multiplier
+        self.max_interval = max_interval
+        self._next = initial_interval
+
+    def reset(self) -> None:
+        self._next = self.initial_interval
+
+    def next_interval(self, run) -> float:
+        interval = self._next
+        self._next = min(self._next * self.multiplier, self.max_interval)
+        return interval
+
+    def _serialize_kwargs(self) -> Dict[str, Any]:
+        return {
+            "initial_interval": self.initial_interval,
+            "multiplier": self.multiplier,
+            "max_interval": self.max_interval,
+        }
+
+
+class AdaptivePollStrategy(PollStrategy):
+    """
+    Schedules the next poll from an estimate of the time the run has left.
+
+    Two estimates are used when available: the average rate at which
+    ``completion_ratio`` has moved since polling began, and the median duration
+    of previous runs of the sync minus the time this run has been going. The
+    next poll waits ``safety_factor`` times the smaller estimate, clamped to
+    ``[min_interval, max_interval]``. Until an estimate exists the interval
+    grows geometrically from ``min_interval``.
+
+    Args:
+        min_interval (float): The shortest time in seconds between two polls
+        max_interval (float): The longest time in seconds between two polls
+        historical_durations (Sequence[float]): Durations in seconds of previous runs
+        safety_factor (float): Fraction of the estimated time remaining to wait
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 1,
+        max_interval: float = 60,
+        historical_durations: Optional[Sequence[float]] = None,
+        safety_factor: float = 0.5,
+    ):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.historical_durations = list(historical_durations or [])
+        self.safety_factor = safety_factor
+        self._expected_duration = (
+            median(self.historical_durations) if self.historical_durations else None
+        )
+        self.reset()
+
+    def reset(self) -> None:
+        self._first_sample: Optional[Tuple[float, float]] = None
+        self._started = time.monotonic()
+        self._fallback = self.min_interval
+
+    def _elapsed(self, run, now: float) -> float:
+        if getattr(run, "started_at", None):
+            started_at = run.started_at
+            if started_at.tzinfo is None:
+                started_at = started_at.replace(tzinfo=datetime.timezone.utc)
+            return (datetime.datetime.now(datetime.timezone.utc) - started_at).total_seconds()
+        return now - self._started
+
+    def next_interval(self, run) -> float:
+        now = time.monotonic()
+        ratio = run.completion_ratio or 0.0
+        estimates = []
+
+        if self._first_sample is None:
+            self._first_sample = (now, ratio)
+        else:
+            first_time, first_ratio = self._first_sample
+            if ratio > first_ratio and now > first_time:
+                rate = (ratio - first_ratio) / (now - first_time)
+                estimates.append((1.0 - ratio) / rate)
+
+        if self._expected_duration is not None:
+            remaining = self._expected_duration - self._elapsed(run, now)
+            if remaining > 0:
+                estimates.append(remaining)
+
+        if not estimates:
+            interval = self._fallback
+            self._fallback = min(self._fallback * 2, self.max_interval)
+        else:
+            interval = self.safety_factor * min(estimates)
+        return max(self.min_interval, min(interval, self.max_interval))
+
+    def _serialize_kwargs(self) -> Dict[str, Any]:
+        return {
+            "min_interval": self.min_interval,
+            "max_interval": self.max_interval,
+            "historical_durations": self.historical_durations,
+            "safety_factor": self.safety_factor,
+        }
@@ -0,0 +1,173 @@
+import asyncio
+import datetime
+import json
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+RETRYABLE_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+
+
+def is_retryable_status(status_code: int) -> bool:
+    """Whether a request that failed with this HTTP status may be retried."""
+    return status_code in RETRYABLE_STATUS_CODES
+
+
+def retry_after_seconds(headers: Mapping[str, str]) -> Optional[float]:
+    """Parses a ``Retry-After`` header given in seconds or as an HTTP date."""
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return max((retry_at - now).total_seconds(), 0.0)
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Exponential backoff with jitter: between half and all of ``base * 2**attempt``."""
+    delay = min(cap, base * 2 ** attempt)
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+class RateLimiter:
+    """
+    Token bucket shared by every request that goes through it.
+
+    Callers reserve a token before each request and wait for as long as the
+    bucket says. Tokens refill at ``rate`` per second up to ``capacity``, and
+    ``penalize`` stops every caller until a given delay has passed, which is
+    how ``Retry-After`` responses are honored.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+
+    def _update(self, state: Dict[str, float], now: float, tokens: float, hold: float):
+        """Refills ``state``, reserves ``tokens`` and returns the wait in seconds."""
+        elapsed = max(now - state["updated_at"], 0.0)
+        state["tokens"] = min(self.capacity, state["tokens"] + elapsed * self.rate)
+        state["updated_at"] = now
+        if hold:
+            state["blocked_until"] = max(state["blocked_until"], now + hold)
+        if not tokens:
+            return 0.0
+        state["tokens"] -= tokens
+        wait = -state["tokens"] / self.rate if state["tokens"] < 0 else 0.0
+        return max(wait, state["blocked_until"] - now)
+
+    def _reserve(self, tokens: float = 1.0, hold: float = 0.0) -> float:
+        raise NotImplementedError
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Blocks until a request may be sent. Returns the time spent waiting."""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """Waits without blocking the event loop until a request may be sent."""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def penalize(self, seconds: float) -> None:
+        """Holds back every caller for ``seconds``, e.g. after a 429 response."""
+        self._reserve(0.0, hold=seconds)
+
+
+class TokenBucketRateLimiter(RateLimiter):
+    """Token bucket shared by the threads of one process."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        super().__init__(rate, capacity)
+        self._lock = threading.Lock()
+        self._state = {
+            "tokens": self.capacity,
+            "updated_at": time.monotonic(),
+            "blocked_until": 0.0,
+        }
+
+    def _reserve(self, tokens: float = 1.0, hold: float = 0.0) -> float:
+        with self._lock:
+            return self._update(self._state, time.monotonic(), tokens, hold)
+
+
+class FileTokenBucketRateLimiter(RateLimiter):
+    """
+    Token bucket shared by every process on a host through a locked state file.
+
+    Args:
+        path (str): File holding the bucket state. Processes using the same path
+            share the same bucket.
+    """
+
+    def __init__(self, path: str, rate: float, capacity: Optional[float] = None):
+        if fcntl is None:
+            raise RuntimeError("FileTokenBucketRateLimiter requires fcntl")
+        super().__init__(rate, capacity)
+        self.path = path
+
+    def _reserve(self, tokens: float = 1.0, hold: float = 0.0) -> float:
+        with open(self.path, "a+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                now = time.time()
+                try:
+                    state = json.loads(f.read())
+                except ValueError:
+                    state = {"tokens": self.capacity, "updated_at": now, "blocked_until": 0.0}
+                wait = self._update(state, now, tokens, hold)
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state))
+                f.flush()
+                return wait
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+_shared_limiters: Dict[Tuple[str, float, Optional[float]], RateLimiter] = {}
+_shared_limiters_lock = threading.Lock()
+
+
+def get_shared_rate_limiter(
+    key: str, rate: float, capacity: Optional[float] = None, path: Optional[str] = None
+) -> RateLimiter:
+    """
+    Returns the process-wide limiter for ``key``, creating it on first use.
+
+    When ``path`` is given the bucket lives in that file and is shared with other
+    processes; otherwise it is local to this process.
+    """
+    registry_key = (path or key, rate, capacity)
+    with _shared_limiters_lock:
+        limiter = _shared_limiters.get(registry_key)
+        if limiter is None:
+            if path:
+                limiter = FileTokenBucketRateLimiter(path, rate, capacity)
+            else:
+                limiter = TokenBucketRateLimiter(rate, capacity)
+            _shared_limiters[registry_key] = limiter
+        return limiter
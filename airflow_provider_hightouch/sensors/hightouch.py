@@ -1,15 +1,23 @@
-from typing import Optional
+import time
+from typing import Any, Dict, Optional
 
 from airflow.models.baseoperator import BaseOperatorLink
 from airflow.sensors.base import BaseSensorOperator
 
-from airflow.exceptions import AirflowException
+from airflow.exceptions import AirflowException, AirflowSensorTimeout, AirflowSkipException
 from airflow.utils.decorators import apply_defaults
 
-from airflow_provider_hightouch.hooks.hightouch import HightouchHook
+from airflow_provider_hightouch import metrics
+from airflow_provider_hightouch.consts import SUCCESS, TERMINAL_STATUSES, WARNING
+from airflow_provider_hightouch.datasets import (
+    set_dataset_extra,
+    sync_dataset,
+    sync_dataset_extra,
+)
 from airflow_provider_hightouch.utils import parse_sync_run_details
 
-from airflow_provider_hightouch.consts import *
+# The hook, multiplexer and trigger are imported on first poke rather than when
+# DAG files are parsed, as they pull in requests, aiohttp and the HTTP provider.
 
 
 class HightouchLink(BaseOperatorLink):
@@ -37,9 +45,30 @@ class HightouchSyncRunSensor(BaseSensorOperator):
     :type api_version: str
     :param error_on_warning: Should sync warnings be treated as errors or ignored?
     :type error_on_warning: bool
+    :param multiplex: Read the run status from the process-wide status multiplexer,
+        which fetches the runs of each sync once for every sensor watching it
+    :type multiplex: bool
+    :param multiplex_path: File through which sensors in other processes on the same
+        host share the statuses fetched by the multiplexer
+    :type multiplex_path: str
+    :param deferrable: Whether to wait for the sync run on the triggerer instead of
+        holding a worker slot or rescheduling between pokes
+    :type deferrable: bool
+    :param emit_dataset: Declare the sync as an outlet Dataset,
+        ``hightouch://sync/<sync_id>``, so DAGs scheduled on it run when the sensor
+        sees the run succeed. On Airflow 2.10+ the dataset event carries the run's
+        status and row counts as its extra.
+    :type emit_dataset: bool
+    :param rate_limit: Requests per second that the sensors of this connection may
+        send from a worker process, or from every process sharing ``rate_limit_path``
+    :type rate_limit: float
+    :param rate_limit_path: File through which worker processes on the same host
+        share ``rate_limit``
+    :type rate_limit_path: str
     """
 
     operator_extra_links = (HightouchLink(),)
+    template_fields = ("sync_id", "sync_run_id")
 
     @apply_defaults
     def __init__(
@@ -49,6 +78,12 @@ class HightouchSyncRunSensor(BaseSensorOperator):
         connection_id: str = "hightouch_default",
         api_version: str = "v3",
         error_on_warning: bool = False,
+        multiplex: bool = False,
+        multiplex_path: Optional[str] = None,
+        deferrable: bool = False,
+        emit_dataset: bool = False,
+        rate_limit: Optional[float] = None,
+        rate_limit_path: Optional[str] = None,
         **kwargs,
     ):
         super().__init__(**kwargs)
@@ -57,22 +92,58 @@ class HightouchSyncRunSensor(BaseSensorOperator):
         self.sync_run_id = sync_run_id
         self.sync_id = sync_id
         self.error_on_warning = error_on_warning
+        self.multiplex = multiplex
+        self.multiplex_path = multiplex_path
+        self.deferrable = deferrable
+        self.rate_limit = rate_limit
+        self.rate_limit_path = rate_limit_path
+        self.dataset = sync_dataset(sync_id) if emit_dataset else None
+        if self.dataset is not None:
+            self.outlets = [*self.outlets, self.dataset]
+
+    def _get_multiplexer(self):
+        from airflow_provider_hightouch.multiplexer import get_status_multiplexer
+
+        return get_status_multiplexer(
+            hightouch_conn_id=self.hightouch_conn_id,
+            api_version=self.api_version,
+            path=self.multiplex_path,
+            refresh_interval=self.poke_interval,
+            rate_limit=self.rate_limit,
+            rate_limit_path=self.rate_limit_path,
+        )
+
+    def _get_sync_run_details(self):
+        if self.multiplex:
+            return self._get_multiplexer().get_sync_run_details(
+                self.sync_id, self.sync_run_id
+            )
+
+        from airflow_provider_hightouch.hooks.hightouch import HightouchHook
 
-    def poke(self, context) -> bool:
         hook = HightouchHook(
             hightouch_conn_id=self.hightouch_conn_id,
             api_version=self.api_version,
+            metric_tags=metrics.task_tags(self),
+            share_connection=True,
+            rate_limit=self.rate_limit,
+            rate_limit_path=self.rate_limit_path,
         )
-
-        sync_run_details = hook.get_sync_run_details(
+        return hook.get_sync_run_details(
             self.sync_id,
             self.sync_run_id
         )[0]
 
-        run = parse_sync_run_details(
-            sync_run_details
-        )
+    def _record_success(self, context, run) -> None:
+        if self.dataset is not None:
+            set_dataset_extra(
+                context,
+                self.dataset,
+                sync_dataset_extra(self.sync_id, self.sync_run_id, run),
+            )
 
+    def _check_run(self, run) -> bool:
+        """Whether the run has finished successfully. Raises if it has failed."""
         if run.status in TERMINAL_STATUSES:
             self.log.info(f"Sync request status: {run.status}.")
             if run.error:
@@ -83,8 +154,53 @@ class HightouchSyncRunSensor(BaseSensorOperator):
             if run.status == WARNING and not self.error_on_warning:
                 return True
             raise AirflowException(
-                f"Sync {self.sync_id} for request: {self.sync_request_id} failed with status: "
+                f"Sync {self.sync_id} for request: {self.sync_run_id} failed with status: "
                 f"{run.status} and error:  {run.error}"
             )
 
         return False
+
+    def poke(self, context) -> bool:
+        sync_run_details = self._get_sync_run_details()
+
+        run = parse_sync_run_details(
+            sync_run_details
+        )
+
+        if run.status in TERMINAL_STATUSES and self.multiplex:
+            self._get_multiplexer().unregister(self.sync_id, self.sync_run_id)
+        if not self._check_run(run):
+            return False
+        self._record_success(context, run)
+        return True
+
+    def execute(self, context) -> None:
+        if not self.deferrable:
+            return super().execute(context)
+        if self.poke(context):
+            return None
+        from airflow_provider_hightouch.triggers.hightouch import HightouchSyncTrigger
+
+        self.defer(
+            trigger=HightouchSyncTrigger(
+                sync_id=self.sync_id,
+                sync_run_id=self.sync_run_id,
+                connection_id=self.hightouch_conn_id,
+                error_on_warning=self.error_on_warning,
+                poll_interval=self.poke_interval,
+                end_time=time.time() + self.timeout if self.timeout else None,
+            ),
+            method_name="execute_complete",
+        )
+
+    def execute_complete(self, context, event: Dict[str, Any]) -> None:
+        """Resume once the trigger reports that the sync run has finished"""
+        if event["status"] == "timeout":
+            if self.soft_fail:
+                raise AirflowSkipException(event["message"])
+            raise AirflowSensorTimeout(event["message"])
+        if not event.get("sync_run_details"):
+            raise AirflowException(event["message"])
+        run = parse_sync_run_details(event["sync_run_details"])
+        if self._check_run(run):
+            self._record_success(context, run)
@@ -0,0 +1,91 @@
+import json
+import time
+from typing import Optional, Tuple
+
+
+def task_instance_key(ti) -> str:
+    """Identifies a task instance across its tries."""
+    return f"{ti.dag_id}.{ti.task_id}.{ti.run_id}.{getattr(ti, 'map_index', -1)}"
+
+
+class RunStateStore:
+    """
+    Remembers the sync run started by a task instance, so a retry of the task
+    can find it again. XComs cannot be used for this, as Airflow clears them
+    when a task instance starts a new try.
+    """
+
+    def get(self, key: str) -> Optional[Tuple[str, str]]:
+        """Returns the sync ID and sync run ID saved under ``key``, if any."""
+        raise NotImplementedError
+
+    def set(self, key: str, sync_id: str, sync_run_id: str) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+
+class VariableRunStateStore(RunStateStore):
+    """
+    Stores the sync run of each task instance as an Airflow Variable named
+    ``<prefix>__<dag_id>.<task_id>.<run_id>.<map_index>``.
+
+    Runs saved more than ``ttl`` seconds ago are ignored, and are deleted whenever
+    another run is saved, so the Variables of task instances that are never retried
+    do not pile up.
+
+    Args:
+        prefix (str): Prefix of the Variable keys
+        ttl (float): Seconds after which a saved run is no longer reattached to
+    """
+
+    def __init__(self, prefix: str = "hightouch_run", ttl: float = 2 * 24 * 3600):
+        self.prefix = prefix
+        self.ttl = ttl
+
+    def _expired(self, entry) -> bool:
+        return time.time() - entry.get("saved_at", 0) > self.ttl
+
+    def get(self, key: str) -> Optional[Tuple[str, str]]:
+        from airflow.models import Variable
+
+        entry = Variable.get(
+            f"{self.prefix}__{key}", default_var=None, deserialize_json=True
+        )
+        if entry and not self._expired(entry):
+            return entry["sync_id"], entry["sync_run_id"]
+        return None
+
+    def set(self, key: str, sync_id: str, sync_run_id: str) -> None:
+        from airflow.models import Variable
+
+        self.delete_expired()
+        Variable.set(
+            f"{self.prefix}__{key}",
+            {"sync_id": sync_id, "sync_run_id": sync_run_id, "saved_at": time.time()},
+            serialize_json=True,
+        )
+
+    def delete(self, key: str) -> None:
+        from airflow.models import Variable
+
+        Variable.delete(f"{self.prefix}__{key}")
+
+    def delete_expired(self) -> None:
+        """Deletes the runs saved more than ``ttl`` seconds ago."""
+        from airflow.models import Variable
+        from airflow.utils.session import create_session
+
+        with create_session() as session:
+            # "_" is a LIKE wildcard, so matches are checked against the prefix again.
+            query = session.query(Variable).filter(Variable.key.like(f"{self.prefix}%"))
+            for variable in query:
+                if not variable.key.startswith(f"{self.prefix}__"):
+                    continue
+                try:
+                    entry = json.loads(variable.val)
+                except (TypeError, ValueError):
+                    continue
+                if isinstance(entry, dict) and self._expired(entry):
+                    session.delete(variable)
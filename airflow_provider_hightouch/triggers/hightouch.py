@@ -0,0 +1,173 @@
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+from airflow.triggers.base import BaseTrigger, TriggerEvent
+
+from airflow_provider_hightouch import metrics, utils
+from airflow_provider_hightouch.consts import (
+    DEFAULT_POLL_INTERVAL,
+    PENDING_STATUSES,
+    TERMINAL_STATUSES,
+)
+from airflow_provider_hightouch.hooks.hightouch import AsyncHightouchHook
+from airflow_provider_hightouch.polling import (
+    FixedPollStrategy,
+    PollStrategy,
+    deserialize_poll_strategy,
+)
+
+
+class HightouchSyncTrigger(BaseTrigger):
+    """
+    Trigger that polls a Hightouch sync run on the triggerer until it reaches
+    a terminal status.
+
+    Fires a single event whose ``status`` is ``success``, ``error`` or ``timeout``
+    and whose ``sync_run_details`` holds the last run returned by the API.
+
+    :param sync_id: ID of the sync that the sync run belongs to
+    :param sync_run_id: ID of the sync run to poll
+    :param connection_id: Name of the connection to use, defaults to hightouch_default
+    :param error_on_warning: Should sync warnings be treated as errors or ignored?
+    :param poll_interval: Time to wait in between subsequent polls to the API.
+    :param end_time: Unix timestamp after which the trigger gives up waiting.
+    :param poll_strategy: Serialized :py:class:`~PollStrategy` deciding the wait between
+        polls, as returned by ``PollStrategy.serialize``. Defaults to ``poll_interval``.
+    :param max_concurrent_requests: Maximum number of requests that the triggers of
+        this connection with the same limit send at once from the triggerer, 100 by
+        default. Triggers with different limits do not share a session.
+    :param cancel_on_timeout: Whether to cancel the sync run when ``end_time`` passes
+    """
+
+    def __init__(
+        self,
+        sync_id: str,
+        sync_run_id: str,
+        connection_id: str = "hightouch_default",
+        error_on_warning: bool = False,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        end_time: Optional[float] = None,
+        poll_strategy: Optional[Tuple[str, Dict[str, Any]]] = None,
+        max_concurrent_requests: Optional[int] = None,
+        cancel_on_timeout: bool = False,
+    ):
+        super().__init__()
+        self.sync_id = sync_id
+        self.sync_run_id = sync_run_id
+        self.hightouch_conn_id = connection_id
+        self.error_on_warning = error_on_warning
+        self.poll_interval = poll_interval
+        self.end_time = end_time
+        self.poll_strategy = poll_strategy
+        self.max_concurrent_requests = max_concurrent_requests
+        self.cancel_on_timeout = cancel_on_timeout
+
+    def serialize(self) -> Tuple[str, Dict[str, Any]]:
+        return (
+            "airflow_provider_hightouch.triggers.hightouch.HightouchSyncTrigger",
+            {
+                "sync_id": self.sync_id,
+                "sync_run_id": self.sync_run_id,
+                "connection_id": self.hightouch_conn_id,
+                "error_on_warning": self.error_on_warning,
+                "poll_interval": self.poll_interval,
+                "end_time": self.end_time,
+                "poll_strategy": self.poll_strategy,
+                "max_concurrent_requests": self.max_concurrent_requests,
+                "cancel_on_timeout": self.cancel_on_timeout,
+            },
+        )
+
+    async def _get_sync_run_details(self, hook: AsyncHightouchHook) -> Dict[str, Any]:
+        return (await hook.get_sync_run_details(self.sync_id, self.sync_run_id))[0]
+
+    def _event(self, status: str, message: str, sync_run_details=None) -> TriggerEvent:
+        return TriggerEvent(
+            {
+                "status": status,
+                "message": message,
+                "sync_id": self.sync_id,
+                "sync_run_id": self.sync_run_id,
+                "sync_run_details": sync_run_details,
+            }
+        )
+
+    def _get_poll_strategy(self) -> PollStrategy:
+        if self.poll_strategy:
+            return deserialize_poll_strategy(self.poll_strategy)
+        return FixedPollStrategy(self.poll_interval)
+
+    async def _cancel(self, hook: AsyncHightouchHook) -> None:
+        try:
+            await hook.cancel_sync_run(self.sync_id, self.sync_run_id)
+        except Exception as e:
+            self.log.warning("Failed to cancel sync run %s: %s", self.sync_run_id, e)
+
+    async def _poll(self, hook: AsyncHightouchHook, poll_strategy: PollStrategy) -> TriggerEvent:
+        polls = 0
+        status = None
+        try:
+            while True:
+                sync_run_details = await self._get_sync_run_details(hook)
+                run = utils.parse_sync_run_details(sync_run_details)
+                polls += 1
+                status = run.status
+                self.log.info(
+                    f"Polling Hightouch Sync {self.sync_id}. Current status: {run.status}. "
+                    f"{100 * run.completion_ratio}% completed."
+                )
+
+                if run.status in TERMINAL_STATUSES:
+                    if utils.is_successful_status(run.status, self.error_on_warning):
+                        return self._event(
+                            "success",
+                            f"Sync request status: {run.status}. Polling complete",
+                            sync_run_details,
+                        )
+                    return self._event(
+                        "error",
+                        f"Sync {self.sync_id} for request: {self.sync_run_id} failed with "
+                        f"status: {run.status} and error:  {run.error}",
+                        sync_run_details,
+                    )
+                if run.status not in PENDING_STATUSES:
+                    self.log.warning(
+                        "Unexpected status: %s returned for sync %s and request %s. Will try "
+                        "again, but if you see this error, please let someone at Hightouch "
+                        "know.",
+                        run.status,
+                        self.sync_id,
+                        self.sync_run_id,
+                    )
+                if self.end_time and time.time() > self.end_time:
+                    if self.cancel_on_timeout:
+                        await self._cancel(hook)
+                    return self._event(
+                        "timeout",
+                        f"Sync {self.sync_id} for request: {self.sync_run_id}' time out. "
+                        f"Last status was {run.status}.",
+                        sync_run_details,
+                    )
+
+                await asyncio.sleep(poll_strategy.next_interval(run))
+        finally:
+            metrics.timing("sync_run.polls", polls, tags={"status": str(status)})
+
+    async def run(self) -> AsyncIterator[TriggerEvent]:
+        """Poll the sync run until it completes, fails or times out."""
+        try:
+            poll_strategy = self._get_poll_strategy()
+            hook_kwargs = {}
+            if self.max_concurrent_requests:
+                hook_kwargs["pool_size"] = self.max_concurrent_requests
+            hook = AsyncHightouchHook(
+                hightouch_conn_id=self.hightouch_conn_id, **hook_kwargs
+            )
+            with metrics.span(
+                "poll_sync", sync_id=self.sync_id, sync_run_id=self.sync_run_id
+            ), metrics.in_flight_runs.track():
+                event = await self._poll(hook, poll_strategy)
+        except Exception as e:
+            event = self._event("error", str(e))
+        yield event
@@ -1,12 +1,12 @@
-from collections import namedtuple
-from typing import Any, Dict, NamedTuple
+import datetime
+from typing import Any, Dict, List, NamedTuple, Optional
 
 
 class HightouchOutput(
     NamedTuple(
         "_HightouchOutput",
         [
-            ("sync_details", Dict[str, Any]),
+            ("sync_details", Optional[Dict[str, Any]]),
             ("sync_run_details", Dict[str, Any]),
         ],
     )
@@ -14,8 +14,9 @@ class HightouchOutput(
     """
     Contains recorded information about the state of a Hightouch sync after a sync completes.
     Attributes:
-        sync_details (Dict[str, Any]):
+        sync_details (Optional[Dict[str, Any]]):
             https://hightouch.io/docs/api-reference/#operation/GetSync
+            None when the poll was asked not to fetch them.
         sync_run_details (Dict[str, Any]):
             https://hightouch.io/docs/api-reference/#operation/ListSyncRuns
         destination_details (Dict[str, Any]):
@@ -23,26 +24,65 @@ class HightouchOutput(
     """
 
 
-SyncRunParsedOutput = namedtuple(
-    "_SyncRunParsedOutput",
-    [
-        "id",
-        "created_at",
-        "started_at",
-        "finished_at",
-        "elapsed_seconds",
-        "planned_add",
-        "planned_change",
-        "planned_remove",
-        "successful_add",
-        "successful_change",
-        "successful_remove",
-        "failed_add",
-        "failed_change",
-        "failed_remove",
-        "query_size",
-        "status",
-        "completion_ratio",
-        "error",
-    ],
-)
+class SyncRunParsedOutput(NamedTuple):
+    """
+    Parsed details of a single sync run, as returned by ``parse_sync_run_details``.
+
+    Instances are immutable tuples, so they are cheap to build and safe to share
+    between threads.
+    """
+
+    id: Optional[str]
+    created_at: Optional[datetime.datetime]
+    started_at: Optional[datetime.datetime]
+    finished_at: Optional[datetime.datetime]
+    elapsed_seconds: Optional[int]
+    planned_add: Optional[int]
+    planned_change: Optional[int]
+    planned_remove: Optional[int]
+    successful_add: Optional[int]
+    successful_change: Optional[int]
+    successful_remove: Optional[int]
+    failed_add: Optional[int]
+    failed_change: Optional[int]
+    failed_remove: Optional[int]
+    query_size: Optional[int]
+    status: Optional[str]
+    completion_ratio: float
+    error: Optional[str]
+
+
+class SyncRunHistory(NamedTuple):
+    """
+    Summary of the recent completed runs of a sync, as returned by
+    ``summarize_sync_runs``.
+
+    Attributes:
+        durations (List[float]): Durations in seconds of the runs, newest first
+        rows_per_second (Optional[float]): Rows synced per second across the runs
+    """
+
+    durations: List[float]
+    rows_per_second: Optional[float]
+
+    def percentile(self, q: float) -> Optional[float]:
+        """The ``q``-th percentile (0-100) of the run durations, or None without runs."""
+        if not self.durations:
+            return None
+        ordered = sorted(self.durations)
+        position = (len(ordered) - 1) * q / 100
+        lower = int(position)
+        upper = min(lower + 1, len(ordered) - 1)
+        return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+    @property
+    def expected_duration(self) -> Optional[float]:
+        """The median duration of the runs."""
+        return self.percentile(50)
+
+    def suggested_timeout(self, factor: float = 3, minimum: float = 60) -> Optional[float]:
+        """A timeout that healthy runs should not reach: ``factor`` times the p90 duration."""
+        p90 = self.percentile(90)
+        if p90 is None:
+            return None
+        return max(p90 * factor, minimum)
@@ -1,46 +1,58 @@
-from typing import Type
+import datetime
+from typing import Any, Dict, Iterable, Optional, Tuple
 
-from dateutil import parser
+from .consts import SUCCESS, WARNING
+from .types import SyncRunHistory, SyncRunParsedOutput
 
-from .types import SyncRunParsedOutput
 
+def parse_datetime(value: Optional[str]) -> Optional[datetime.datetime]:
+    """Parses an ISO-8601 timestamp from the API, falling back to dateutil."""
+    if not value:
+        return None
+    try:
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        from dateutil import parser
 
-def parse_sync_run_details(sync_run_details) -> Type[SyncRunParsedOutput]:
-    x = SyncRunParsedOutput
+        return parser.parse(value)
 
-    x.created_at = None
-    x.started_at = None
-    x.finished_at = None
-    x.id = sync_run_details.get("id")
 
-    if sync_run_details.get("createdAt"):
-        x.created_at = parser.parse(sync_run_details["createdAt"])
-    if sync_run_details.get("startedAt"):
-        x.started_at = parser.parse(sync_run_details["startedAt"])
-    if sync_run_details.get("finishedAt"):
-        x.finished_at = parser.parse(sync_run_details["finishedAt"])
+def parse_sync_run_details(sync_run_details: Dict[str, Any]) -> SyncRunParsedOutput:
+    get = sync_run_details.get
+    created_at = parse_datetime(get("createdAt"))
+    started_at = parse_datetime(get("startedAt"))
+    finished_at = parse_datetime(get("finishedAt"))
 
-    if x.finished_at and x.started_at:
-        x.elapsed_seconds = (x.finished_at - x.started_at).seconds
+    elapsed_seconds = None
+    if finished_at and started_at:
+        elapsed_seconds = (finished_at - started_at).seconds
 
-    x.planned_add = sync_run_details["plannedRows"].get("addedCount")
-    x.planned_change = sync_run_details["plannedRows"].get("changedCount")
-    x.planned_remove = sync_run_details["plannedRows"].get("removedCount")
+    planned = sync_run_details["plannedRows"]
+    successful = sync_run_details["successfulRows"]
+    failed = sync_run_details["failedRows"]
 
-    x.successful_add = sync_run_details["successfulRows"].get("addedCount")
-    x.successful_change = sync_run_details["successfulRows"].get("changedCount")
-    x.successful_remove = sync_run_details["successfulRows"].get("removedCount")
-
-    x.failed_add = sync_run_details["failedRows"].get("addedCount")
-    x.failed_change = sync_run_details["failedRows"].get("changedCount")
-    x.failed_remove = sync_run_details["failedRows"].get("removedCount")
-
-    x.query_size = sync_run_details.get("querySize")
-    x.status = sync_run_details.get("status")
-    x.completion_ratio = float(sync_run_details.get("completionRatio", 0))
-    x.error = sync_run_details.get("error")
-
-    return x
+    return SyncRunParsedOutput(
+        get("id"),
+        created_at,
+        started_at,
+        finished_at,
+        elapsed_seconds,
+        planned.get("addedCount"),
+        planned.get("changedCount"),
+        planned.get("removedCount"),
+        successful.get("addedCount"),
+        successful.get("changedCount"),
+        successful.get("removedCount"),
+        failed.get("addedCount"),
+        failed.get("changedCount"),
+        failed.get("removedCount"),
+        get("querySize"),
+        get("status"),
+        float(get("completionRatio", 0)),
+        get("error"),
+    )
 
 
 def generate_metadata_from_parsed_run(parsed_output: SyncRunParsedOutput):
@@ -57,3 +69,50 @@ def generate_metadata_from_parsed_run(parsed_output: SyncRunParsedOutput):
         "failed_remove": parsed_output.failed_remove,
         "query_size": parsed_output.query_size,
     }
+
+
+def is_successful_status(status: str, fail_on_warning: bool = False) -> bool:
+    """Whether a terminal sync run status counts as a successful run."""
+    return status == SUCCESS or (status == WARNING and not fail_on_warning)
+
+
+def sync_run_progress(parsed_output: SyncRunParsedOutput) -> Tuple[Any, ...]:
+    """The parts of a sync run that change as it progresses, to detect new snapshots."""
+    return (
+        parsed_output.status,
+        parsed_output.completion_ratio,
+        parsed_output.successful_add,
+        parsed_output.successful_change,
+        parsed_output.successful_remove,
+        parsed_output.failed_add,
+        parsed_output.failed_change,
+        parsed_output.failed_remove,
+        parsed_output.planned_add,
+        parsed_output.planned_change,
+        parsed_output.planned_remove,
+        parsed_output.error,
+    )
+
+
+def summarize_sync_runs(runs: Iterable[SyncRunParsedOutput]) -> SyncRunHistory:
+    """Summarizes the durations and throughput of the successful runs among ``runs``."""
+    durations = []
+    rows = 0
+    for run in runs:
+        if not is_successful_status(run.status) or not (run.started_at and run.finished_at):
+            continue
+        durations.append((run.finished_at - run.started_at).total_seconds())
+        rows += sum(
+            count or 0
+            for count in (
+                run.successful_add,
+                run.successful_change,
+                run.successful_remove,
+                run.failed_add,
+                run.failed_change,
+                run.failed_remove,
+            )
+        )
+    total_seconds = sum(durations)
+    rows_per_second = rows / total_seconds if total_seconds > 0 else None
+    return SyncRunHistory(durations, rows_per_second)
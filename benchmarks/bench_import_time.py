@@ -0,0 +1,65 @@
+"""
+Import-time benchmark for the operator and sensor modules.
+
+Imports the modules a DAG file would in fresh interpreters, and reports the time
+and number of modules the import adds on top of Airflow itself, which every DAG
+file pays for anyway. Then runs a task's first hook creation to show what moved
+from parse time to run time.
+
+Run:
+
+    python3 -m benchmarks.bench_import_time --repeat 10
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+BASELINE = (
+    "import airflow.models, airflow.sensors.base, airflow.triggers.base, "
+    "airflow.utils.decorators"
+)
+
+SCENARIOS = {
+    "operators + sensors (parse)": (
+        "import airflow_provider_hightouch.operators.hightouch\n"
+        "import airflow_provider_hightouch.sensors.hightouch"
+    ),
+    "hook (first execute)": "import airflow_provider_hightouch.hooks.hightouch",
+}
+
+
+def measure(statement):
+    script = (
+        "import json, sys, time, warnings\n"
+        "warnings.simplefilter('ignore')\n"
+        f"{BASELINE}\n"
+        "before = set(sys.modules)\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = time.perf_counter() - start\n"
+        "print(json.dumps([elapsed, len(set(sys.modules) - before)]))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--repeat", type=int, default=10)
+    args = arg_parser.parse_args()
+
+    print(f"Median of {args.repeat} fresh interpreters, on top of importing Airflow")
+    for name, statement in SCENARIOS.items():
+        results = [measure(statement) for _ in range(args.repeat)]
+        seconds = statistics.median(elapsed for elapsed, _ in results)
+        modules = results[-1][1]
+        print(f"{name:<30} {seconds * 1e3:8.1f} ms {modules:6d} modules")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Micro-benchmark for ``parse_sync_run_details``.
+
+Parses a batch of sync run payloads and reports the cost per call, next to the
+cost of the three ``dateutil`` parses the previous implementation made per run.
+
+Run:
+
+    python3 -m benchmarks.bench_parse_sync_run_details --runs 10000
+"""
+
+import argparse
+import timeit
+import tracemalloc
+
+from dateutil import parser
+
+from airflow_provider_hightouch.utils import parse_sync_run_details
+
+
+def make_payloads(count):
+    return [
+        {
+            "id": str(i),
+            "createdAt": "2022-02-08T16:11:04.712Z",
+            "startedAt": "2022-02-08T16:11:05.001Z",
+            "finishedAt": "2022-02-08T16:11:11.698Z",
+            "querySize": 773,
+            "status": "success",
+            "completionRatio": 1,
+            "plannedRows": {"addedCount": i, "changedCount": 0, "removedCount": 0},
+            "successfulRows": {"addedCount": i, "changedCount": 0, "removedCount": 0},
+            "failedRows": {"addedCount": 0, "changedCount": 0, "removedCount": 0},
+            "error": None,
+        }
+        for i in range(count)
+    ]
+
+
+def parse_all(payloads):
+    return [parse_sync_run_details(payload) for payload in payloads]
+
+
+def dateutil_only(payloads):
+    for payload in payloads:
+        parser.parse(payload["createdAt"])
+        parser.parse(payload["startedAt"])
+        parser.parse(payload["finishedAt"])
+
+
+def report(name, seconds, count):
+    print(f"{name:<28} {seconds / count * 1e6:8.2f} us/run")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--runs", type=int, default=10000)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    payloads = make_payloads(args.runs)
+    print(f"Parsing {args.runs} sync run payloads, best of {args.repeat}")
+    report(
+        "parse_sync_run_details",
+        min(timeit.repeat(lambda: parse_all(payloads), number=1, repeat=args.repeat)),
+        args.runs,
+    )
+    report(
+        "dateutil timestamps only",
+        min(timeit.repeat(lambda: dateutil_only(payloads), number=1, repeat=args.repeat)),
+        args.runs,
+    )
+
+    tracemalloc.start()
+    parsed = parse_all(payloads)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{'memory per parsed run':<28} {current / len(parsed):8.0f} bytes (peak {peak} B)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+"""
+Local stand-in for the Hightouch API used by the benchmarks.
+
+Serves the endpoints the provider calls (trigger, sync details, slug lookup,
+sync and run listings) from memory. Runs progress through a scripted list of
+statuses over time, and responses can be delayed or replaced with injected
+429 and 5xx errors. Every request is counted so scenarios can report how many
+API calls they made.
+"""
+
+import json
+import os
+import random
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import count
+from urllib.parse import parse_qs, urlparse
+
+DEFAULT_PROGRESSION = ["queued", "querying", "processing", "reporting", "success"]
+
+
+class MockHightouchAPI:
+    """
+    Args:
+        num_syncs (int): Number of syncs in the mock workspace, with IDs ``1..num_syncs``
+            and slugs ``sync-<id>``
+        latency (float): Seconds added to every response
+        rate_limit_ratio (float): Fraction of requests answered with 429
+        server_error_ratio (float): Fraction of requests answered with 503
+        retry_after (int): ``Retry-After`` seconds sent with injected 429 responses
+        progression (list): Statuses every run goes through, ending with a terminal one
+        step_seconds (float): Seconds a run spends in each status
+        seed (int): Seed for error injection, so runs are reproducible
+    """
+
+    def __init__(
+        self,
+        num_syncs=1000,
+        latency=0.0,
+        rate_limit_ratio=0.0,
+        server_error_ratio=0.0,
+        retry_after=0,
+        progression=None,
+        step_seconds=0.05,
+        seed=0,
+    ):
+        self.num_syncs = num_syncs
+        self.latency = latency
+        self.rate_limit_ratio = rate_limit_ratio
+        self.server_error_ratio = server_error_ratio
+        self.retry_after = retry_after
+        self.progression = progression or DEFAULT_PROGRESSION
+        self.step_seconds = step_seconds
+        self.calls = Counter()
+        self._random = random.Random(seed)
+        self._run_ids = count(1)
+        self._runs = {}
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def total_calls(self):
+        return sum(self.calls.values())
+
+    @property
+    def port(self):
+        return self._server.server_address[1]
+
+    @property
+    def connection(self):
+        """Airflow connection JSON pointing at this server."""
+        return json.dumps(
+            {"conn_type": "http", "host": "127.0.0.1", "port": self.port, "password": "key"}
+        )
+
+    def start(self):
+        api = self
+
+        class Handler(_Handler):
+            mock_api = api
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    @contextmanager
+    def serving(self, conn_id="hightouch_default"):
+        """Starts the server and points ``conn_id`` at it for the duration."""
+        self.start()
+        env_var = f"AIRFLOW_CONN_{conn_id.upper()}"
+        previous = os.environ.get(env_var)
+        os.environ[env_var] = self.connection
+        try:
+            yield self
+        finally:
+            if previous is None:
+                os.environ.pop(env_var, None)
+            else:
+                os.environ[env_var] = previous
+            self.stop()
+
+    def sync(self, sync_id):
+        return {
+            "id": str(sync_id),
+            "slug": f"sync-{sync_id}",
+            "workspaceId": "1",
+            "destinationId": str(int(sync_id) % 10),
+            "modelId": str(int(sync_id) % 7),
+            "configuration": {"mode": "upsert", "mappings": []},
+            "schedule": None,
+            "disabled": False,
+        }
+
+    def trigger(self, sync_id):
+        with self._lock:
+            run_id = str(next(self._run_ids))
+            self._runs[run_id] = (str(sync_id), time.time())
+        return run_id
+
+    def run(self, run_id):
+        sync_id, created = self._runs[run_id]
+        steps = len(self.progression) - 1
+        step = min(int((time.time() - created) / self.step_seconds), steps)
+        status = self.progression[step]
+        created_at = time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime(created))
+        finished = step == steps
+        return {
+            "id": run_id,
+            "createdAt": created_at,
+            "startedAt": created_at,
+            "finishedAt": (
+                time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime()) if finished else None
+            ),
+            "querySize": 1000,
+            "status": status,
+            "completionRatio": step / steps,
+            "plannedRows": {"addedCount": 1000, "changedCount": 0, "removedCount": 0},
+            "successfulRows": {
+                "addedCount": 1000 * step // steps,
+                "changedCount": 0,
+                "removedCount": 0,
+            },
+            "failedRows": {"addedCount": 0, "changedCount": 0, "removedCount": 0},
+            "error": None,
+        }
+
+    def runs_for_sync(self, sync_id):
+        with self._lock:
+            run_ids = [r for r, (s, _) in self._runs.items() if s == str(sync_id)]
+        return [self.run(run_id) for run_id in reversed(run_ids)]
+
+    def injected_error(self):
+        with self._lock:
+            draw = self._random.random()
+        if draw < self.rate_limit_ratio:
+            return 429
+        if draw < self.rate_limit_ratio + self.server_error_ratio:
+            return 503
+        return None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without this, Nagle's algorithm and
+    # delayed ACKs add ~40ms to every keep-alive response.
+    disable_nagle_algorithm = True
+    mock_api = None
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body=None, headers=None):
+        payload = json.dumps(body if body is not None else {}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _handle(self, method):
+        api = self.mock_api
+        url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        if method == "POST":
+            length = int(self.headers.get("Content-Length") or 0)
+            query.update({k: v[0] for k, v in parse_qs(self.rfile.read(length).decode()).items()})
+        path = url.path[len("/api/v1/") :] if url.path.startswith("/api/v1/") else None
+
+        route = re.sub(r"/\d+", "/{id}", path or url.path)
+        api.calls[(method, route)] += 1
+        if api.latency:
+            time.sleep(api.latency)
+
+        error = api.injected_error()
+        if error == 429:
+            return self._send(
+                429, {"message": "rate limited"}, {"Retry-After": str(api.retry_after)}
+            )
+        if error:
+            return self._send(error, {"message": "unavailable"})
+
+        if method == "POST" and path == "syncs/trigger":
+            sync_id = query.get("syncId") or query["syncSlug"].rsplit("-", 1)[-1]
+            return self._send(200, {"id": api.trigger(sync_id)})
+        if method == "GET" and path == "syncs":
+            if "slug" in query:
+                return self._send(200, {"data": [api.sync(query["slug"].rsplit("-", 1)[-1])]})
+            offset, limit = int(query.get("offset", 0)), int(query.get("limit", 100))
+            ids = range(offset + 1, min(offset + limit, api.num_syncs) + 1)
+            return self._send(200, {"data": [api.sync(i) for i in ids]})
+
+        match = re.fullmatch(r"syncs/(\d+)(/runs)?", path or "")
+        if method == "GET" and match:
+            sync_id, runs = match.groups()
+            if not runs:
+                return self._send(200, api.sync(sync_id))
+            if "runId" in query:
+                return self._send(200, {"data": [api.run(query["runId"])]})
+            limit = int(query.get("limit", 100))
+            return self._send(200, {"data": api.runs_for_sync(sync_id)[:limit]})
+
+        return self._send(404, {"message": "not found"})
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
@@ -0,0 +1,136 @@
+"""
+Load scenarios for the Hightouch provider against a local mock API.
+
+Each scenario runs real hooks, operators or sensors against
+``benchmarks.mock_api.MockHightouchAPI`` and reports the number of API calls,
+wall time, CPU time and peak traced memory, so changes to polling and
+connection handling can be compared between versions.
+
+Run:
+
+    python3 -m benchmarks.run_scenarios
+    python3 -m benchmarks.run_scenarios --scenario sensors --latency 0.01 --json
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+
+from airflow_provider_hightouch.hooks.hightouch import HightouchHook
+from airflow_provider_hightouch.operators.hightouch import HightouchTriggerSyncsOperator
+from airflow_provider_hightouch.sensors.hightouch import HightouchSyncRunSensor
+from benchmarks.mock_api import MockHightouchAPI
+
+POLL_INTERVAL = 0.02
+SENSOR_POKE_INTERVAL = 0.5
+
+
+def single_sync(api):
+    HightouchHook(request_retry_delay=0.01).sync_and_poll(
+        sync_id="1", poll_interval=POLL_INTERVAL, poll_timeout=60
+    )
+
+
+def concurrent_syncs(api, count=100):
+    HightouchTriggerSyncsOperator(
+        task_id="bench",
+        sync_ids=[str(i) for i in range(1, count + 1)],
+        wait_seconds=POLL_INTERVAL,
+        timeout=120,
+    ).execute(context={})
+
+
+def sensors(api, count=1000, syncs=10, multiplex=True):
+    hook = HightouchHook(request_retry_delay=0.01)
+    watched = []
+    for i in range(count):
+        sync_id = str(i % syncs + 1)
+        watched.append((sync_id, hook.start_sync(sync_id=sync_id)))
+
+    pending = [
+        HightouchSyncRunSensor(
+            task_id=f"sensor_{i}",
+            sync_id=sync_id,
+            sync_run_id=run_id,
+            multiplex=multiplex,
+            poke_interval=SENSOR_POKE_INTERVAL,
+        )
+        for i, (sync_id, run_id) in enumerate(watched)
+    ]
+    while pending:
+        pending = [sensor for sensor in pending if not sensor.poke(context={})]
+        if pending:
+            time.sleep(SENSOR_POKE_INTERVAL)
+
+
+def sensors_without_multiplexing(api, count=1000, syncs=10):
+    sensors(api, count=count, syncs=syncs, multiplex=False)
+
+
+SCENARIOS = {
+    "single_sync": single_sync,
+    "concurrent_syncs": concurrent_syncs,
+    "sensors": sensors,
+    "sensors_without_multiplexing": sensors_without_multiplexing,
+}
+
+
+def run_scenario(name, trace_memory=True, **api_kwargs):
+    api = MockHightouchAPI(**api_kwargs)
+    peak = 0
+    with api.serving():
+        if trace_memory:
+            tracemalloc.start()
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        SCENARIOS[name](api)
+        wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+        if trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+    return {
+        "scenario": name,
+        "api_calls": api.total_calls,
+        "calls_by_route": {f"{m} {r}": n for (m, r), n in sorted(api.calls.items())},
+        "wall_seconds": round(wall, 3),
+        "cpu_seconds": round(cpu, 3),
+        "peak_memory_mb": round(peak / 2 ** 20, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), action="append")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--rate-limit-ratio", type=float, default=0.0)
+    parser.add_argument("--server-error-ratio", type=float, default=0.0)
+    parser.add_argument("--step-seconds", type=float, default=0.1)
+    parser.add_argument(
+        "--skip-memory",
+        action="store_true",
+        help="Do not trace memory; tracing slows down CPU-heavy scenarios",
+    )
+    parser.add_argument("--json", action="store_true", help="Print one JSON line per scenario")
+    args = parser.parse_args()
+
+    for name in args.scenario or sorted(SCENARIOS):
+        result = run_scenario(
+            name,
+            trace_memory=not args.skip_memory,
+            latency=args.latency,
+            rate_limit_ratio=args.rate_limit_ratio,
+            server_error_ratio=args.server_error_ratio,
+            step_seconds=args.step_seconds,
+        )
+        if args.json:
+            print(json.dumps(result))
+            continue
+        print(f"{name}")
+        for key in ("api_calls", "wall_seconds", "cpu_seconds", "peak_memory_mb"):
+            print(f"  {key:<16} {result[key]}")
+        for route, calls in result["calls_by_route"].items():
+            print(f"    {route:<24} {calls}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,14 +9,27 @@ Run test:
 
 """
 
+import asyncio
+import datetime
+import json
+import threading
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest import mock
 
 import pytest
 import requests_mock
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 from airflow import AirflowException
 
-from airflow_provider_hightouch.hooks.hightouch import HightouchHook
+from airflow_provider_hightouch.cache import (
+    ResponseCache,
+    SlugCache,
+    default_run_history_cache,
+)
+from airflow_provider_hightouch.hooks.hightouch import AsyncHightouchHook, HightouchHook
+from airflow_provider_hightouch.polling import ExponentialBackoffPollStrategy
 
 
 def sync_details_payload():
@@ -71,6 +84,54 @@ class TestHightouchHook(unittest.TestCase):
         response = hook.get_sync_details(1)
         assert response["status"] == "success"
 
+    @requests_mock.mock()
+    @mock.patch("airflow_provider_hightouch.cache.time.monotonic")
+    def test_response_cache_revalidates_with_etag(self, requests_mock, monotonic):
+        monotonic.return_value = 0
+        details = requests_mock.get(
+            "https://test.hightouch.io/api/v1/syncs/1",
+            [
+                {"json": sync_details_payload(), "headers": {"ETag": '"v1"'}},
+                {"status_code": 304},
+            ],
+        )
+        runs = requests_mock.get(
+            "https://test.hightouch.io/api/v1/syncs/1/runs", json={"data": []}
+        )
+        cache = ResponseCache(ttl=60)
+        hook = HightouchHook(cache_responses=True, response_cache=cache)
+
+        assert hook.get_sync_details(1)["status"] == "success"
+        assert hook.get_sync_details(1)["status"] == "success"
+        assert details.call_count == 1
+
+        monotonic.return_value = 120
+        assert hook.get_sync_details(1)["status"] == "success"
+        assert details.last_request.headers["If-None-Match"] == '"v1"'
+
+        hook.get_sync_run_details(1, 2)
+        hook.get_sync_run_details(1, 2)
+        assert runs.call_count == 2
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["revalidations"]) == (1, 1, 1)
+        assert stats["bytes_saved"] > 0
+
+    @requests_mock.mock()
+    def test_sync_details_use_cache_without_caching_hook(self, requests_mock):
+        details = requests_mock.get(
+            "https://test.hightouch.io/api/v1/syncs/1", json=sync_details_payload()
+        )
+        hook = HightouchHook()
+        with mock.patch(
+            "airflow_provider_hightouch.hooks.hightouch.default_response_cache",
+            ResponseCache(),
+        ):
+            hook.get_sync_details(1, use_cache=True)
+            hook.get_sync_details(1, use_cache=True)
+            assert details.call_count == 1
+            hook.get_sync_details(1)
+        assert details.call_count == 2
+
     @requests_mock.mock()
     def test_hightouch_submit_sync_with_id(self, requests_mock):
         requests_mock.post(
@@ -88,3 +149,482 @@ class TestHightouchHook(unittest.TestCase):
         hook = HightouchHook()
         response = hook.start_sync(sync_slug="boo")
         assert response == "123"
+
+
+class TestAsyncHightouchHook(unittest.TestCase):
+    async def _serve(self, handler):
+        app = web.Application()
+        app.router.add_route("*", "/api/v1/{tail:.*}", handler)
+        server = TestServer(app)
+        await server.start_server()
+        return server
+
+    def _connection_env(self, server):
+        return mock.patch.dict(
+            "os.environ",
+            AIRFLOW_CONN_HIGHTOUCH_DEFAULT=(
+                '{"conn_type": "http", "host": "%s", "port": %d, "password": "key"}'
+                % (server.host, server.port)
+            ),
+        )
+
+    def test_async_hook_shares_session_and_connection(self):
+        requests_seen = []
+
+        async def handler(request):
+            requests_seen.append(request)
+            if request.method == "POST":
+                return web.json_response({"id": "123"})
+            return web.json_response({"data": [{"id": "42", "status": "success"}]})
+
+        async def run():
+            server = await self._serve(handler)
+            try:
+                with self._connection_env(server), mock.patch.object(
+                    AsyncHightouchHook,
+                    "get_connection",
+                    wraps=AsyncHightouchHook.get_connection,
+                ) as get_connection:
+                    first, second = AsyncHightouchHook(), AsyncHightouchHook()
+                    run_id = await first.start_sync(sync_id=100)
+                    runs = await asyncio.gather(
+                        *(second.get_sync_run_details("100", run_id) for _ in range(5))
+                    )
+                    pool = await first._get_pool()
+                    assert pool is await second._get_pool()
+                    assert get_connection.call_count == 1
+                    await AsyncHightouchHook.close_sessions()
+                return run_id, runs
+            finally:
+                await server.close()
+
+        run_id, runs = asyncio.run(run())
+        assert run_id == "123"
+        assert all(r[0]["id"] == "42" for r in runs)
+        assert requests_seen[0].headers["Authorization"] == "Bearer key"
+        assert requests_seen[1].query["runId"] == "123"
+
+    def test_unauthorized_response_keeps_session_of_waiting_requests(self):
+        unauthorized = [True]
+
+        async def handler(request):
+            if request.method == "POST" and unauthorized:
+                unauthorized.pop()
+                return web.json_response({}, status=401)
+            if request.method == "POST":
+                return web.json_response({"id": "123"})
+            return web.json_response({"id": "1"})
+
+        class GatedLimiter:
+            def __init__(self):
+                self.gate = asyncio.Event()
+
+            async def acquire_async(self):
+                await self.gate.wait()
+
+        async def run():
+            server = await self._serve(handler)
+            try:
+                with self._connection_env(server):
+                    limiter = GatedLimiter()
+                    waiting = asyncio.ensure_future(
+                        AsyncHightouchHook(rate_limiter=limiter).get_sync_details(1)
+                    )
+                    await asyncio.sleep(0.05)
+                    # Resolves the connection again, retiring the session shared so far.
+                    run_id = await AsyncHightouchHook().start_sync(sync_id=1)
+                    limiter.gate.set()
+                    details = await waiting
+                    await AsyncHightouchHook.close_sessions()
+                return details, run_id
+            finally:
+                await server.close()
+
+        assert asyncio.run(run()) == ({"id": "1"}, "123")
+
+    def test_async_hook_pools_are_sized_per_limit(self):
+        async def handler(request):
+            return web.json_response({"data": []})
+
+        async def run():
+            server = await self._serve(handler)
+            try:
+                with self._connection_env(server):
+                    small = await AsyncHightouchHook(pool_size=2)._get_pool()
+                    large = await AsyncHightouchHook(pool_size=50)._get_pool()
+                    assert small is await AsyncHightouchHook(pool_size=2)._get_pool()
+                    limits = small.session.connector.limit, large.session.connector.limit
+                    await AsyncHightouchHook.close_sessions()
+                return limits
+            finally:
+                await server.close()
+
+        assert asyncio.run(run()) == (2, 50)
+
+    def test_async_iter_sync_progress(self):
+        def run_payload(status, ratio):
+            return [
+                {
+                    "id": "42",
+                    "status": status,
+                    "completionRatio": ratio,
+                    "plannedRows": {},
+                    "successfulRows": {},
+                    "failedRows": {},
+                }
+            ]
+
+        hook = AsyncHightouchHook()
+        payloads = [
+            run_payload("queued", 0),
+            run_payload("queued", 0),
+            run_payload("processing", 0.5),
+            run_payload("success", 1),
+        ]
+
+        async def run():
+            return [
+                (snapshot.status, snapshot.completion_ratio)
+                async for snapshot in hook.iter_sync_progress("1", "42", poll_interval=0)
+            ]
+
+        with mock.patch.object(
+            hook, "get_sync_run_details", mock.AsyncMock(side_effect=payloads)
+        ):
+            snapshots = asyncio.run(run())
+        assert snapshots == [("queued", 0), ("processing", 0.5), ("success", 1)]
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = json.dumps({"data": [{"id": "42", "status": "success"}]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestHightouchHookConnectionReuse(unittest.TestCase):
+    def test_connection_is_resolved_once(self):
+        with mock.patch.dict(
+            "os.environ",
+            AIRFLOW_CONN_HIGHTOUCH_DEFAULT='{"conn_type": "https", "host": "test.hightouch.io", "schema": "https"}',
+        ), requests_mock.Mocker() as m, mock.patch.object(
+            HightouchHook, "get_connection", wraps=HightouchHook.get_connection
+        ) as get_connection:
+            m.get("https://test.hightouch.io/api/v1/syncs/1/runs", json={"data": []})
+            hook = HightouchHook()
+            for _ in range(3):
+                hook.get_sync_run_details("1", "42")
+        assert get_connection.call_count == 1
+
+    def test_shared_connection_across_hooks(self):
+        HightouchHook.close_shared_connections()
+        with mock.patch.dict(
+            "os.environ",
+            AIRFLOW_CONN_HIGHTOUCH_DEFAULT='{"conn_type": "https", "host": "test.hightouch.io", "schema": "https"}',
+        ), requests_mock.Mocker() as m, mock.patch.object(
+            HightouchHook, "get_connection", wraps=HightouchHook.get_connection
+        ) as get_connection:
+            m.get("https://test.hightouch.io/api/v1/syncs/1/runs", json={"data": []})
+            hooks = [HightouchHook(share_connection=True) for _ in range(3)]
+            for hook in hooks:
+                hook.get_sync_run_details("1", "42")
+            assert hooks[0].get_conn() is hooks[2].get_conn()
+            assert HightouchHook().get_conn() is not hooks[0].get_conn()
+            HightouchHook.close_shared_connections()
+        assert get_connection.call_count == 2
+
+    def test_unauthorized_response_refreshes_connection(self):
+        with mock.patch.dict(
+            "os.environ",
+            AIRFLOW_CONN_HIGHTOUCH_DEFAULT='{"conn_type": "https", "host": "test.hightouch.io", "schema": "https", "password": "new"}',
+        ), requests_mock.Mocker() as m, mock.patch.object(
+            HightouchHook, "get_connection", wraps=HightouchHook.get_connection
+        ) as get_connection:
+            m.get(
+                "https://test.hightouch.io/api/v1/syncs/1",
+                [{"status_code": 401}, {"json": {"id": "1"}}],
+            )
+            hook = HightouchHook()
+            assert hook.get_sync_details("1") == {"id": "1"}
+        assert get_connection.call_count == 2
+        assert m.request_history[-1].headers["Authorization"] == "Bearer new"
+
+    def test_session_reuses_connections(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            with mock.patch.dict(
+                "os.environ",
+                AIRFLOW_CONN_HIGHTOUCH_DEFAULT='{"conn_type": "http", "host": "127.0.0.1", "port": %d}'
+                % server.server_address[1],
+            ):
+                hook = HightouchHook()
+                for _ in range(3):
+                    hook.get_sync_run_details("1", "42")
+                stats = hook.connection_stats
+                hook.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+        assert stats == {"requests": 3, "new_connections": 1, "reused_connections": 2}
+
+
+@mock.patch.dict(
+    "os.environ",
+    AIRFLOW_CONN_HIGHTOUCH_DEFAULT='{ "conn_type": "https", "host": "test.hightouch.io", "schema": "https"}',
+)
+class TestHightouchHookPolling(unittest.TestCase):
+    @requests_mock.mock()
+    @mock.patch("airflow_provider_hightouch.hooks.hightouch.time.sleep")
+    def test_poll_sync_uses_poll_strategy(self, requests_mock, sleep):
+        def run_payload(status):
+            return {
+                "data": [
+                    {
+                        "id": "42",
+                        "status": status,
+                        "completionRatio": 0.5,
+                        "plannedRows": {},
+                        "successfulRows": {},
+                        "failedRows": {},
+                    }
+                ]
+            }
+
+        requests_mock.get(
+            "https://test.hightouch.io/api/v1/syncs/1/runs",
+            [{"json": run_payload("processing")}] * 3
+            + [{"json": run_payload("success")}],
+        )
+        requests_mock.get(
+            "https://test.hightouch.io/api/v1/syncs/1", json=sync_details_payload()
+        )
+        hook = HightouchHook()
+        hook.poll_sync(
+            "1",
+            "42",
+            poll_strategy=ExponentialBackoffPollStrategy(initial_interval=1),
+        )
+        assert [c.args[0] for c in sleep.call_args_list] == [1, 2, 4]
+
+    @requests_mock.mock()
+    @mock.patch("airflow_provider_hightouch.hooks.hightouch.time.sleep")
+    def test_iter_sync_progress_yields_changes_only(self, requests_mock, sleep):
+        def run_payload(status, ratio):
+            return {
+                "data": [
+                    {
+                        "id": "42",
+                        "status": status,
+                        "completionRatio": ratio,
+                        "plannedRows": {"addedCount": 10},
+                        "successfulRows": {"addedCount": int(10 * ratio)},
+                        "failedRows": {},
+                    }
+                ]
+            }
+
+        requests_mock.get(
+            "https://test.hightouch.io/api/v1/syncs/1/runs",
+            [
+                {"json": run_payload("processing", 0)},
+                {"json": run_payload("processing", 0)},
+                {"json": run_payload("processing", 0.5)},
+                {"json": run_payload("processing", 0.5)},
+                {"json": run_payload("failed", 0.5)},
+            ],
+        )
+        hook = HightouchHook()
+        snapshots = list(hook.iter_sync_progress("1", "42", poll_interval=1))
+        assert [(s.status, s.successful_add) for s in snapshots] == [
+            ("processing", 0),
+            ("processing", 5),
+            ("failed", 5),
+        ]
+        assert sleep.call_count == 4
+
+    @requests_mock.mock()
+    @mock.patch("airflow_provider_hightouch.hooks.hightouch.time.sleep")
+    def test_poll_sync_cancels_run_on_timeout(self, requests_mock, sleep):
+        requests_mock.get(
+            "https://test.hightouch.io/api/v1/syncs/1/runs",
+            json={
+                "data": [
+                    {
+                        "id": "42",
+                        "status": "processing",
+                        "plannedRows": {},
+                        "successfulRows": {},
+                        "failedRows": {},
+                    }
+                ]
+            },
+        )
+        cancel = requests_mock.post(
+            "https://test.hightouch.io/api/v1/syncs/1/cancel", json={}
+        )
+        hook = HightouchHook()
+        with pytest.raises(AirflowException, match="time out"):
+            hook.poll_sync("1", "42", poll_timeout=0.000001, cancel_on_timeout=True)
+        assert cancel.call_count == 1
+        assert cancel.last_request.text == "runId=42"
+
+    @requests_mock.mock()
+    def test_get_sync_run_history_is_cached(self, requests_mock):
+        runs = [
+            {
+                "id": str(i),
+                "status": "success",
+                "startedAt": "2022-02-08T16:11:00Z",
+                "finishedAt": f"2022-02-08T16:1{i}:00Z",
+                "plannedRows": {},
+                "successfulRows": {"addedCount": 60 * i},
+                "failedRows": {},
+            }
+            for i in range(1, 4)
+        ]
+        requests_mock.get(
+            "https://test.hightouch.io/api/v1/syncs/7/runs", json={"data": runs}
+        )
+        default_run_history_cache.clear()
+        hook = HightouchHook()
+        history = hook.get_sync_run_history("7", max_runs=3)
+        assert hook.get_sync_run_history("7", max_runs=3) is history
+        assert requests_mock.call_count == 1
+        assert requests_mock.last_request.qs["limit"] == ["3"]
+        assert history.durations == [0, 60, 120]
+        assert history.rows_per_second == 360 / 180
+
+
+@mock.patch.dict(
+    "os.environ",
+    AIRFLOW_CONN_HIGHTOUCH_DEFAULT='{ "conn_type": "https", "host": "test.hightouch.io", "schema": "https"}',
+)
+class TestHightouchHookRetries(unittest.TestCase):
+    @requests_mock.mock()
+    @mock.patch("airflow_provider_hightouch.hooks.hightouch.time.sleep")
+    def test_rate_limited_request_honors_retry_after(self, requests_mock, sleep):
+        requests_mock.get(
+            "https://test.hightouch.io/api/v1/syncs/1",
+            [
+                {"status_code": 429, "headers": {"Retry-After": "7"}},
+                {"status_code": 503},
+                {"json": {"id": "1"}},
+            ],
+        )
+        hook = HightouchHook()
+        assert hook.get_sync_details("1") == {"id": "1"}
+        assert sleep.call_args_list[0].args[0] == 7
+        assert 0.25 <= sleep.call_args_list[1].args[0] <= 1
+
+    @requests_mock.mock()
+    @mock.patch("airflow_provider_hightouch.hooks.hightouch.time.sleep")
+    def test_client_errors_are_not_retried(self, requests_mock, sleep):
+        requests_mock.get("https://test.hightouch.io/api/v1/syncs/1", status_code=404)
+        hook = HightouchHook()
+        with pytest.raises(AirflowException):
+            hook.get_sync_details("1")
+        assert requests_mock.call_count == 1
+        sleep.assert_not_called()
+
+
+@mock.patch.dict(
+    "os.environ",
+    AIRFLOW_CONN_HIGHTOUCH_DEFAULT='{ "conn_type": "https", "host": "test.hightouch.io", "schema": "https"}',
+)
+class TestHightouchHookSlugs(unittest.TestCase):
+    @requests_mock.mock()
+    def test_slug_lookups_are_cached(self, requests_mock):
+        requests_mock.get(
+            "https://test.hightouch.io/api/v1/syncs?slug=testsync",
+            json={"data": [sync_details_payload()]},
+        )
+        hook = HightouchHook(slug_cache=SlugCache())
+        assert hook.get_sync_from_slug("testsync") == "1"
+        assert hook.get_sync_from_slug("testsync") == "1"
+        assert requests_mock.call_count == 1
+
+    @requests_mock.mock()
+    def test_prefetch_sync_slugs_pages_through_syncs(self, requests_mock):
+        syncs = [{"id": str(i), "slug": f"sync-{i}"} for i in range(5)]
+        requests_mock.get(
+            "https://test.hightouch.io/api/v1/syncs",
+            [
+                {"json": {"data": syncs[:2]}},
+                {"json": {"data": syncs[2:4]}},
+                {"json": {"data": syncs[4:]}},
+            ],
+        )
+        cache = SlugCache()
+        hook = HightouchHook(slug_cache=cache)
+        resolved = hook.prefetch_sync_slugs(["sync-1", "sync-3"], page_size=2)
+        assert resolved == {"sync-1": "1", "sync-3": "3"}
+        # The listing stops as soon as every requested slug has been seen.
+        assert requests_mock.call_count == 2
+        assert requests_mock.request_history[1].qs["offset"] == ["2"]
+        assert cache.get("hightouch_default", "sync-2") == "2"
+        assert hook.get_sync_from_slug("sync-0") == "0"
+        assert requests_mock.call_count == 2
+
+    @requests_mock.mock()
+    def test_missing_slug_raises(self, requests_mock):
+        requests_mock.get("https://test.hightouch.io/api/v1/syncs", json={"data": []})
+        hook = HightouchHook(slug_cache=SlugCache())
+        with pytest.raises(AirflowException):
+            hook.get_sync_from_slug("missing")
+
+
+@mock.patch.dict(
+    "os.environ",
+    AIRFLOW_CONN_HIGHTOUCH_DEFAULT='{ "conn_type": "https", "host": "test.hightouch.io", "schema": "https"}',
+)
+class TestHightouchHookListings(unittest.TestCase):
+    @requests_mock.mock()
+    def test_iter_syncs_prefetches_pages_lazily(self, requests_mock):
+        syncs = [{"id": str(i), "slug": f"sync-{i}"} for i in range(5)]
+        requests_mock.get(
+            "https://test.hightouch.io/api/v1/syncs",
+            [
+                {"json": {"data": syncs[:2]}},
+                {"json": {"data": syncs[2:4]}},
+                {"json": {"data": syncs[4:]}},
+            ],
+        )
+        hook = HightouchHook()
+        listing = hook.iter_syncs(params={"modelId": "9"}, page_size=2)
+        assert requests_mock.call_count == 0
+        assert [next(listing)["id"], next(listing)["id"]] == ["0", "1"]
+        assert [s["id"] for s in listing] == ["2", "3", "4"]
+        assert [r.qs["offset"] for r in requests_mock.request_history] == [
+            ["0"],
+            ["2"],
+            ["4"],
+        ]
+        assert requests_mock.last_request.qs["modelid"] == ["9"]
+
+    @requests_mock.mock()
+    def test_iter_sync_runs_parses_runs_since(self, requests_mock):
+        run = {
+            "id": "42",
+            "status": "success",
+            "plannedRows": {},
+            "successfulRows": {"addedCount": 3},
+            "failedRows": {},
+        }
+        requests_mock.get(
+            "https://test.hightouch.io/api/v1/syncs/1/runs", json={"data": [run]}
+        )
+        hook = HightouchHook()
+        since = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+        runs = list(hook.iter_sync_runs("1", since=since, prefetch=False))
+        assert [(r.id, r.successful_add) for r in runs] == [("42", 3)]
+        assert requests_mock.last_request.qs["after"] == ["2024-01-01t00:00:00+00:00"]
@@ -9,12 +9,44 @@ Run test:
 
 """
 
+import datetime
+import os
+import tempfile
 import unittest
+from collections import defaultdict
+from types import SimpleNamespace
 from unittest import mock
 
+import pytest
 import requests_mock
+from airflow import DAG
+from airflow.exceptions import AirflowException, AirflowTaskTimeout, TaskDeferred
 
-from airflow_provider_hightouch.operators.hightouch import HightouchTriggerSyncOperator
+from airflow_provider_hightouch.cache import SlugCache, default_response_cache
+from airflow_provider_hightouch.concurrency import LocalSlotStore, SyncConcurrencyLimiter
+from airflow_provider_hightouch.hooks.hightouch import AsyncHightouchHook, HightouchHook
+from airflow_provider_hightouch.operators.hightouch import (
+    HightouchSyncGraphOperator,
+    HightouchTriggerSyncOperator,
+    HightouchTriggerSyncsOperator,
+)
+from airflow_provider_hightouch.state import RunStateStore, VariableRunStateStore
+from airflow_provider_hightouch.triggers.hightouch import HightouchSyncTrigger
+from airflow_provider_hightouch.types import SyncRunHistory
+
+
+class MemoryRunStateStore(RunStateStore):
+    def __init__(self):
+        self.runs = {}
+
+    def get(self, key):
+        return self.runs.get(key)
+
+    def set(self, key, sync_id, sync_run_id):
+        self.runs[key] = (sync_id, sync_run_id)
+
+    def delete(self, key):
+        self.runs.pop(key, None)
 
 
 @mock.patch.dict(
@@ -22,6 +54,9 @@ from airflow_provider_hightouch.operators.hightouch import HightouchTriggerSyncO
     AIRFLOW_CONN_HIGHTOUCH_DEFAULT="http://https%3A%2F%2Ftest.hightouch.io%2F",
 )
 class TestHightouchOperator(unittest.TestCase):
+    def setUp(self):
+        default_response_cache.clear()
+
     @requests_mock.mock()
     def test_hightouch_operator(self, requests_mock):
         requests_mock.get(
@@ -124,3 +159,669 @@ class TestHightouchOperator(unittest.TestCase):
         operator = HightouchTriggerSyncOperator(task_id="run", sync_id=1)
 
         operator.execute(context={})
+
+    def test_rate_limit_is_passed_to_hooks(self):
+        operator = HightouchTriggerSyncOperator(
+            task_id="run", sync_id="1", rate_limit=5, rate_limit_path=None
+        )
+        syncs = HightouchTriggerSyncsOperator(task_id="runs", sync_ids=["1"], rate_limit=5)
+
+        limiter = operator._get_hook()._rate_limiter
+        assert limiter is not None and limiter.rate == 5
+        assert syncs._get_hook()._rate_limiter is limiter
+        assert syncs._get_async_hook({})._rate_limiter is limiter
+
+    @requests_mock.mock()
+    def test_hightouch_operator_deferrable(self, requests_mock):
+        requests_mock.post(
+            "https://test.hightouch.io/api/v1/syncs/trigger",
+            json={"id": "123"},
+        )
+        operator = HightouchTriggerSyncOperator(
+            task_id="run", sync_id="1", deferrable=True
+        )
+
+        with pytest.raises(TaskDeferred) as deferred:
+            operator.execute(context={})
+
+        trigger = deferred.value.trigger
+        assert isinstance(trigger, HightouchSyncTrigger)
+        assert trigger.sync_id == "1"
+        assert trigger.sync_run_id == "123"
+        assert deferred.value.method_name == "execute_complete"
+
+    @requests_mock.mock()
+    @mock.patch.object(
+        HightouchHook,
+        "get_sync_run_history",
+        return_value=SyncRunHistory([100, 200, 300], 5.0),
+    )
+    def test_hightouch_operator_uses_run_history(self, requests_mock, get_history):
+        requests_mock.post(
+            "https://test.hightouch.io/api/v1/syncs/trigger",
+            json={"id": "123"},
+        )
+        operator = HightouchTriggerSyncOperator(
+            task_id="run",
+            sync_id="1",
+            deferrable=True,
+            timeout="auto",
+            use_run_history=True,
+        )
+
+        with mock.patch("airflow_provider_hightouch.operators.hightouch.time.time", return_value=0):
+            with pytest.raises(TaskDeferred) as deferred:
+                operator.execute(context={})
+
+        trigger = deferred.value.trigger
+        assert trigger.end_time == pytest.approx(280 * 3)
+        classpath, kwargs = trigger.poll_strategy
+        assert classpath.endswith("AdaptivePollStrategy")
+        assert kwargs["historical_durations"] == [100, 200, 300]
+
+    @mock.patch.object(
+        HightouchHook,
+        "get_sync_run_history",
+        return_value=SyncRunHistory([1800, 1800, 1800], None),
+    )
+    def test_run_history_spaces_polls_of_long_syncs(self, get_history):
+        operator = HightouchTriggerSyncOperator(
+            task_id="run", sync_id="1", use_run_history=True
+        )
+
+        _, strategy = operator._plan_polling(HightouchHook(), "1")
+
+        run = mock.Mock(completion_ratio=0.0, started_at=None)
+        assert strategy.next_interval(run) == pytest.approx(900, abs=1)
+
+    @requests_mock.mock()
+    def test_waits_for_slot_with_effective_priority_weight(self, requests_mock):
+        requests_mock.get(
+            "https://test.hightouch.io/api/v1/syncs/1",
+            json={"id": "1", "destinationId": "dest", "modelId": "model"},
+        )
+        limiter = SyncConcurrencyLimiter(max_runs_per_destination=1, store=LocalSlotStore())
+        operator = HightouchTriggerSyncOperator(
+            task_id="run", sync_id="1", concurrency_limiter=limiter, priority_weight=1
+        )
+        ti = mock.MagicMock(
+            dag_id="dag", task_id="run", run_id="manual", map_index=-1, priority_weight=7
+        )
+
+        with mock.patch.object(limiter, "acquire", return_value=0) as acquire:
+            operator._acquire_slot(operator._get_hook(), {"ti": ti}, "1")
+        assert acquire.call_args.kwargs["priority"] == 7
+
+    @requests_mock.mock()
+    def test_hightouch_operator_holds_slot_while_deferred(self, requests_mock):
+        requests_mock.get(
+            "https://test.hightouch.io/api/v1/syncs/1",
+            json={"id": "1", "destinationId": "dest", "modelId": "model"},
+        )
+        requests_mock.post(
+            "https://test.hightouch.io/api/v1/syncs/trigger", json={"id": "123"}
+        )
+        limiter = SyncConcurrencyLimiter(
+            max_runs_per_destination=1, store=LocalSlotStore()
+        )
+        operator = HightouchTriggerSyncOperator(
+            task_id="run", sync_id="1", deferrable=True, concurrency_limiter=limiter
+        )
+
+        with pytest.raises(TaskDeferred), self.assertLogs(operator.log, "WARNING") as logs:
+            operator.execute(context={})
+        assert limiter.store.holders("destination:dest") == 1
+        assert any("VariableSlotStore" in line for line in logs.output)
+
+        operator.execute_complete(
+            context={},
+            event={
+                "status": "success",
+                "message": "done",
+                "sync_id": "1",
+                "sync_run_id": "123",
+                "sync_run_details": {},
+            },
+        )
+        assert limiter.store.holders("destination:dest") == 0
+
+    @requests_mock.mock()
+    def test_hightouch_operator_coalesces_triggers(self, requests_mock):
+        trigger = requests_mock.post(
+            "https://test.hightouch.io/api/v1/syncs/trigger", json={"id": "123"}
+        )
+        cancel = requests_mock.post(
+            "https://test.hightouch.io/api/v1/syncs/1/cancel", json={}
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            operators = [
+                HightouchTriggerSyncOperator(
+                    task_id=f"run_{i}",
+                    sync_id="1",
+                    deferrable=True,
+                    coalesce_window=60,
+                    coalesce_path=os.path.join(tmp, "runs.json"),
+                )
+                for i in range(2)
+            ]
+            for operator in operators:
+                with pytest.raises(TaskDeferred) as deferred:
+                    operator.execute(context={})
+                assert deferred.value.trigger.sync_run_id == "123"
+                # Left to execute_complete, which knows whether others share the run.
+                assert not deferred.value.trigger.cancel_on_timeout
+            assert trigger.call_count == 1
+            starter, follower = operators
+            assert not starter._attached and follower._attached
+
+            timeout = {
+                "status": "timeout",
+                "message": "time out",
+                "sync_id": "1",
+                "sync_run_id": "123",
+                "sync_run_details": {"id": "123"},
+            }
+            starter._sync_run = ("1", "123")
+            starter.on_kill()
+            with pytest.raises(AirflowException):
+                starter.execute_complete(context={}, event=timeout)
+            assert not cancel.called
+
+            with pytest.raises(AirflowException):
+                follower.execute_complete(context={}, event=timeout)
+            assert not cancel.called
+            with pytest.raises(AirflowException):
+                starter.execute_complete(context={}, event=timeout)
+            assert cancel.call_count == 1
+
+    @requests_mock.mock()
+    def test_only_the_task_starting_a_coalesced_run_takes_a_slot(self, requests_mock):
+        requests_mock.get(
+            "https://test.hightouch.io/api/v1/syncs/1",
+            json={"id": "1", "destinationId": "dest", "modelId": "model"},
+        )
+        trigger = requests_mock.post(
+            "https://test.hightouch.io/api/v1/syncs/trigger", json={"id": "123"}
+        )
+        limiter = SyncConcurrencyLimiter(max_runs_per_destination=1, store=LocalSlotStore())
+        with tempfile.TemporaryDirectory() as tmp:
+            operators = [
+                HightouchTriggerSyncOperator(
+                    task_id=f"run_{i}",
+                    sync_id="1",
+                    deferrable=True,
+                    coalesce_window=60,
+                    coalesce_path=os.path.join(tmp, "runs.json"),
+                    concurrency_limiter=limiter,
+                )
+                for i in range(2)
+            ]
+            # The follower would wait forever if it asked for the only slot.
+            with mock.patch(
+                "airflow_provider_hightouch.concurrency.time.sleep",
+                side_effect=AssertionError("waited for a slot"),
+            ):
+                for operator in operators:
+                    with pytest.raises(TaskDeferred) as deferred:
+                        operator.execute(context={})
+                    assert deferred.value.trigger.sync_run_id == "123"
+        assert trigger.call_count == 1
+        assert limiter.store.holders("destination:dest") == 1
+
+    def test_coalesced_runs_are_shared_through_the_database_by_default(self):
+        operator = HightouchTriggerSyncOperator(
+            task_id="run", sync_id="1", coalesce_window=60
+        )
+        assert operator._coalescer().variable_prefix == "hightouch_coalesced_run"
+
+    @requests_mock.mock()
+    def test_hightouch_operator_cancels_unshared_coalesced_run_on_timeout(
+        self, requests_mock
+    ):
+        requests_mock.post(
+            "https://test.hightouch.io/api/v1/syncs/trigger", json={"id": "123"}
+        )
+        requests_mock.get(
+            "https://test.hightouch.io/api/v1/syncs/1/runs",
+            json={"data": sync_run("123", "processing")},
+        )
+        cancel = requests_mock.post(
+            "https://test.hightouch.io/api/v1/syncs/1/cancel", json={}
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            operator = HightouchTriggerSyncOperator(
+                task_id="run",
+                sync_id="1",
+                timeout=0.01,
+                coalesce_window=60,
+                coalesce_path=os.path.join(tmp, "runs.json"),
+            )
+            with pytest.raises(AirflowException, match="time out"):
+                operator.execute(context={})
+        assert cancel.call_count == 1
+
+    def test_hightouch_operator_emits_dataset_on_success(self):
+        operator = HightouchTriggerSyncOperator(
+            task_id="run", sync_slug="orders", deferrable=True, emit_dataset=True
+        )
+        assert operator.dataset.uri == "hightouch://sync/slug/orders"
+        assert operator.outlets == [operator.dataset]
+        templated = HightouchTriggerSyncOperator(
+            task_id="templated", sync_id="{{ params.sync_id }}", emit_dataset=True
+        )
+        assert templated.outlets == []
+
+        outlet_events = defaultdict(SimpleNamespace)
+        operator.execute_complete(
+            context={"outlet_events": outlet_events},
+            event={
+                "status": "success",
+                "message": "done",
+                "sync_id": "1",
+                "sync_run_id": "123",
+                "sync_run_details": {
+                    "id": "123",
+                    "status": "success",
+                    "plannedRows": {"addedCount": 3},
+                    "successfulRows": {"addedCount": 3},
+                    "failedRows": {"addedCount": 0},
+                },
+            },
+        )
+        extra = outlet_events[operator.dataset].extra
+        assert extra["sync_id"] == "1"
+        assert extra["successful_add"] == 3
+
+    def test_hightouch_operator_rejects_request_cap_without_deferral(self):
+        with pytest.raises(AirflowException):
+            HightouchTriggerSyncOperator(
+                task_id="run", sync_id="1", max_concurrent_requests=5
+            )
+
+    def test_hightouch_operator_rejects_unknown_timeout(self):
+        with pytest.raises(AirflowException):
+            HightouchTriggerSyncOperator(task_id="run", sync_id="1", timeout="never")
+
+    def test_hightouch_operator_can_be_mapped(self):
+        with DAG("mapped", start_date=datetime.datetime(2024, 1, 1)):
+            mapped = HightouchTriggerSyncOperator.partial(
+                task_id="run", deferrable=True, max_concurrent_requests=5
+            ).expand(sync_id=["1", "2"])
+        assert mapped.partial_kwargs["max_concurrent_requests"] == 5
+        assert mapped.expand_input.value == {"sync_id": ["1", "2"]}
+        assert "sync_id" in HightouchTriggerSyncOperator.template_fields
+
+    @requests_mock.mock()
+    def test_hightouch_operator_cancels_run_on_kill(self, requests_mock):
+        cancel = requests_mock.post(
+            "https://test.hightouch.io/api/v1/syncs/1/cancel", json={}
+        )
+        operator = HightouchTriggerSyncOperator(task_id="run", sync_id="1")
+        operator.on_kill()
+        assert not cancel.called
+
+        operator._sync_run = ("1", "123")
+        operator.on_kill()
+        assert cancel.last_request.text == "runId=123"
+
+    @requests_mock.mock()
+    def test_hightouch_operator_cancels_run_on_execution_timeout(self, requests_mock):
+        requests_mock.post(
+            "https://test.hightouch.io/api/v1/syncs/trigger", json={"id": "123"}
+        )
+        cancel = requests_mock.post(
+            "https://test.hightouch.io/api/v1/syncs/1/cancel", json={}
+        )
+        store = MemoryRunStateStore()
+        ti = mock.MagicMock(dag_id="dag", task_id="run", run_id="manual", map_index=-1)
+        operator = HightouchTriggerSyncOperator(
+            task_id="run", sync_id="1", reattach_on_retry=True, run_state_store=store
+        )
+
+        # Airflow raises the timeout in execute, then calls on_kill once it has unwound.
+        with mock.patch.object(HightouchHook, "poll_sync", side_effect=AirflowTaskTimeout):
+            with pytest.raises(AirflowTaskTimeout):
+                operator.execute(context={"ti": ti})
+        operator.on_kill()
+
+        assert cancel.call_count == 1
+        assert cancel.last_request.text == "runId=123"
+        assert store.get("dag.run.manual.-1") is None
+
+    def test_run_is_only_remembered_when_reattach_is_enabled(self):
+        ti = mock.MagicMock(dag_id="dag", task_id="run", run_id="manual", map_index=-1)
+        operator = HightouchTriggerSyncOperator(task_id="run", sync_id="1")
+        assert operator._run_state({"ti": ti}) == (None, None)
+
+        operator = HightouchTriggerSyncOperator(
+            task_id="run", sync_id="1", reattach_on_retry=True
+        )
+        store, key = operator._run_state({"ti": ti})
+        assert isinstance(store, VariableRunStateStore)
+        assert key == "dag.run.manual.-1"
+
+    @requests_mock.mock()
+    def test_hightouch_operator_reattaches_to_pending_run(self, requests_mock):
+        trigger = requests_mock.post(
+            "https://test.hightouch.io/api/v1/syncs/trigger", json={"id": "456"}
+        )
+        requests_mock.get(
+            "https://test.hightouch.io/api/v1/syncs/1/runs",
+            [
+                {"json": {"data": [{"id": "123", "status": "processing"}]}},
+                {"json": {"data": [{"id": "123", "status": "failed"}]}},
+            ],
+        )
+        store = MemoryRunStateStore()
+        ti = mock.MagicMock(dag_id="dag", task_id="run", run_id="manual", map_index=-1)
+        store.set("dag.run.manual.-1", "1", "123")
+        operator = HightouchTriggerSyncOperator(
+            task_id="run",
+            sync_id="1",
+            deferrable=True,
+            reattach_on_retry=True,
+            run_state_store=store,
+        )
+
+        with pytest.raises(TaskDeferred) as deferred:
+            operator.execute(context={"ti": ti})
+        assert deferred.value.trigger.sync_run_id == "123"
+        assert not trigger.called
+
+        # The previous run has since failed, so the next try starts a new one.
+        with pytest.raises(TaskDeferred) as deferred:
+            operator.execute(context={"ti": ti})
+        assert deferred.value.trigger.sync_run_id == "456"
+        assert store.get("dag.run.manual.-1") == ("1", "456")
+        ti.xcom_push.assert_called_once_with(key="sync_run_id", value="456")
+
+        operator.execute_complete(
+            context={"ti": ti},
+            event={
+                "status": "success",
+                "message": "done",
+                "sync_id": "1",
+                "sync_run_id": "456",
+                "sync_run_details": {},
+            },
+        )
+        assert store.get("dag.run.manual.-1") is None
+
+    @requests_mock.mock()
+    def test_hightouch_operator_remembers_run_until_it_ends(self, requests_mock):
+        requests_mock.post(
+            "https://test.hightouch.io/api/v1/syncs/trigger", json={"id": "123"}
+        )
+        requests_mock.get(
+            "https://test.hightouch.io/api/v1/syncs/1/runs",
+            [
+                {"status_code": 503},
+                {"status_code": 503},
+                {"status_code": 503},
+                {"status_code": 503},
+                {"json": {"data": [{"id": "123", "status": "failed"}]}},
+            ],
+        )
+        store = MemoryRunStateStore()
+        ti = mock.MagicMock(dag_id="dag", task_id="run", run_id="manual", map_index=-1)
+        operator = HightouchTriggerSyncOperator(
+            task_id="run", sync_id="1", reattach_on_retry=True, run_state_store=store
+        )
+
+        with mock.patch("time.sleep"), pytest.raises(AirflowException, match="retries"):
+            operator.execute(context={"ti": ti})
+        # The API failed, not the run, so a retry can still reattach to it.
+        assert store.get("dag.run.manual.-1") == ("1", "123")
+
+        requests_mock.post(
+            "https://test.hightouch.io/api/v1/syncs/trigger", json={"id": "456"}
+        )
+        requests_mock.get(
+            "https://test.hightouch.io/api/v1/syncs/1/runs",
+            json={"data": sync_run("456", "failed")},
+        )
+        with pytest.raises(AirflowException, match="failed with status"):
+            operator.execute(context={"ti": ti})
+        assert store.get("dag.run.manual.-1") is None
+
+    def test_hightouch_operator_keeps_run_when_trigger_errors(self):
+        store = MemoryRunStateStore()
+        ti = mock.MagicMock(dag_id="dag", task_id="run", run_id="manual", map_index=-1)
+        store.set("dag.run.manual.-1", "1", "123")
+        operator = HightouchTriggerSyncOperator(
+            task_id="run",
+            sync_id="1",
+            deferrable=True,
+            reattach_on_retry=True,
+            run_state_store=store,
+        )
+        event = {
+            "status": "error",
+            "message": "Exceeded max number of retries.",
+            "sync_id": "1",
+            "sync_run_id": "123",
+            "sync_run_details": None,
+        }
+
+        with pytest.raises(AirflowException):
+            operator.execute_complete(context={"ti": ti}, event=event)
+        assert store.get("dag.run.manual.-1") == ("1", "123")
+
+        with pytest.raises(AirflowException):
+            operator.execute_complete(
+                context={"ti": ti}, event={**event, "sync_run_details": {"id": "123"}}
+            )
+        assert store.get("dag.run.manual.-1") is None
+
+    @requests_mock.mock()
+    def test_hightouch_operator_output_modes(self, requests_mock):
+        requests_mock.post(
+            "https://test.hightouch.io/api/v1/syncs/trigger", json={"id": "123"}
+        )
+        requests_mock.get(
+            "https://test.hightouch.io/api/v1/syncs/1/runs",
+            json={
+                "data": [
+                    {
+                        "id": "123",
+                        "status": "success",
+                        "plannedRows": {"addedCount": 3},
+                        "successfulRows": {"addedCount": 3},
+                        "failedRows": {"addedCount": 0},
+                    }
+                ]
+            },
+        )
+        sync_details = requests_mock.get(
+            "https://test.hightouch.io/api/v1/syncs/1", json={"id": "1", "slug": "s"}
+        )
+
+        operator = HightouchTriggerSyncOperator(
+            task_id="run", sync_id="1", output_mode="metrics"
+        )
+        output = operator.execute(context={})
+        assert output["sync_run_id"] == "123"
+        assert output["status"] == "success"
+        assert output["successful_add"] == 3
+        assert not sync_details.called
+
+        operator = HightouchTriggerSyncOperator(
+            task_id="run", sync_id="1", output_mode="full"
+        )
+        output = operator.execute(context={})
+        assert output["sync_details"] == {"id": "1", "slug": "s"}
+        assert output["sync_run_details"]["id"] == "123"
+        assert sync_details.call_count == 1
+
+    def test_hightouch_operator_execute_complete(self):
+        operator = HightouchTriggerSyncOperator(
+            task_id="run", sync_id="1", deferrable=True
+        )
+        event = {
+            "status": "success",
+            "message": "done",
+            "sync_id": "1",
+            "sync_run_id": "123",
+            "sync_run_details": {},
+        }
+        assert operator.execute_complete(context={}, event=event) == "123"
+
+        with pytest.raises(AirflowException):
+            operator.execute_complete(
+                context={}, event={**event, "status": "error", "message": "failed"}
+            )
+
+
+def sync_run(run_id, status, error=None):
+    return [
+        {
+            "id": run_id,
+            "status": status,
+            "completionRatio": 1,
+            "plannedRows": {},
+            "successfulRows": {},
+            "failedRows": {},
+            "error": error,
+        }
+    ]
+
+
+class TestHightouchTriggerSyncsOperator(unittest.TestCase):
+    def _patch_hook(self, statuses):
+        async def start_sync(sync_id=None, sync_slug=None):
+            return f"run-{sync_id or sync_slug}"
+
+        async def get_sync_from_slug(sync_slug):
+            return f"id-{sync_slug}"
+
+        async def get_sync_run_details(sync_id, sync_run_id):
+            return sync_run(sync_run_id, statuses[sync_id].pop(0))
+
+        return mock.patch.multiple(
+            AsyncHightouchHook,
+            start_sync=mock.AsyncMock(side_effect=start_sync),
+            get_sync_from_slug=mock.AsyncMock(side_effect=get_sync_from_slug),
+            get_sync_run_details=mock.AsyncMock(side_effect=get_sync_run_details),
+            cancel_sync_run=mock.AsyncMock(),
+        )
+
+    def test_triggers_and_polls_all_syncs(self):
+        statuses = {"1": ["queued", "success"], "id-slug": ["warning"]}
+        operator = HightouchTriggerSyncsOperator(
+            task_id="run", sync_ids=["1"], sync_slugs=["slug"], wait_seconds=0
+        )
+        ti = mock.MagicMock()
+        with self._patch_hook(statuses):
+            result = operator.execute(context={"ti": ti})
+
+        assert result == {"1": "run-1", "slug": "run-id-slug"}
+        sync_results = ti.xcom_push.call_args.kwargs["value"]
+        assert sync_results["slug"]["status"] == "warning"
+        assert sync_results["slug"]["sync_id"] == "id-slug"
+
+    def test_prefetches_slugs_into_the_given_cache(self):
+        cache = SlugCache()
+        statuses = {"id-a": ["success"], "id-b": ["success"]}
+        operator = HightouchTriggerSyncsOperator(
+            task_id="run", sync_slugs=["a", "b"], wait_seconds=0, slug_cache=cache
+        )
+        with self._patch_hook(statuses), mock.patch.object(
+            HightouchHook, "prefetch_sync_slugs", autospec=True
+        ) as prefetch:
+            operator.execute(context={})
+        prefetch.assert_called_once_with(mock.ANY, ["a", "b"])
+        assert prefetch.call_args.args[0].slug_cache is cache
+        assert operator._get_async_hook({}).slug_cache is cache
+
+    def test_unknown_slug_is_not_triggered(self):
+        operator = HightouchTriggerSyncsOperator(
+            task_id="run", sync_slugs=["missing"], wait_seconds=0
+        )
+        with self._patch_hook({}):
+            AsyncHightouchHook.get_sync_from_slug.side_effect = AirflowException("none")
+            with pytest.raises(AirflowException):
+                operator.execute(context={})
+            AsyncHightouchHook.start_sync.assert_not_awaited()
+
+    def test_fail_fast_stops_on_first_failure(self):
+        statuses = {"1": ["failed"], "2": ["processing", "success"]}
+        operator = HightouchTriggerSyncsOperator(
+            task_id="run", sync_ids=["1", "2"], wait_seconds=0
+        )
+        with self._patch_hook(statuses):
+            with pytest.raises(AirflowException):
+                operator.execute(context={})
+            AsyncHightouchHook.cancel_sync_run.assert_awaited_once_with("2", "run-2")
+        assert statuses["2"] == ["success"]
+
+    def test_fail_fast_cancels_runs_started_with_a_failed_one(self):
+        async def start_sync(sync_id=None, sync_slug=None):
+            if sync_id == "1":
+                raise AirflowException("Sync 1 is disabled")
+            return f"run-{sync_id}"
+
+        operator = HightouchTriggerSyncsOperator(
+            task_id="run", sync_ids=["1", "2", "3"], wait_seconds=0
+        )
+        with self._patch_hook({}):
+            AsyncHightouchHook.start_sync.side_effect = start_sync
+            with pytest.raises(AirflowException, match="Sync 1 is disabled"):
+                operator.execute(context={})
+            cancelled = AsyncHightouchHook.cancel_sync_run.await_args_list
+        assert sorted(c.args for c in cancelled) == [("2", "run-2"), ("3", "run-3")]
+
+    def test_collect_all_waits_for_every_sync(self):
+        statuses = {"1": ["failed"], "2": ["processing", "success"]}
+        operator = HightouchTriggerSyncsOperator(
+            task_id="run",
+            sync_ids=["1", "2"],
+            wait_seconds=0,
+            failure_policy="collect_all",
+        )
+        with self._patch_hook(statuses), pytest.raises(AirflowException) as error:
+            operator.execute(context={})
+        assert statuses["2"] == []
+        assert "1 of 2 syncs failed" in str(error.value)
+
+
+class TestHightouchSyncGraphOperator(unittest.TestCase):
+    _patch_hook = TestHightouchTriggerSyncsOperator._patch_hook
+
+    def test_runs_syncs_after_their_upstreams(self):
+        statuses = {"a": ["processing", "success"], "b": ["success"], "c": ["success"]}
+        operator = HightouchSyncGraphOperator(
+            task_id="graph",
+            sync_graph={"c": ["a", "b"]},
+            max_active_syncs=1,
+            wait_seconds=0,
+        )
+        with self._patch_hook(statuses):
+            result = operator.execute(context={})
+            started = [
+                c.kwargs["sync_id"] for c in AsyncHightouchHook.start_sync.await_args_list
+            ]
+
+        assert started == ["a", "b", "c"]
+        assert result == {"a": "run-a", "b": "run-b", "c": "run-c"}
+
+    def test_skips_downstream_of_failed_sync(self):
+        statuses = {"a": ["failed"], "b": ["processing", "success"], "c": []}
+        operator = HightouchSyncGraphOperator(
+            task_id="graph",
+            sync_graph={"c": ["a"], "b": []},
+            wait_seconds=0,
+            failure_policy="collect_all",
+        )
+        ti = mock.MagicMock()
+        with self._patch_hook(statuses), pytest.raises(AirflowException):
+            operator.execute(context={"ti": ti})
+
+        sync_results = ti.xcom_push.call_args.kwargs["value"]
+        assert sync_results["b"]["status"] == "success"
+        assert sync_results["c"]["status"] == "upstream_failed"
+
+    def test_rejects_cycles(self):
+        with pytest.raises(AirflowException, match="cycle"):
+            HightouchSyncGraphOperator(
+                task_id="graph", sync_graph={"a": ["b"], "b": ["a"]}
+            )
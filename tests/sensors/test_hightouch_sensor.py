@@ -0,0 +1,144 @@
+"""
+Unittest module to test Hightouch Sensor.
+
+Requires the unittest and requests-mock Python libraries.
+
+Run test:
+
+    python3 -m unittest tests.sensors.test_hightouch_sensor.TestHightouchSyncRunSensor
+
+"""
+
+import unittest
+from collections import defaultdict
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+import requests_mock
+from airflow.exceptions import AirflowException, AirflowSensorTimeout, TaskDeferred
+
+from airflow_provider_hightouch.sensors.hightouch import HightouchSyncRunSensor
+from airflow_provider_hightouch.triggers.hightouch import HightouchSyncTrigger
+
+
+def sync_run(run_id, status, error=None):
+    return {
+        "id": run_id,
+        "status": status,
+        "completionRatio": 1,
+        "plannedRows": {},
+        "successfulRows": {},
+        "failedRows": {},
+        "error": error,
+    }
+
+
+@mock.patch.dict(
+    "os.environ",
+    AIRFLOW_CONN_HIGHTOUCH_DEFAULT='{ "conn_type": "https", "host": "test.hightouch.io", "schema": "https"}',
+)
+class TestHightouchSyncRunSensor(unittest.TestCase):
+    @requests_mock.mock()
+    def test_poke(self, requests_mock):
+        requests_mock.get(
+            "https://test.hightouch.io/api/v1/syncs/1/runs",
+            [
+                {"json": {"data": [sync_run("42", "processing")]}},
+                {"json": {"data": [sync_run("42", "success")]}},
+            ],
+        )
+        sensor = HightouchSyncRunSensor(task_id="sensor", sync_id="1", sync_run_id="42")
+        assert sensor.poke(context={}) is False
+        assert sensor.poke(context={}) is True
+
+    @requests_mock.mock()
+    def test_requests_go_through_the_rate_limit(self, requests_mock):
+        requests_mock.get(
+            "https://test.hightouch.io/api/v1/syncs/1/runs",
+            json={"data": [sync_run("42", "success")]},
+        )
+        sensor = HightouchSyncRunSensor(
+            task_id="sensor", sync_id="1", sync_run_id="42", rate_limit=1000
+        )
+        with mock.patch(
+            "airflow_provider_hightouch.ratelimit.TokenBucketRateLimiter.acquire",
+        ) as acquire:
+            assert sensor.poke(context={}) is True
+        assert acquire.called
+
+    @requests_mock.mock()
+    def test_emits_dataset_with_run_metrics(self, requests_mock):
+        requests_mock.get(
+            "https://test.hightouch.io/api/v1/syncs/1/runs",
+            json={"data": [sync_run("42", "success")]},
+        )
+        sensor = HightouchSyncRunSensor(
+            task_id="sensor", sync_id="1", sync_run_id="42", emit_dataset=True
+        )
+        assert [outlet.uri for outlet in sensor.outlets] == ["hightouch://sync/1"]
+
+        outlet_events = defaultdict(SimpleNamespace)
+        assert sensor.poke(context={"outlet_events": outlet_events}) is True
+        extra = outlet_events[sensor.dataset].extra
+        assert extra["sync_run_id"] == "42"
+        assert extra["status"] == "success"
+
+    @requests_mock.mock()
+    def test_multiplexed_sensors_share_requests(self, requests_mock):
+        requests_mock.get(
+            "https://test.hightouch.io/api/v1/syncs/7/runs",
+            json={"data": [sync_run("1", "success"), sync_run("2", "failed", "boom")]},
+        )
+        sensors = [
+            HightouchSyncRunSensor(
+                task_id=f"sensor_{run_id}",
+                sync_id="7",
+                sync_run_id=run_id,
+                multiplex=True,
+                poke_interval=60,
+            )
+            for run_id in ("1", "2")
+        ]
+        for sensor in sensors:
+            sensor._get_multiplexer().register(sensor.sync_id, sensor.sync_run_id)
+
+        assert sensors[0].poke(context={}) is True
+        with pytest.raises(AirflowException):
+            sensors[1].poke(context={})
+        assert requests_mock.call_count == 1
+
+    @requests_mock.mock()
+    def test_deferrable_sensor_defers_to_trigger(self, requests_mock):
+        requests_mock.get(
+            "https://test.hightouch.io/api/v1/syncs/1/runs",
+            json={"data": [sync_run("42", "processing")]},
+        )
+        sensor = HightouchSyncRunSensor(
+            task_id="sensor", sync_id="1", sync_run_id="42", deferrable=True
+        )
+        with pytest.raises(TaskDeferred) as deferred:
+            sensor.execute(context={})
+
+        trigger = deferred.value.trigger
+        assert isinstance(trigger, HightouchSyncTrigger)
+        assert (trigger.sync_id, trigger.sync_run_id) == ("1", "42")
+        assert trigger.poll_interval == sensor.poke_interval
+
+    def test_execute_complete_matches_poke(self):
+        sensor = HightouchSyncRunSensor(
+            task_id="sensor", sync_id="1", sync_run_id="42", error_on_warning=True
+        )
+
+        def event(status, run_status):
+            return {
+                "status": status,
+                "message": "message",
+                "sync_run_details": sync_run("42", run_status),
+            }
+
+        sensor.execute_complete(context={}, event=event("success", "success"))
+        with pytest.raises(AirflowException):
+            sensor.execute_complete(context={}, event=event("error", "warning"))
+        with pytest.raises(AirflowSensorTimeout):
+            sensor.execute_complete(context={}, event=event("timeout", "processing"))
@@ -0,0 +1,81 @@
+"""
+Unittest module to test the Hightouch provider caches.
+
+Run test:
+
+    python3 -m unittest tests.test_cache
+
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from airflow_provider_hightouch.cache import (
+    FileSlugStore,
+    ResponseCache,
+    SlugCache,
+    TTLCache,
+    is_cacheable_endpoint,
+)
+
+
+class TestTTLCache(unittest.TestCase):
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    @mock.patch("airflow_provider_hightouch.cache.time.monotonic")
+    def test_entries_expire(self, monotonic):
+        monotonic.return_value = 0
+        cache = TTLCache(ttl=10)
+        cache.set("a", 1)
+        monotonic.return_value = 11
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+
+class TestSlugCache(unittest.TestCase):
+    def test_keys_by_connection(self):
+        cache = SlugCache()
+        cache.set("conn_a", "slug", "1")
+        assert cache.get("conn_a", "slug") == "1"
+        assert cache.get("conn_b", "slug") is None
+
+    def test_file_store_is_shared(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "slugs.json")
+            SlugCache(store=FileSlugStore(path)).set_many("conn", {"a": "1", "b": "2"})
+            other = SlugCache(store=FileSlugStore(path))
+            assert other.get("conn", "b") == "2"
+            assert other.get("conn", "c") is None
+
+
+class TestResponseCache(unittest.TestCase):
+    def test_only_configuration_endpoints_are_cacheable(self):
+        assert is_cacheable_endpoint("GET", "syncs/1")
+        assert is_cacheable_endpoint("GET", "syncs")
+        assert is_cacheable_endpoint("GET", "models/2")
+        assert not is_cacheable_endpoint("GET", "syncs/1/runs")
+        assert not is_cacheable_endpoint("GET", "syncs/trigger")
+        assert not is_cacheable_endpoint("POST", "syncs/1")
+
+    def test_evicts_least_recently_used(self):
+        cache = ResponseCache(maxsize=1)
+        cache.set("a", 1, {})
+        cache.set("b", 2, {})
+        assert cache.lookup("a") == (False, None, {})
+        assert cache.lookup("b") == (True, 2, {})
+
+    def test_respects_no_store(self):
+        cache = ResponseCache()
+        cache.set("a", 1, {"Cache-Control": "no-store"})
+        assert cache.lookup("a")[1] is None
+        assert cache.misses == 1
@@ -0,0 +1,101 @@
+"""
+Unittest module to test the coalescing of concurrent triggers of a sync.
+
+Run test:
+
+    python3 -m unittest tests.test_coalesce
+
+"""
+
+import os
+import tempfile
+import unittest
+from contextlib import contextmanager
+from unittest import mock
+
+from airflow.models import Variable
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from airflow_provider_hightouch.coalesce import SyncRunCoalescer
+
+
+def make_hook(status="success"):
+    hook = mock.MagicMock()
+    hook.start_sync.side_effect = ["run-1", "run-2"]
+    hook.get_sync_run_details.return_value = [{"status": status}]
+    return hook
+
+
+class TestSyncRunCoalescer(unittest.TestCase):
+    def test_attaches_to_recent_run(self):
+        hook = make_hook()
+        coalescer = SyncRunCoalescer()
+        assert coalescer.start_or_attach(hook, "1", window=60) == ("run-1", False)
+        assert coalescer.start_or_attach(hook, "1", window=60) == ("run-1", True)
+        hook.get_sync_run_details.assert_not_called()
+
+    def test_attaches_to_pending_run_after_window(self):
+        hook = make_hook(status="processing")
+        coalescer = SyncRunCoalescer()
+        coalescer.start_or_attach(hook, "1", window=0)
+        assert coalescer.start_or_attach(hook, "1", window=0) == ("run-1", True)
+        hook.get_sync_run_details.assert_called_once_with("1", "run-1")
+
+    def test_starts_new_run_once_previous_finished(self):
+        hook = make_hook(status="success")
+        coalescer = SyncRunCoalescer()
+        coalescer.start_or_attach(hook, "1", window=0)
+        assert coalescer.start_or_attach(hook, "1", window=0) == ("run-2", False)
+
+    def test_attach_never_starts_a_run(self):
+        hook = make_hook()
+        coalescer = SyncRunCoalescer()
+        assert coalescer.attach(hook, "1", holder="a") is None
+        hook.start_sync.assert_not_called()
+        coalescer.start_or_attach(hook, "1", holder="a")
+        assert coalescer.attach(hook, "1", holder="b") == "run-1"
+        assert coalescer.attached("1", "run-1") == ["b"]
+
+    def test_tracks_attached_callers(self):
+        hook = make_hook()
+        coalescer = SyncRunCoalescer()
+        coalescer.start_or_attach(hook, "1", holder="a")
+        coalescer.start_or_attach(hook, "1", holder="b")
+        assert coalescer.attached("1", "run-1") == ["b"]
+        coalescer.detach("1", "run-1", "b")
+        assert coalescer.attached("1", "run-1") == []
+        assert coalescer.attached("1", "run-0") is None
+
+    def test_runs_are_shared_through_file(self):
+        hook = make_hook()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "runs.json")
+            SyncRunCoalescer(path).start_or_attach(hook, "1")
+            assert SyncRunCoalescer(path).start_or_attach(hook, "1") == ("run-1", True)
+            assert SyncRunCoalescer(path).start_or_attach(hook, "2")[1] is False
+
+    def test_runs_are_shared_through_the_database(self):
+        engine = create_engine("sqlite://")
+        Variable.__table__.create(engine)
+        Session = sessionmaker(bind=engine)
+
+        @contextmanager
+        def create_session():
+            session = Session()
+            try:
+                yield session
+                session.commit()
+            finally:
+                session.close()
+
+        hook = make_hook()
+        with mock.patch("airflow.utils.session.create_session", create_session):
+            coalescer = SyncRunCoalescer(variable_prefix="runs")
+            assert coalescer.start_or_attach(hook, "1", holder="a") == ("run-1", False)
+            other = SyncRunCoalescer(variable_prefix="runs")
+            assert other.start_or_attach(hook, "1", holder="b") == ("run-1", True)
+            assert coalescer.attached("1", "run-1") == ["b"]
+            other.detach("1", "run-1", "b")
+            assert coalescer.attached("1", "run-1") == []
+            assert Variable.get("runs__1", deserialize_json=True)["1"][0] == "run-1"
@@ -0,0 +1,113 @@
+"""
+Unittest module to test the destination and model concurrency limiter.
+
+Run test:
+
+    python3 -m unittest tests.test_concurrency
+
+"""
+
+import datetime
+import os
+import tempfile
+import unittest
+from contextlib import contextmanager
+from unittest import mock
+
+import pytest
+from airflow.exceptions import AirflowException
+from airflow.models import Variable
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from airflow_provider_hightouch.concurrency import (
+    FileSlotStore,
+    LocalSlotStore,
+    SyncConcurrencyLimiter,
+    VariableSlotStore,
+)
+
+SYNC = {"id": "1", "destinationId": "dest", "modelId": "model"}
+
+
+class TestSlotStores(unittest.TestCase):
+    def test_waiters_get_slots_in_priority_order(self):
+        store = LocalSlotStore()
+        limits = {"destination:dest": 1}
+        assert store.try_acquire("first", limits)
+        assert not store.try_acquire("low", limits, priority=1)
+        assert not store.try_acquire("high", limits, priority=5)
+
+        store.release("first")
+        assert not store.try_acquire("low", limits, priority=1)
+        assert store.try_acquire("high", limits, priority=5)
+        assert store.holders("destination:dest") == 1
+
+    def test_takes_every_slot_or_none(self):
+        store = LocalSlotStore()
+        assert store.try_acquire("a", {"model:model": 1})
+        assert not store.try_acquire("b", {"destination:dest": 1, "model:model": 1})
+        assert store.holders("destination:dest") == 0
+
+    def test_expired_leases_are_freed(self):
+        store = LocalSlotStore()
+        assert store.try_acquire("a", {"destination:dest": 1}, lease=-1)
+        assert store.try_acquire("b", {"destination:dest": 1})
+
+    def test_file_store_is_shared_between_instances(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "slots.json")
+            assert FileSlotStore(path).try_acquire("a", {"destination:dest": 1})
+            assert not FileSlotStore(path).try_acquire("b", {"destination:dest": 1})
+            FileSlotStore(path).release("a")
+            assert FileSlotStore(path).try_acquire("b", {"destination:dest": 1})
+
+    def test_variable_store_is_shared_through_the_database(self):
+        engine = create_engine("sqlite://")
+        Variable.__table__.create(engine)
+        Session = sessionmaker(bind=engine)
+
+        @contextmanager
+        def create_session():
+            session = Session()
+            try:
+                yield session
+                session.commit()
+            finally:
+                session.close()
+
+        with mock.patch("airflow.utils.session.create_session", create_session):
+            assert VariableSlotStore().try_acquire("a", {"destination:dest": 1})
+            assert not VariableSlotStore().try_acquire("b", {"destination:dest": 1})
+            VariableSlotStore().release("a")
+            assert VariableSlotStore().try_acquire("b", {"destination:dest": 1})
+            assert VariableSlotStore().holders("destination:dest") == 1
+
+
+class TestSyncConcurrencyLimiter(unittest.TestCase):
+    def test_limits_from_sync_details(self):
+        limiter = SyncConcurrencyLimiter(max_runs_per_destination=2)
+        assert limiter.limits_for(SYNC) == {"destination:dest": 2}
+        assert SyncConcurrencyLimiter().limits_for(SYNC) == {}
+
+    @mock.patch("airflow_provider_hightouch.metrics.Stats")
+    @mock.patch("airflow_provider_hightouch.concurrency.time.sleep")
+    def test_waits_for_a_free_slot(self, sleep, stats):
+        limiter = SyncConcurrencyLimiter(max_runs_per_model=1, store=LocalSlotStore())
+        limiter.acquire("a", SYNC)
+        sleep.side_effect = lambda _: limiter.release("a")
+        waited = limiter.acquire("b", SYNC)
+        assert sleep.call_count == 1
+        assert limiter.store.holders("model:model") == 1
+        # Timers are read as milliseconds unless given a timedelta.
+        stats.timing.assert_called_with(
+            "hightouch.concurrency.wait", datetime.timedelta(seconds=waited), tags={}
+        )
+
+    def test_gives_up_after_timeout(self):
+        limiter = SyncConcurrencyLimiter(
+            max_runs_per_model=1, store=LocalSlotStore(), poll_interval=0
+        )
+        limiter.acquire("a", SYNC)
+        with pytest.raises(AirflowException, match="free slot"):
+            limiter.acquire("b", SYNC, timeout=0)
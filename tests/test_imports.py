@@ -0,0 +1,81 @@
+"""
+Unittest module to bound the modules loaded when DAG files import the provider.
+
+Run test:
+
+    python3 -m unittest tests.test_imports
+
+"""
+
+import json
+import subprocess
+import sys
+import unittest
+
+# Modules a DAG file needs anyway, so they are not charged to the provider.
+AIRFLOW_BASELINE = (
+    "import airflow.models, airflow.sensors.base, airflow.triggers.base, "
+    "airflow.utils.decorators"
+)
+
+# Only needed once a task runs.
+HEAVY_MODULES = [
+    "aiohttp",
+    "asgiref",
+    "dateutil",
+    "opentelemetry",
+    "requests",
+    "airflow.providers.http",
+    "airflow_provider_hightouch.hooks.hightouch",
+    "airflow_provider_hightouch.triggers.hightouch",
+    "airflow_provider_hightouch.multiplexer",
+    "airflow_provider_hightouch.polling",
+]
+
+ALLOWED_PROVIDER_MODULES = {
+    "airflow_provider_hightouch",
+    "airflow_provider_hightouch.consts",
+    "airflow_provider_hightouch.datasets",
+    "airflow_provider_hightouch.metrics",
+    "airflow_provider_hightouch.operators",
+    "airflow_provider_hightouch.operators.hightouch",
+    "airflow_provider_hightouch.sensors",
+    "airflow_provider_hightouch.sensors.hightouch",
+    "airflow_provider_hightouch.state",
+    "airflow_provider_hightouch.types",
+    "airflow_provider_hightouch.utils",
+    "airflow_provider_hightouch.version",
+}
+
+
+def modules_loaded_by(statement):
+    """Modules newly loaded by ``statement`` in a fresh interpreter, after the baseline."""
+    script = (
+        "import json, sys, warnings\n"
+        "warnings.simplefilter('ignore')\n"
+        f"{AIRFLOW_BASELINE}\n"
+        "before = set(sys.modules)\n"
+        f"{statement}\n"
+        "print(json.dumps(sorted(set(sys.modules) - before)))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+class TestImports(unittest.TestCase):
+    def test_operators_and_sensors_import_lazily(self):
+        loaded = modules_loaded_by(
+            "import airflow_provider_hightouch.operators.hightouch\n"
+            "import airflow_provider_hightouch.sensors.hightouch"
+        )
+
+        heavy = [
+            module
+            for module in loaded
+            if any(module == h or module.startswith(h + ".") for h in HEAVY_MODULES)
+        ]
+        assert heavy == []
+        provider = {m for m in loaded if m.startswith("airflow_provider_hightouch")}
+        assert provider <= ALLOWED_PROVIDER_MODULES
@@ -0,0 +1,62 @@
+"""
+Unittest module to test the Hightouch metrics helpers and hook instrumentation.
+
+Run test:
+
+    python3 -m unittest tests.test_metrics
+
+"""
+
+import unittest
+from unittest import mock
+
+import requests_mock
+
+from airflow_provider_hightouch import metrics
+from airflow_provider_hightouch.hooks.hightouch import HightouchHook
+
+
+class TestMetrics(unittest.TestCase):
+    def test_endpoint_tag_hides_ids(self):
+        assert metrics.endpoint_tag("syncs/42/runs") == "syncs/{id}/runs"
+        assert metrics.endpoint_tag("syncs/42") == "syncs/{id}"
+        assert metrics.endpoint_tag("syncs/trigger") == "syncs/trigger"
+        assert metrics.endpoint_tag("syncs?slug=x") == "syncs"
+
+    @mock.patch("airflow_provider_hightouch.metrics.Stats")
+    def test_falls_back_to_untagged_stats(self, stats):
+        stats.incr.side_effect = [TypeError, None]
+        metrics.incr("request.retries", tags={"a": "b"})
+        stats.incr.assert_called_with("hightouch.request.retries", 1)
+
+    @mock.patch("airflow_provider_hightouch.metrics.Stats")
+    def test_in_flight_gauge(self, stats):
+        with metrics.in_flight_runs.track():
+            stats.gauge.assert_called_with("hightouch.sync_runs.in_flight", 1, tags={}, delta=True)
+        stats.gauge.assert_called_with("hightouch.sync_runs.in_flight", -1, tags={}, delta=True)
+
+
+@mock.patch.dict(
+    "os.environ",
+    AIRFLOW_CONN_HIGHTOUCH_DEFAULT='{ "conn_type": "https", "host": "test.hightouch.io", "schema": "https"}',
+)
+class TestHookInstrumentation(unittest.TestCase):
+    @requests_mock.mock()
+    @mock.patch("airflow_provider_hightouch.hooks.hightouch.time.sleep")
+    @mock.patch("airflow_provider_hightouch.metrics.Stats")
+    def test_request_metrics(self, requests_mock, stats, sleep):
+        requests_mock.get(
+            "https://test.hightouch.io/api/v1/syncs/1",
+            [
+                {"status_code": 429, "headers": {"Retry-After": "1"}},
+                {"json": {"id": "1"}},
+            ],
+        )
+        hook = HightouchHook(metric_tags={"dag_id": "dag"})
+        assert hook.get_sync_details("1") == {"id": "1"}
+
+        tags = {"dag_id": "dag", "method": "GET", "endpoint": "syncs/{id}"}
+        statuses = [c.kwargs["tags"]["status"] for c in stats.timing.call_args_list]
+        assert statuses == ["429", "200"]
+        stats.incr.assert_any_call("hightouch.request.rate_limited", 1, tags=tags)
+        stats.incr.assert_any_call("hightouch.request.retries", 1, tags=tags)
@@ -0,0 +1,96 @@
+"""
+Unittest module to test the sync run status multiplexer.
+
+Requires the unittest and requests-mock Python libraries.
+
+Run test:
+
+    python3 -m unittest tests.test_multiplexer
+
+"""
+
+import fcntl
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import requests_mock
+
+from airflow_provider_hightouch.multiplexer import (
+    SyncRunStatusMultiplexer,
+    get_status_multiplexer,
+)
+
+
+def runs(*ids, status="processing"):
+    return {"data": [{"id": run_id, "status": status} for run_id in ids]}
+
+
+@mock.patch.dict(
+    "os.environ",
+    AIRFLOW_CONN_HIGHTOUCH_DEFAULT='{ "conn_type": "https", "host": "test.hightouch.io", "schema": "https"}',
+)
+class TestSyncRunStatusMultiplexer(unittest.TestCase):
+    @requests_mock.mock()
+    def test_one_listing_serves_every_run_of_a_sync(self, requests_mock):
+        requests_mock.get(
+            "https://test.hightouch.io/api/v1/syncs/1/runs", json=runs("10", "11", "12")
+        )
+        multiplexer = SyncRunStatusMultiplexer(refresh_interval=60)
+        for run_id in ("10", "11", "12"):
+            multiplexer.register("1", run_id)
+        details = [multiplexer.get_sync_run_details("1", r) for r in ("10", "11", "12")]
+
+        assert [d["id"] for d in details] == ["10", "11", "12"]
+        assert requests_mock.call_count == 1
+        assert multiplexer.api_calls == 1
+
+    @requests_mock.mock()
+    def test_runs_missing_from_listing_are_fetched_individually(self, requests_mock):
+        requests_mock.get(
+            "https://test.hightouch.io/api/v1/syncs/1/runs?limit=100", json=runs("10")
+        )
+        requests_mock.get(
+            "https://test.hightouch.io/api/v1/syncs/1/runs?runId=5", json=runs("5")
+        )
+        multiplexer = SyncRunStatusMultiplexer(refresh_interval=60)
+        assert multiplexer.get_sync_run_details("1", "5")["id"] == "5"
+        assert multiplexer.api_calls == 2
+
+    @requests_mock.mock()
+    def test_statuses_are_shared_through_a_file(self, requests_mock):
+        requests_mock.get(
+            "https://test.hightouch.io/api/v1/syncs/1/runs", json=runs("10", "11")
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "statuses.json")
+            first = SyncRunStatusMultiplexer(refresh_interval=60, path=path)
+            second = SyncRunStatusMultiplexer(refresh_interval=60, path=path)
+            first.get_sync_run_details("1", "10")
+            assert second.get_sync_run_details("1", "11")["id"] == "11"
+        assert requests_mock.call_count == 1
+
+    @requests_mock.mock()
+    def test_shared_file_is_not_locked_while_fetching(self, requests_mock):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "statuses.json")
+
+            def runs_callback(request, context):
+                # Other sensors can read and write the file meanwhile.
+                with open(path, "a+") as f:
+                    fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return runs("10")
+
+            requests_mock.get(
+                "https://test.hightouch.io/api/v1/syncs/1/runs", json=runs_callback
+            )
+            multiplexer = SyncRunStatusMultiplexer(refresh_interval=60, path=path)
+            assert multiplexer.get_sync_run_details("1", "10")["id"] == "10"
+
+    def test_multiplexers_are_shared_per_refresh_interval(self):
+        fast = get_status_multiplexer("hightouch_default", refresh_interval=5)
+        assert get_status_multiplexer("hightouch_default", refresh_interval=5) is fast
+        slow = get_status_multiplexer("hightouch_default", refresh_interval=60)
+        assert slow is not fast
+        assert slow.refresh_interval == 60
@@ -0,0 +1,63 @@
+"""
+Unittest module to test Hightouch poll strategies.
+
+Run test:
+
+    python3 -m unittest tests.test_polling
+
+"""
+
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from airflow_provider_hightouch.polling import (
+    AdaptivePollStrategy,
+    ExponentialBackoffPollStrategy,
+    FixedPollStrategy,
+    deserialize_poll_strategy,
+)
+
+
+def run(completion_ratio, started_at=None):
+    return SimpleNamespace(completion_ratio=completion_ratio, started_at=started_at)
+
+
+class TestPollStrategies(unittest.TestCase):
+    def test_fixed(self):
+        strategy = FixedPollStrategy(5)
+        assert [strategy.next_interval(run(0)) for _ in range(3)] == [5, 5, 5]
+
+    def test_exponential_backoff_is_capped_and_resets(self):
+        strategy = ExponentialBackoffPollStrategy(
+            initial_interval=1, multiplier=3, max_interval=10
+        )
+        assert [strategy.next_interval(run(0)) for _ in range(4)] == [1, 3, 9, 10]
+        strategy.reset()
+        assert strategy.next_interval(run(0)) == 1
+
+    @mock.patch("airflow_provider_hightouch.polling.time.monotonic")
+    def test_adaptive_uses_completion_rate(self, monotonic):
+        strategy = AdaptivePollStrategy(min_interval=1, max_interval=600)
+        monotonic.return_value = 0
+        strategy.reset()
+        assert strategy.next_interval(run(0.0)) == 1
+        # 20% in 10 seconds leaves ~40 seconds for the remaining 80%.
+        monotonic.return_value = 10
+        assert strategy.next_interval(run(0.2)) == 20
+
+    @mock.patch("airflow_provider_hightouch.polling.time.monotonic")
+    def test_adaptive_uses_run_history(self, monotonic):
+        strategy = AdaptivePollStrategy(
+            min_interval=1, max_interval=600, historical_durations=[100, 120, 400]
+        )
+        monotonic.return_value = 0
+        strategy.reset()
+        monotonic.return_value = 20
+        assert strategy.next_interval(run(0.0)) == 50
+
+    def test_serialize_round_trip(self):
+        strategy = AdaptivePollStrategy(historical_durations=[1, 2], safety_factor=0.3)
+        rebuilt = deserialize_poll_strategy(strategy.serialize())
+        assert isinstance(rebuilt, AdaptivePollStrategy)
+        assert rebuilt.serialize() == strategy.serialize()
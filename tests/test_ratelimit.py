@@ -0,0 +1,53 @@
+"""
+Unittest module to test the Hightouch API rate limiters.
+
+Run test:
+
+    python3 -m unittest tests.test_ratelimit
+
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from airflow_provider_hightouch.ratelimit import (
+    FileTokenBucketRateLimiter,
+    TokenBucketRateLimiter,
+    backoff_delay,
+    get_shared_rate_limiter,
+    retry_after_seconds,
+)
+
+
+class TestRateLimiter(unittest.TestCase):
+    @mock.patch("airflow_provider_hightouch.ratelimit.time.monotonic", return_value=0)
+    def test_token_bucket_reserves_in_order(self, monotonic):
+        limiter = TokenBucketRateLimiter(rate=2, capacity=2)
+        assert [limiter._reserve() for _ in range(4)] == [0, 0, 0.5, 1.0]
+
+    @mock.patch("airflow_provider_hightouch.ratelimit.time.monotonic", return_value=0)
+    def test_penalize_holds_back_callers(self, monotonic):
+        limiter = TokenBucketRateLimiter(rate=10)
+        limiter.penalize(7)
+        assert limiter._reserve() == 7
+
+    def test_file_bucket_is_shared_between_instances(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bucket.json")
+            first = FileTokenBucketRateLimiter(path, rate=0.001, capacity=1)
+            second = FileTokenBucketRateLimiter(path, rate=0.001, capacity=1)
+            assert first._reserve() == 0
+            assert second._reserve() > 100
+
+    def test_shared_limiter_is_reused(self):
+        assert get_shared_rate_limiter("a", 5) is get_shared_rate_limiter("a", 5)
+        assert get_shared_rate_limiter("a", 5) is not get_shared_rate_limiter("b", 5)
+
+    def test_retry_after_and_backoff(self):
+        assert retry_after_seconds({"Retry-After": "12"}) == 12
+        assert retry_after_seconds({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0
+        assert retry_after_seconds({}) is None
+        assert 2 <= backoff_delay(2, base=1, cap=30) <= 4
+        assert backoff_delay(10, base=1, cap=30) <= 30
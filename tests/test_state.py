@@ -0,0 +1,52 @@
+"""
+Unittest module to test the stores that remember sync runs between task tries.
+
+Run test:
+
+    python3 -m unittest tests.test_state
+
+"""
+
+import unittest
+from contextlib import contextmanager
+from unittest import mock
+
+from airflow.models import Variable
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from airflow_provider_hightouch.state import VariableRunStateStore
+
+
+class TestVariableRunStateStore(unittest.TestCase):
+    def setUp(self):
+        engine = create_engine("sqlite://")
+        Variable.__table__.create(engine)
+        Session = sessionmaker(bind=engine)
+
+        @contextmanager
+        def create_session():
+            session = Session()
+            try:
+                yield session
+                session.commit()
+            finally:
+                session.close()
+
+        patcher = mock.patch("airflow.utils.session.create_session", create_session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_saved_runs_expire(self):
+        store = VariableRunStateStore(ttl=60)
+        with mock.patch("airflow_provider_hightouch.state.time.time", return_value=0):
+            store.set("dag.task.run.-1", "1", "123")
+            assert store.get("dag.task.run.-1") == ("1", "123")
+        assert Variable.get("hightouch_run__dag.task.run.-1", deserialize_json=True)
+
+        with mock.patch("airflow_provider_hightouch.state.time.time", return_value=61):
+            assert store.get("dag.task.run.-1") is None
+            # Saving another run deletes the expired one.
+            store.set("dag.task.run2.-1", "1", "456")
+            assert store.get("dag.task.run2.-1") == ("1", "456")
+        assert Variable.get("hightouch_run__dag.task.run.-1", default_var=None) is None
@@ -0,0 +1,70 @@
+"""
+Unittest module to test the Hightouch provider utilities.
+
+Run test:
+
+    python3 -m unittest tests.test_utils
+
+"""
+
+import datetime
+import unittest
+
+from airflow_provider_hightouch.utils import (
+    generate_metadata_from_parsed_run,
+    parse_datetime,
+    parse_sync_run_details,
+    summarize_sync_runs,
+)
+
+
+def sync_run_payload(run_id, added):
+    return {
+        "id": run_id,
+        "createdAt": "2022-02-08T16:11:04.712Z",
+        "startedAt": "2022-02-08T16:11:04.712Z",
+        "finishedAt": "2022-02-08T16:11:11.698Z",
+        "querySize": 773,
+        "status": "success",
+        "completionRatio": 1,
+        "plannedRows": {"addedCount": added, "changedCount": 0, "removedCount": 0},
+        "successfulRows": {"addedCount": added, "changedCount": 0, "removedCount": 0},
+        "failedRows": {"addedCount": 0, "changedCount": 0, "removedCount": 0},
+        "error": None,
+    }
+
+
+class TestParseSyncRunDetails(unittest.TestCase):
+    def test_parse_datetime(self):
+        expected = datetime.datetime(
+            2022, 2, 8, 16, 11, 4, 712000, tzinfo=datetime.timezone.utc
+        )
+        assert parse_datetime("2022-02-08T16:11:04.712Z") == expected
+        # Not ISO-8601, handled by the dateutil fallback.
+        assert parse_datetime("Tue, 08 Feb 2022 16:11:04.712 GMT") == expected
+        assert parse_datetime(None) is None
+
+    def test_each_call_returns_its_own_instance(self):
+        first = parse_sync_run_details(sync_run_payload("1", 10))
+        second = parse_sync_run_details(sync_run_payload("2", 20))
+
+        assert (first.id, first.planned_add) == ("1", 10)
+        assert (second.id, second.planned_add) == ("2", 20)
+        assert first.elapsed_seconds == 6
+        assert first._asdict()["status"] == "success"
+        assert generate_metadata_from_parsed_run(first)["successful_add"] == 10
+
+    def test_summarize_sync_runs(self):
+        failed = parse_sync_run_details({**sync_run_payload("3", 5), "status": "failed"})
+        history = summarize_sync_runs(
+            [
+                parse_sync_run_details(sync_run_payload("1", 10)),
+                parse_sync_run_details(sync_run_payload("2", 20)),
+                failed,
+            ]
+        )
+        assert history.durations == [6.986, 6.986]
+        assert history.rows_per_second == 30 / (2 * 6.986)
+        assert history.expected_duration == 6.986
+        assert history.suggested_timeout() == 60
+        assert summarize_sync_runs([]).suggested_timeout() is None
@@ -0,0 +1,108 @@
+"""
+Unittest module to test Hightouch Trigger.
+
+Requires the unittest Python library.
+
+Run test:
+
+    python3 -m unittest tests.triggers.test_hightouch_trigger.TestHightouchSyncTrigger
+
+"""
+
+import asyncio
+import unittest
+from unittest import mock
+
+from airflow_provider_hightouch.hooks.hightouch import AsyncHightouchHook
+from airflow_provider_hightouch.triggers.hightouch import HightouchSyncTrigger
+
+
+def sync_run_payload(status="success", error=None):
+    return {
+        "id": "42",
+        "startedAt": "2022-02-08T16:11:04.712Z",
+        "createdAt": "2022-02-08T16:11:04.712Z",
+        "finishedAt": "2022-02-08T16:11:11.698Z",
+        "querySize": 773,
+        "status": status,
+        "completionRatio": 1,
+        "plannedRows": {"addedCount": 773, "changedCount": 0, "removedCount": 0},
+        "successfulRows": {"addedCount": 773, "changedCount": 0, "removedCount": 0},
+        "failedRows": {"addedCount": 0, "changedCount": 0, "removedCount": 0},
+        "error": error,
+    }
+
+
+async def collect_events(trigger):
+    return [event async for event in trigger.run()]
+
+
+@mock.patch.dict(
+    "os.environ",
+    AIRFLOW_CONN_HIGHTOUCH_DEFAULT='{ "conn_type": "https", "host": "test.hightouch.io", "schema": "https"}',
+)
+class TestHightouchSyncTrigger(unittest.TestCase):
+    def test_serialize_round_trip(self):
+        trigger = HightouchSyncTrigger(
+            sync_id="1", sync_run_id="42", poll_interval=5, end_time=100.0
+        )
+        classpath, kwargs = trigger.serialize()
+        assert classpath == (
+            "airflow_provider_hightouch.triggers.hightouch.HightouchSyncTrigger"
+        )
+        assert HightouchSyncTrigger(**kwargs).serialize() == (classpath, kwargs)
+
+    def test_trigger_polls_until_terminal(self):
+        trigger = HightouchSyncTrigger(sync_id="1", sync_run_id="42", poll_interval=0)
+        payloads = [sync_run_payload("queued"), sync_run_payload("success")]
+        with mock.patch.object(
+            HightouchSyncTrigger, "_get_sync_run_details", side_effect=payloads
+        ) as get_details:
+            events = asyncio.run(collect_events(trigger))
+
+        assert get_details.call_count == 2
+        assert len(events) == 1
+        assert events[0].payload["status"] == "success"
+        assert events[0].payload["sync_run_id"] == "42"
+
+    def test_trigger_warning_is_error_when_requested(self):
+        trigger = HightouchSyncTrigger(
+            sync_id="1", sync_run_id="42", error_on_warning=True
+        )
+        with mock.patch.object(
+            HightouchSyncTrigger,
+            "_get_sync_run_details",
+            return_value=sync_run_payload("warning", error="oops"),
+        ):
+            events = asyncio.run(collect_events(trigger))
+
+        assert events[0].payload["status"] == "error"
+        assert "oops" in events[0].payload["message"]
+
+    def test_trigger_times_out(self):
+        trigger = HightouchSyncTrigger(sync_id="1", sync_run_id="42", end_time=1.0)
+        with mock.patch.object(
+            HightouchSyncTrigger,
+            "_get_sync_run_details",
+            return_value=sync_run_payload("processing"),
+        ):
+            events = asyncio.run(collect_events(trigger))
+
+        assert events[0].payload["status"] == "timeout"
+        assert "time out" in events[0].payload["message"]
+
+    def test_trigger_cancels_run_on_timeout(self):
+        trigger = HightouchSyncTrigger(
+            sync_id="1", sync_run_id="42", end_time=1.0, cancel_on_timeout=True
+        )
+        with mock.patch.object(
+            HightouchSyncTrigger,
+            "_get_sync_run_details",
+            return_value=sync_run_payload("processing"),
+        ), mock.patch.object(
+            AsyncHightouchHook, "cancel_sync_run", mock.AsyncMock()
+        ) as cancel:
+            events = asyncio.run(collect_events(trigger))
+
+        assert events[0].payload["status"] == "timeout"
+        cancel.assert_awaited_once_with("1", "42")